@@ -1,12 +1,38 @@
 # main.py
 import typer
-from dmforge.interface.cli import deck_build, deck_render
+from dmforge.interface.cli import (
+    cache,
+    deck_art,
+    deck_build,
+    deck_compile,
+    deck_derive,
+    deck_facets,
+    deck_rebuild,
+    deck_render,
+    render_queue,
+)
 
 app = typer.Typer()
 
+# "deck" groups the single-command deck apps
+deck_app = typer.Typer()
+deck_app.command("build")(deck_build.build)
+deck_app.command("facets")(deck_facets.facets)
+deck_app.command("art")(deck_art.art)
+deck_app.command("compile")(deck_compile.compile_corpus)
+deck_app.command("derive")(deck_derive.derive)
+deck_app.command("rebuild")(deck_rebuild.rebuild)
+
+# Job queue commands join the "render" group
+deck_render.app.command("enqueue")(render_queue.enqueue)
+deck_render.app.command("status")(render_queue.status)
+deck_render.app.command("result")(render_queue.result)
+deck_render.app.command("worker")(render_queue.worker)
+
 # Mount subcommands
-app.add_typer(deck_build.app, name="deck")
+app.add_typer(deck_app, name="deck")
 app.add_typer(deck_render.app, name="render")
+app.add_typer(cache.app, name="cache")
 
 if __name__ == "__main__":
     app()
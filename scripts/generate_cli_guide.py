@@ -17,8 +17,19 @@ def generate_cli_help():
     subcommands = [
         (["main.py", "--help"], "Main CLI"),
         (["main.py", "deck", "build", "--help"], "Deck: Build"),
+        (["main.py", "deck", "facets", "--help"], "Deck: Facets"),
+        (["main.py", "deck", "art", "--help"], "Deck: Art"),
+        (["main.py", "deck", "compile", "--help"], "Deck: Compile"),
+        (["main.py", "deck", "derive", "--help"], "Deck: Derive"),
+        (["main.py", "deck", "rebuild", "--help"], "Deck: Rebuild"),
         (["main.py", "render", "render", "--help"], "Render: Render"),
         (["main.py", "render", "validate", "--help"], "Render: Validate"),
+        (["main.py", "render", "enqueue", "--help"], "Render: Enqueue"),
+        (["main.py", "render", "status", "--help"], "Render: Status"),
+        (["main.py", "render", "result", "--help"], "Render: Result"),
+        (["main.py", "render", "worker", "--help"], "Render: Worker"),
+        (["main.py", "cache", "stats", "--help"], "Cache: Stats"),
+        (["main.py", "cache", "prune", "--help"], "Cache: Prune"),
     ]
 
     content_blocks = ["# DMForge CLI Usage Guide\n"]
@@ -0,0 +1,26 @@
+import asyncio
+from pathlib import Path
+
+from dmforge.application.ports.deck_storage import DeckStorage
+from dmforge.application.services.art_pipeline import ArtPipeline
+from dmforge.domain.models import Deck
+
+
+class ArtController:
+    def __init__(self, pipeline: ArtPipeline, storage: DeckStorage):
+        self.pipeline = pipeline
+        self.storage = storage
+
+    def generate_from_file(
+        self, input_path: Path, output_path: Path, overwrite: bool = False
+    ) -> Deck:
+        return asyncio.run(self.agenerate_from_file(input_path, output_path, overwrite))
+
+    async def agenerate_from_file(
+        self, input_path: Path, output_path: Path, overwrite: bool = False
+    ) -> Deck:
+        """Same as `generate_from_file`, for callers already inside an event loop."""
+        deck = await asyncio.to_thread(self.storage.load, input_path)
+        deck = await self.pipeline.run(deck, overwrite=overwrite)
+        await asyncio.to_thread(self.storage.save, deck, output_path)
+        return deck
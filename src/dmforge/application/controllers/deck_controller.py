@@ -1,3 +1,6 @@
+from typing import Optional
+
+from dmforge.application.services.async_adapters import ConcurrencyLimiter
 from dmforge.application.services.deck_builder import DeckBuilder
 from dmforge.domain.models import Deck, DeckOptions
 
@@ -10,10 +13,52 @@ class DeckController:
         """
         Accepts raw dict from CLI, converts to typed DeckOptions, returns Deck.
         """
-        options = DeckOptions(
+        return self.builder.build(self._to_options(options_dict))
+
+    def facet_counts(self, options_dict: dict) -> dict:
+        """
+        Accepts the same raw dict as build_from_cli and returns live filter
+        counts, e.g. {"total": 48, "classes": {"Wizard": 312}, "levels": {3: 48}, ...}.
+        """
+        return self.builder.facet_counts(self._to_options(options_dict)).to_dict()
+
+    @staticmethod
+    def _to_options(options_dict: dict) -> DeckOptions:
+        return DeckOptions(
             name=options_dict.get("name", "Untitled Deck"),
             classes=options_dict.get("classes", []),
             levels=options_dict.get("levels", []),
             schools=options_dict.get("schools", []),
+            search=options_dict.get("search") or "",
+            search_mode=options_dict.get("search_mode", "token"),
+            spells=options_dict.get("spells", []),
+            sort=options_dict.get("sort") or "",
+            offset=options_dict.get("offset", 0),
+            limit=options_dict.get("limit"),
         )
-        return self.builder.build(options)
+
+
+class AsyncDeckController:
+    """
+    Runs deck builds off the event loop. Builds share the builder's caches, so
+    they go through the default thread pool rather than separate processes;
+    the builder must be thread-safe, as BasicDeckBuilder is.
+    """
+
+    def __init__(
+        self,
+        builder: DeckBuilder,
+        concurrency: int = 4,
+        limiter: Optional[ConcurrencyLimiter] = None,
+    ):
+        self.builder = builder
+        self.limiter = limiter or ConcurrencyLimiter(concurrency)
+
+    async def build_from_cli(self, options_dict: dict) -> Deck:
+        options = DeckController._to_options(options_dict)
+        return await self.limiter.run(None, self.builder.build, options)
+
+    async def facet_counts(self, options_dict: dict) -> dict:
+        options = DeckController._to_options(options_dict)
+        counts = await self.limiter.run(None, self.builder.facet_counts, options)
+        return counts.to_dict()
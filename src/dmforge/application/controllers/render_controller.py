@@ -1,19 +1,97 @@
+import asyncio
 from pathlib import Path
+from typing import Optional
 
-from dmforge.application.ports.deck_storage import DeckStorage
-from dmforge.application.ports.render_service import RenderService
+from dmforge.application.ports.asset_preparer import AssetPreparer
+from dmforge.application.ports.deck_storage import AsyncDeckStorage, DeckStorage
+from dmforge.application.ports.render_service import AsyncRenderService, RenderService
 
 
 class RenderController:
-    def __init__(self, renderer: RenderService, storage: DeckStorage):
+    def __init__(
+        self,
+        renderer: RenderService,
+        storage: DeckStorage,
+        assets: Optional[AssetPreparer] = None,
+    ):
         self.renderer = renderer
         self.storage = storage
+        self.assets = assets
 
-    def render_from_file(self, input_path: Path, fmt: str, output_path: Path) -> None:
+    def render_from_file(
+        self,
+        input_path: Path,
+        fmt: str,
+        output_path: Path,
+        split_pages: Optional[int] = None,
+        split_workers: int = 1,
+        html_pages: Optional[int] = None,
+    ) -> list[Path]:
+        """
+        Returns the files written: one, one per `split_pages` sheets of a PDF, or
+        with `html_pages` a directory of HTML pages of that many cards plus an index.
+        Raises RenderLimitExceeded if a resource-limited renderer kills the render.
+        """
+        if split_pages and fmt != "pdf":
+            raise ValueError("Splitting into page ranges is only supported for PDF output")
+        if html_pages and fmt != "html":
+            raise ValueError("Paginated output is only supported for HTML")
         deck = self.storage.load(input_path)
         if fmt == "pdf":
+            if self.assets is not None:
+                deck = self.assets.prepare(deck)
+            if split_pages:
+                if not hasattr(self.renderer, "render_pdf_split"):
+                    raise ValueError("This renderer cannot split output into page ranges")
+                return self.renderer.render_pdf_split(
+                    deck, output_path, split_pages, max_workers=split_workers
+                )
             self.renderer.render_pdf(deck, output_path)
         elif fmt == "html":
+            if html_pages:
+                if not hasattr(self.renderer, "render_html_pages"):
+                    raise ValueError("This renderer cannot write paginated HTML")
+                return self.renderer.render_html_pages(deck, output_path, html_pages)
             self.renderer.render_html(deck, output_path)
         else:
             raise ValueError(f"Unsupported format: {fmt}")
+        return [output_path]
+
+    def render_packed_files(self, input_paths: list[Path], fmt: str, output_path: Path) -> int:
+        """
+        Render several decks' cards on shared sheets in one pass, using as few
+        sheets as possible. Returns the number of sheets rendered.
+        """
+        if fmt not in ("pdf", "html"):
+            raise ValueError(f"Unsupported format: {fmt}")
+        if not hasattr(self.renderer, "render_packed"):
+            raise ValueError("This renderer cannot pack several decks")
+        decks = [self.storage.load(path) for path in input_paths]
+        if fmt == "pdf" and self.assets is not None:
+            decks = [self.assets.prepare(deck) for deck in decks]
+        return self.renderer.render_packed(decks, output_path, fmt)
+
+
+class AsyncRenderController:
+    """Event-loop friendly counterpart of `RenderController`."""
+
+    def __init__(
+        self,
+        renderer: AsyncRenderService,
+        storage: AsyncDeckStorage,
+        assets: Optional[AssetPreparer] = None,
+    ):
+        self.renderer = renderer
+        self.storage = storage
+        self.assets = assets
+
+    async def render_from_file(self, input_path: Path, fmt: str, output_path: Path) -> None:
+        if fmt not in ("pdf", "html"):
+            raise ValueError(f"Unsupported format: {fmt}")
+        deck = await self.storage.load(input_path)
+        if fmt == "pdf":
+            if self.assets is not None:
+                deck = await asyncio.to_thread(self.assets.prepare, deck)
+            await self.renderer.render_pdf(deck, output_path)
+        else:
+            await self.renderer.render_html(deck, output_path)
@@ -0,0 +1,13 @@
+from pathlib import Path
+from typing import Optional, Protocol
+
+
+class ImageGenerator(Protocol):
+    async def generate(self, prompt: str, model: str, size: str) -> bytes: ...
+
+
+# Caches may also offer `get_or_create(key, create)`, building a missing entry
+# at most once across processes (see `CacheNamespace`).
+class ImageCache(Protocol):
+    def get(self, key: str) -> Optional[Path]: ...
+    def put(self, key: str, data: bytes) -> Path: ...
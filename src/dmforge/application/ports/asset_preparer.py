@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from dmforge.domain.models import Deck
+
+
+class AssetPreparer(Protocol):
+    def prepare(self, deck: Deck) -> Deck: ...
@@ -0,0 +1,19 @@
+from typing import Iterable, Optional, Protocol
+
+
+class BuildLedger(Protocol):
+    """
+    Record of past deck builds for incremental rebuilds.
+
+    Each deck path maps to an entry: {"source": spell data path, "corpus":
+    baseline fingerprint, "options": DeckOptions fields, "spells": spell keys
+    of its cards}. Baselines map spell keys to per-spell content hashes.
+    """
+
+    def decks(self) -> dict[str, dict]: ...
+    def baseline(self, fingerprint: str) -> Optional[dict[str, str]]: ...
+    def set_baseline(self, fingerprint: str, hashes: dict[str, str]) -> None: ...
+    def decks_containing(self, source: str, keys: Iterable[str]) -> set[str]: ...
+    def record(self, path: str, entry: dict) -> None: ...
+    def forget(self, path: str) -> None: ...
+    def save(self) -> None: ...
@@ -7,3 +7,8 @@ from dmforge.domain.models import Deck
 class DeckStorage(Protocol):
     def save(self, deck: Deck, path: Path) -> None: ...
     def load(self, path: Path) -> Deck: ...
+
+
+class AsyncDeckStorage(Protocol):
+    async def save(self, deck: Deck, path: Path) -> None: ...
+    async def load(self, path: Path) -> Deck: ...
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class FontMetrics(Protocol):
+    name: str
+
+    def advance(self, char: str) -> float:
+        """Horizontal advance of `char` in em units (1.0 = the font size)."""
+        ...
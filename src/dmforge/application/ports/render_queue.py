@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Protocol
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """A queued deck render. `params` holds the render options (format, template_dir, ...)."""
+
+    id: int
+    fingerprint: str
+    input_path: str
+    output_path: str
+    params: dict = field(default_factory=dict)
+    status: str = "queued"  # queued, running, done or failed
+    attempts: int = 0
+    max_attempts: int = 3
+    error: Optional[str] = None
+    deduped: bool = False  # Set on enqueue when an identical job already existed
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class RenderQueue(Protocol):
+    def enqueue(
+        self,
+        input_path: Path,
+        output_path: Optional[Path],
+        params: dict,
+        max_attempts: Optional[int] = None,
+    ) -> RenderJob: ...
+    def claim(self, worker: str) -> Optional[RenderJob]: ...
+    def renew(self, job_id: int, worker: str) -> bool: ...
+    def complete(self, job_id: int, worker: str, staged: Optional[Path] = None) -> bool: ...
+    def fail(self, job_id: int, worker: str, error: str, retry: bool = True) -> bool: ...
+    def get(self, job_id: int) -> Optional[RenderJob]: ...
+    def pending(self) -> int: ...
@@ -7,3 +7,30 @@ from dmforge.domain.models import Deck
 class RenderService(Protocol):
     def render_pdf(self, deck: Deck, output_path: Path) -> None: ...
     def render_html(self, deck: Deck, output_path: Path) -> None: ...
+
+
+class SplitRenderService(RenderService, Protocol):
+    """A renderer that can write one layout as several PDFs of N pages each."""
+
+    def render_pdf_split(
+        self, deck: Deck, output_path: Path, pages_per_file: int, max_workers: int = 1
+    ) -> list[Path]: ...
+
+
+class PackingRenderService(RenderService, Protocol):
+    """A renderer that can lay several decks out on shared sheets in one pass."""
+
+    def render_packed(self, decks: list[Deck], output_path: Path, fmt: str = "pdf") -> int: ...
+
+
+class AsyncRenderService(Protocol):
+    async def render_pdf(self, deck: Deck, output_path: Path) -> None: ...
+    async def render_html(self, deck: Deck, output_path: Path) -> None: ...
+
+
+class RenderLimitExceeded(RuntimeError):
+    """A render was killed for exceeding a resource limit (`kind`: timeout, memory or cpu)."""
+
+    def __init__(self, kind: str, message: str):
+        super().__init__(message)
+        self.kind = kind
@@ -0,0 +1,6 @@
+from typing import Optional, Protocol
+
+
+class ResultCache(Protocol):
+    def get(self, key: str) -> Optional[list[int]]: ...
+    def put(self, key: str, spell_ids: list[int]) -> None: ...
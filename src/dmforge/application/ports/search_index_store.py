@@ -0,0 +1,8 @@
+from typing import Optional, Protocol
+
+
+class SearchIndexStore(Protocol):
+    """Persists serialised search indexes (plain dicts carrying a "fingerprint")."""
+
+    def load(self, fingerprint: str) -> Optional[dict]: ...
+    def save(self, data: dict) -> None: ...
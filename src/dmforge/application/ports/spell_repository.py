@@ -1,5 +1,17 @@
 from typing import Protocol
 
+from dmforge.domain.models import DeckOptions
+
 
 class SpellRepository(Protocol):
     def load_all_spells(self) -> list[dict]: ...
+
+
+class FilteredSpellRepository(SpellRepository, Protocol):
+    """A repository that can skip data `options` cannot match (e.g. a sharded corpus)."""
+
+    def load_spells_for(self, options: DeckOptions) -> list[dict]: ...
+
+
+class AsyncSpellRepository(Protocol):
+    async def load_all_spells(self) -> list[dict]: ...
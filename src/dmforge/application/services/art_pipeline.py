@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+from dmforge.application.ports.art_service import ImageCache, ImageGenerator
+from dmforge.domain.models import Deck, SpellCard
+
+
+def art_key(prompt: str, model: str, size: str) -> str:
+    """Content address of a generated image: same prompt, model and size, same image."""
+    return hashlib.sha256(f"{model}\n{size}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+class AsyncRateLimiter:
+    """Spaces request starts at least `1 / rate` seconds apart (rate <= 0 disables)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = max(loop.time(), self._next_start) + self.interval
+
+
+class ArtPipeline:
+    """
+    Generates card art concurrently. Cards that produce the same prompt share
+    one request, and images already in the cache are never requested again.
+
+    Cache calls run on worker threads so a busy cache never blocks the event
+    loop. A cache with `get_or_create` (the shared `DiskCache`) builds each
+    image under its lock, so concurrent runs request a missing image once.
+    Cards record the absolute path of their image, which stays valid
+    wherever the deck is rendered from.
+    """
+
+    def __init__(
+        self,
+        generator: ImageGenerator,
+        cache: ImageCache,
+        model: str = "dall-e-3",
+        size: str = "1024x1024",
+        concurrency: int = 4,
+        rate_limit: float = 0.0,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.generator = generator
+        self.cache = cache
+        self.model = model
+        self.size = size
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.requests = 0
+
+    @staticmethod
+    def generate_prompt(card: SpellCard) -> str:
+        summary = card.description.strip().split(". ")[0].strip()
+        return (
+            f"Fantasy trading card illustration of the spell '{card.name}', "
+            f"a level {card.level} {card.school} spell. {summary}".strip()
+        )
+
+    async def run(self, deck: Deck, overwrite: bool = False) -> Deck:
+        prompts: dict[int, str] = {}  # card index -> prompt
+        for i, card in enumerate(deck.cards):
+            if overwrite or not card.art_path:
+                prompts[i] = self.generate_prompt(card)
+
+        unique = {art_key(p, self.model, self.size): p for p in prompts.values()}
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = AsyncRateLimiter(self.rate_limit)
+        keys = list(unique)
+        # One thread per request slot, so threads waiting on the cache never
+        # hold back requests the semaphore would allow.
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            paths = await asyncio.gather(
+                *(self._fetch(key, unique[key], semaphore, limiter, executor) for key in keys)
+            )
+        finally:
+            # Not waiting: a thread may still be waiting on a request scheduled on this loop.
+            executor.shutdown(wait=False)
+        by_key = {key: Path(path).resolve() for key, path in zip(keys, paths, strict=True)}
+
+        cards = [
+            (
+                replace(card, art_path=str(by_key[art_key(prompts[i], self.model, self.size)]))
+                if i in prompts
+                else card
+            )
+            for i, card in enumerate(deck.cards)
+        ]
+        return Deck(name=deck.name, cards=cards, version=deck.version)
+
+    async def _fetch(
+        self,
+        key: str,
+        prompt: str,
+        semaphore: asyncio.Semaphore,
+        limiter: AsyncRateLimiter,
+        executor: ThreadPoolExecutor,
+    ) -> Path:
+        loop = asyncio.get_running_loop()
+        if hasattr(self.cache, "get_or_create"):
+
+            def create() -> bytes:
+                # Runs on the executor thread holding the cache lock.
+                generate = self._generate(prompt, semaphore, limiter)
+                return asyncio.run_coroutine_threadsafe(generate, loop).result()
+
+            return await loop.run_in_executor(executor, self.cache.get_or_create, key, create)
+
+        cached = await loop.run_in_executor(executor, self.cache.get, key)
+        if cached is not None:
+            return cached
+        data = await self._generate(prompt, semaphore, limiter)
+        return await loop.run_in_executor(executor, self.cache.put, key, data)
+
+    async def _generate(
+        self, prompt: str, semaphore: asyncio.Semaphore, limiter: AsyncRateLimiter
+    ) -> bytes:
+        async with semaphore:
+            await limiter.wait()
+            self.requests += 1
+            logging.info(f"🎨 Generating art: {prompt[:60]}")
+            return await self.generator.generate(prompt, self.model, self.size)
@@ -0,0 +1,98 @@
+"""
+Async adapters over the synchronous ports.
+
+Each adapter runs the wrapped call in an executor so the event loop stays
+responsive, and holds a `ConcurrencyLimiter` slot while it does. Pass one
+limiter to several adapters to cap them jointly (e.g. renders and deck
+loads sharing a CPU budget). The default executor is the loop's thread pool;
+a `ProcessPoolExecutor` also works when the wrapped object is picklable.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from dmforge.application.ports.deck_storage import DeckStorage
+from dmforge.application.ports.render_service import RenderService
+from dmforge.application.ports.spell_repository import SpellRepository
+from dmforge.domain.models import Deck
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimiter:
+    """Caps how many executor calls run at once; waiting callers queue on the loop."""
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.in_flight = 0
+        self.peak = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def run(
+        self, executor: Optional[Executor], func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        async with self._semaphore:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    executor, functools.partial(func, *args, **kwargs)
+                )
+            finally:
+                self.in_flight -= 1
+
+
+class _ExecutorAdapter:
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        concurrency: int = 4,
+        limiter: Optional[ConcurrencyLimiter] = None,
+    ):
+        self.executor = executor
+        self.limiter = limiter or ConcurrencyLimiter(concurrency)
+
+
+class ExecutorRenderService(_ExecutorAdapter):
+    """`AsyncRenderService` over a synchronous renderer such as `WeasyRenderer`."""
+
+    def __init__(self, renderer: RenderService, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.renderer = renderer
+
+    async def render_pdf(self, deck: Deck, output_path: Path) -> None:
+        await self.limiter.run(self.executor, self.renderer.render_pdf, deck, output_path)
+
+    async def render_html(self, deck: Deck, output_path: Path) -> None:
+        await self.limiter.run(self.executor, self.renderer.render_html, deck, output_path)
+
+
+class ExecutorDeckStorage(_ExecutorAdapter):
+    """`AsyncDeckStorage` over a synchronous storage such as `JSONDeckStorage`."""
+
+    def __init__(self, storage: DeckStorage, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.storage = storage
+
+    async def save(self, deck: Deck, path: Path) -> None:
+        await self.limiter.run(self.executor, self.storage.save, deck, path)
+
+    async def load(self, path: Path) -> Deck:
+        return await self.limiter.run(self.executor, self.storage.load, path)
+
+
+class ExecutorSpellRepository(_ExecutorAdapter):
+    """`AsyncSpellRepository` over any synchronous `SpellRepository`."""
+
+    def __init__(self, repository: SpellRepository, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.repository = repository
+
+    async def load_all_spells(self) -> list[dict]:
+        return await self.limiter.run(self.executor, self.repository.load_all_spells)
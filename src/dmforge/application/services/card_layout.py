@@ -0,0 +1,189 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from dmforge.domain.models import SpellCard
+
+# Fixed card furniture, in inches; deck.html.j2 sizes its elements from these.
+CARD_PADDING = 0.12
+HEADER_HEIGHT = 0.5  # Title plus level/school line
+FOOTER_HEIGHT = 0.25  # Duration line
+ART_FRACTION = 0.4  # Share of the card height given to art
+
+
+@dataclass(frozen=True)
+class LayoutSpec:
+    """A fixed N-up grid of cards on a printed sheet. All sizes are in inches."""
+
+    columns: int
+    rows: int
+    page_width: float = 11.0
+    page_height: float = 8.5
+    card_width: float = 2.5
+    card_height: float = 3.5
+    gutter: float = 0.0
+
+    def __post_init__(self):
+        if self.columns < 1 or self.rows < 1:
+            raise ValueError("A layout needs at least one column and one row")
+        if self.grid_width > self.page_width or self.grid_height > self.page_height:
+            raise ValueError(
+                f"{self.columns}x{self.rows} grid of {self.card_width}x{self.card_height}in "
+                f"cards does not fit a {self.page_width}x{self.page_height}in page"
+            )
+
+    @property
+    def per_page(self) -> int:
+        return self.columns * self.rows
+
+    @property
+    def grid_width(self) -> float:
+        return self.columns * self.card_width + (self.columns - 1) * self.gutter
+
+    @property
+    def grid_height(self) -> float:
+        return self.rows * self.card_height + (self.rows - 1) * self.gutter
+
+    @property
+    def art_height(self) -> float:
+        return round(self.card_height * ART_FRACTION, 4)
+
+    def description_box(self, has_art: bool) -> tuple[float, float]:
+        """Width and height left for the description on a card."""
+        width = self.card_width - 2 * CARD_PADDING
+        height = self.card_height - 2 * CARD_PADDING - HEADER_HEIGHT - FOOTER_HEIGHT
+        if has_art:
+            height -= self.art_height
+        return round(width, 4), round(height, 4)
+
+    @property
+    def margin_x(self) -> float:
+        return (self.page_width - self.grid_width) / 2
+
+    @property
+    def margin_y(self) -> float:
+        return (self.page_height - self.grid_height) / 2
+
+
+# Standard 2.5x3.5in cards: 6-up on landscape Letter, 9-up on portrait Letter;
+# 4-up uses larger 3.5x5in cards on portrait Letter.
+LAYOUTS = {
+    "4up": LayoutSpec(2, 2, 8.5, 11.0, 3.5, 5.0),
+    "6up": LayoutSpec(3, 2, 11.0, 8.5),
+    "9up": LayoutSpec(3, 3, 8.5, 11.0),
+}
+
+
+def get_layout(name: str) -> LayoutSpec:
+    """Look up a named layout, or build one from "COLSxROWS" using standard cards."""
+    if name in LAYOUTS:
+        return LAYOUTS[name]
+    match = re.fullmatch(r"(\d+)x(\d+)", name)
+    if not match:
+        raise ValueError(f"Unknown layout: {name}. Use one of {sorted(LAYOUTS)} or COLSxROWS")
+    columns, rows = int(match.group(1)), int(match.group(2))
+    landscape = columns > rows
+    return LayoutSpec(
+        columns,
+        rows,
+        page_width=11.0 if landscape else 8.5,
+        page_height=8.5 if landscape else 11.0,
+    )
+
+
+@dataclass(frozen=True)
+class Slot:
+    """
+    One grid cell on a page; `card` is None for the unused tail of the last
+    page. On packed sheets `deck` is the index of the card's deck.
+    """
+
+    row: int
+    column: int
+    left: float
+    top: float
+    card: Optional[SpellCard]
+    deck: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Page:
+    number: int
+    slots: list[Slot]
+
+    @property
+    def cards(self) -> list[SpellCard]:
+        return [slot.card for slot in self.slots if slot.card is not None]
+
+
+def _page(number: int, entries: list[tuple[Optional[int], SpellCard]], spec: LayoutSpec) -> Page:
+    slots = []
+    for i in range(spec.per_page):
+        row, column = divmod(i, spec.columns)
+        deck, card = entries[i] if i < len(entries) else (None, None)
+        slots.append(
+            Slot(
+                row=row,
+                column=column,
+                left=round(spec.margin_x + column * (spec.card_width + spec.gutter), 4),
+                top=round(spec.margin_y + row * (spec.card_height + spec.gutter), 4),
+                card=card,
+                deck=deck,
+            )
+        )
+    return Page(number=number, slots=slots)
+
+
+def paginate(cards: list[SpellCard], spec: LayoutSpec) -> list[Page]:
+    """
+    Assign cards to grid slots, filling each page row by row.
+
+    Slot offsets are relative to the page's top-left corner, with the grid
+    centred on the sheet. Every page has exactly `spec.per_page` slots so
+    cut lines line up across the whole print run.
+    """
+    return [
+        _page(number, [(None, card) for card in cards[start : start + spec.per_page]], spec)
+        for number, start in enumerate(range(0, len(cards), spec.per_page), start=1)
+    ]
+
+
+def pack(decks: list[list[SpellCard]], spec: LayoutSpec) -> list[Page]:
+    """
+    Lay several decks out on shared sheets using as few pages as possible.
+
+    Each deck's full sheets come first, in deck order. The leftover cards
+    of every deck, fewer than a sheet each, then share sheets, placed first
+    fit decreasing so each deck's leftovers stay together on one sheet. If
+    keeping them together would cost a sheet, the leftovers run on
+    continuously instead, and a deck may straddle two sheets. Slots record
+    their deck so templates can mark where each deck's cards are.
+    """
+    per_page = spec.per_page
+    sheets: list[list[tuple[Optional[int], SpellCard]]] = []
+    leftovers = []
+    for deck, cards in enumerate(decks):
+        full = len(cards) - len(cards) % per_page
+        for start in range(0, full, per_page):
+            sheets.append([(deck, card) for card in cards[start : start + per_page]])
+        if full < len(cards):
+            leftovers.append([(deck, card) for card in cards[full:]])
+
+    leftovers.sort(key=len, reverse=True)  # Stable: equal sizes keep deck order
+    shared: list[list[tuple[Optional[int], SpellCard]]] = []
+    for entries in leftovers:
+        for sheet in shared:
+            if len(sheet) + len(entries) <= per_page:
+                sheet.extend(entries)
+                break
+        else:
+            shared.append(list(entries))
+
+    remaining = sum(len(entries) for entries in leftovers)
+    if len(shared) > math.ceil(remaining / per_page):
+        flat = [entry for entries in leftovers for entry in entries]
+        shared = [flat[start : start + per_page] for start in range(0, len(flat), per_page)]
+
+    sheets.extend(shared)
+    return [_page(number, entries, spec) for number, entries in enumerate(sheets, start=1)]
@@ -1,41 +1,202 @@
-from typing import Protocol
+import heapq
+import threading
+from typing import Optional, Protocol
 
+from dmforge.application.ports.result_cache import ResultCache
+from dmforge.application.ports.search_index_store import SearchIndexStore
 from dmforge.application.ports.spell_repository import SpellRepository
+from dmforge.application.services.facet_engine import FacetCounts, FacetEngine
+from dmforge.application.services.name_index import SpellNameIndex
+from dmforge.application.services.result_cache import corpus_fingerprint, result_key
+from dmforge.application.services.search_index import SpellSearchIndex
 from dmforge.domain.models import Deck, DeckOptions, SpellCard
 
+# Sort keys over raw spell records, matching the defaults `to_card` fills in.
+SORT_KEYS = {
+    "name": lambda spell: str(spell.get("name", "Unknown")).casefold(),
+    "level": lambda spell: (spell.get("level", 0), str(spell.get("name", "Unknown")).casefold()),
+    "school": lambda spell: (
+        str(spell.get("school", "Unknown")).casefold(),
+        spell.get("level", 0),
+        str(spell.get("name", "Unknown")).casefold(),
+    ),
+}
+
+
+def matches(spell: dict, options: DeckOptions) -> bool:
+    """Whether a raw spell record passes the class, level and school filters of `options`."""
+    return (
+        (not options.classes or any(cls in spell.get("classes", []) for cls in options.classes))
+        and (not options.levels or spell.get("level") in options.levels)
+        and (not options.schools or spell.get("school") in options.schools)
+    )
+
+
+def to_card(spell: dict) -> SpellCard:
+    """The card a raw spell record becomes in a deck, with defaults for missing fields."""
+    return SpellCard(
+        name=spell.get("name", "Unknown"),
+        level=spell.get("level", 0),
+        school=spell.get("school", "Unknown"),
+        classes=spell.get("classes", []),
+        description=spell.get("desc", ""),
+        duration=spell.get("duration", "Instantaneous"),
+    )
+
 
 class DeckBuilder(Protocol):
     def build(self, options: DeckOptions) -> Deck: ...
+    def facet_counts(self, options: DeckOptions) -> FacetCounts: ...
 
 
 class BasicDeckBuilder:
-    def __init__(self, repository: SpellRepository):
+    """
+    Builds decks from a spell repository. One builder may serve concurrent
+    builds (see AsyncDeckController): its lazily built indexes are created
+    under a lock, so each is built once and never seen half-built.
+    """
+
+    def __init__(
+        self,
+        repository: SpellRepository,
+        cache: Optional[ResultCache] = None,
+        index_store: Optional[SearchIndexStore] = None,
+    ):
         self.repository = repository
+        self.cache = cache
+        self.index_store = index_store
+        self._search_index: Optional[SpellSearchIndex] = None
+        self._name_index: Optional[SpellNameIndex] = None
+        self._facets: Optional[FacetEngine] = None
+        self._facet_spells: Optional[list[dict]] = None
+        self._facet_fingerprint: Optional[str] = None
+        self._lock = threading.RLock()
 
     def build(self, options: DeckOptions) -> Deck:
-        spells = self.repository.load_all_spells()
-        filtered = self._apply_filters(spells, options)
-        cards = [self._to_card(spell) for spell in filtered]
+        self._check_paging(options)
+        return self.build_from(self._load_spells(options), options)
+
+    def build_from(self, spells: list[dict], options: DeckOptions) -> Deck:
+        """Build from a corpus the caller has already loaded from this builder's repository."""
+        self._check_paging(options)
+        spell_ids = self._page(spells, self._select_ids(spells, options), options)
+        cards = [self._to_card(spells[i]) for i in spell_ids]
         return Deck(name=options.name, cards=cards)
 
-    def _apply_filters(self, spells: list[dict], options: DeckOptions) -> list[dict]:
-        return [
-            spell
-            for spell in spells
-            if (
-                not options.classes
-                or any(cls in spell.get("classes", []) for cls in options.classes)
+    @staticmethod
+    def _check_paging(options: DeckOptions) -> None:
+        if options.sort and options.sort.lstrip("-") not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {options.sort}. Use one of {sorted(SORT_KEYS)}")
+        if options.offset < 0 or (options.limit is not None and options.limit < 0):
+            raise ValueError("offset and limit must not be negative")
+
+    @staticmethod
+    def _page(spells: list[dict], spell_ids: list[int], options: DeckOptions) -> list[int]:
+        """
+        Apply sort, offset and limit to the selected spell IDs, before any card
+        is built. With a limit, a heap of offset + limit entries replaces the
+        full sort; ties keep selection order either way.
+        """
+        stop = None if options.limit is None else options.offset + options.limit
+        if options.sort:
+            key = SORT_KEYS[options.sort.lstrip("-")]
+            reverse = options.sort.startswith("-")
+            if stop is None:
+                spell_ids = sorted(spell_ids, key=lambda i: key(spells[i]), reverse=reverse)
+            else:
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                spell_ids = select(stop, spell_ids, key=lambda i: key(spells[i]))
+        return list(spell_ids[options.offset : stop])
+
+    def _load_spells(self, options: DeckOptions) -> list[dict]:
+        # Repositories that can prune by filter (FilteredSpellRepository) only load what can match.
+        load_for = getattr(self.repository, "load_spells_for", None)
+        if callable(load_for):
+            return load_for(options)
+        return self.repository.load_all_spells()
+
+    def _select_ids(self, spells: list[dict], options: DeckOptions) -> list[int]:
+        if self.cache is None:
+            return self._filter_ids(spells, options)
+        key = result_key(self._fingerprint(spells), options)
+        spell_ids = self.cache.get(key)
+        if spell_ids is None:
+            spell_ids = self._filter_ids(spells, options)
+            self.cache.put(key, spell_ids)
+        return spell_ids
+
+    def facet_counts(self, options: DeckOptions) -> FacetCounts:
+        """
+        Per-class/level/school counts for `options`, for interactive front ends.
+        The facet bitmaps are built once per corpus fingerprint and reused by
+        later calls until the corpus changes.
+        """
+        spells = self.repository.load_all_spells()
+        fingerprint = self._fingerprint(spells)
+        with self._lock:
+            if self._facets is None or self._facet_fingerprint != fingerprint:
+                self._facet_spells = spells
+                self._facets = FacetEngine(spells)
+                self._facet_fingerprint = fingerprint
+            spells, engine = self._facet_spells, self._facets
+        candidates = None
+        if options.spells or options.search:
+            unfiltered = DeckOptions(
+                spells=options.spells, search=options.search, search_mode=options.search_mode
             )
-            and (not options.levels or spell.get("level") in options.levels)
-            and (not options.schools or spell.get("school") in options.schools)
-        ]
+            candidates = engine.bitmap(self._filter_ids(spells, unfiltered))
+        return engine.counts(options, candidates)
+
+    def _fingerprint(self, spells: list[dict]) -> str:
+        # Repositories that already hash their source expose it; otherwise hash the content.
+        fingerprint = getattr(self.repository, "fingerprint", None)
+        if callable(fingerprint):
+            return fingerprint()
+        return corpus_fingerprint(spells)
+
+    def search_index(self, spells: list[dict]) -> SpellSearchIndex:
+        """Return the search index for `spells`, loading or building it as needed."""
+        fingerprint = self._fingerprint(spells)
+        with self._lock:
+            if self._search_index is not None and self._search_index.fingerprint == fingerprint:
+                return self._search_index
+            data = self.index_store.load(fingerprint) if self.index_store else None
+            if data is not None:
+                index = SpellSearchIndex.from_dict(data)
+            else:
+                index = SpellSearchIndex.build(spells, fingerprint, trigrams=True)
+                if self.index_store:
+                    self.index_store.save(index.to_dict())
+            self._search_index = index
+            return index
+
+    def name_index(self, spells: list[dict]) -> SpellNameIndex:
+        fingerprint = self._fingerprint(spells)
+        with self._lock:
+            if self._name_index is None or self._name_index.fingerprint != fingerprint:
+                self._name_index = SpellNameIndex(spells, fingerprint)
+            return self._name_index
+
+    def _filter_ids(self, spells: list[dict], options: DeckOptions) -> list[int]:
+        if options.spells:
+            candidates, missing = self.name_index(spells).resolve(options.spells)
+            if missing:
+                raise ValueError(f"Unknown spell names: {', '.join(missing)}")
+            if options.search:
+                hits = set(self.search_index(spells).search(options.search, options.search_mode))
+                candidates = [i for i in candidates if i in hits]
+        elif options.search:
+            candidates = self.search_index(spells).search(options.search, mode=options.search_mode)
+        else:
+            candidates = range(len(spells))
+        return [i for i in candidates if self._matches(spells[i], options)]
+
+    def _apply_filters(self, spells: list[dict], options: DeckOptions) -> list[dict]:
+        return [spells[i] for i in self._filter_ids(spells, options)]
+
+    @staticmethod
+    def _matches(spell: dict, options: DeckOptions) -> bool:
+        return matches(spell, options)
 
     def _to_card(self, spell: dict) -> SpellCard:
-        return SpellCard(
-            name=spell.get("name", "Unknown"),
-            level=spell.get("level", 0),
-            school=spell.get("school", "Unknown"),
-            classes=spell.get("classes", []),
-            description=spell.get("desc", ""),
-            duration=spell.get("duration", "Instantaneous"),
-        )
+        return to_card(spell)
@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from dmforge.application.ports.deck_storage import DeckStorage
+from dmforge.domain.models import Deck
+
+SORT_KEYS = {
+    "name": lambda card: card.name.casefold(),
+    "level": lambda card: (card.level, card.name.casefold()),
+    "school": lambda card: (card.school.casefold(), card.level, card.name.casefold()),
+}
+
+
+@dataclass(frozen=True)
+class DeriveSpec:
+    """
+    How to derive a deck from a master deck. Steps apply in field order:
+    union, intersect and minus (paths of other deck files), then the class,
+    level and school filters, then sort ("level", or "-level" for descending),
+    then offset/limit.
+    """
+
+    name: str = ""
+    union: list[str] = field(default_factory=list)
+    intersect: list[str] = field(default_factory=list)
+    minus: list[str] = field(default_factory=list)
+    classes: list[str] = field(default_factory=list)
+    levels: list[int] = field(default_factory=list)
+    schools: list[str] = field(default_factory=list)
+    sort: str = ""
+    offset: int = 0
+    limit: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DeriveSpec":
+        known = set(cls.__dataclass_fields__)
+        unknown = set(data) - known - {"output"}
+        if unknown:
+            raise ValueError(f"Unknown derive spec keys: {', '.join(sorted(unknown))}")
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+class DeckDeriver:
+    """
+    Applies `DeriveSpec`s to a master deck using the structural-sharing deck
+    operations. Other decks referenced by specs are loaded once and reused.
+    """
+
+    def __init__(self, storage: DeckStorage):
+        self.storage = storage
+        self._decks: dict[str, Deck] = {}
+
+    def load(self, path: str) -> Deck:
+        if path not in self._decks:
+            self._decks[path] = self.storage.load(Path(path))
+        return self._decks[path]
+
+    def derive(self, master: Deck, spec: DeriveSpec) -> Deck:
+        if spec.sort and spec.sort.lstrip("-") not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {spec.sort}. Use one of {sorted(SORT_KEYS)}")
+
+        deck = master
+        for path in spec.union:
+            deck = deck.union(self.load(path))
+        for path in spec.intersect:
+            deck = deck.intersection(self.load(path))
+        for path in spec.minus:
+            deck = deck.difference(self.load(path))
+
+        if spec.classes or spec.levels or spec.schools:
+            classes, levels, schools = set(spec.classes), set(spec.levels), set(spec.schools)
+            deck = deck.filter(
+                lambda card: (not classes or bool(classes & set(card.classes)))
+                and (not levels or card.level in levels)
+                and (not schools or card.school in schools)
+            )
+        if spec.sort:
+            deck = deck.sorted(SORT_KEYS[spec.sort.lstrip("-")], reverse=spec.sort[0] == "-")
+        if spec.offset or spec.limit is not None:
+            stop = None if spec.limit is None else spec.offset + spec.limit
+            deck = deck.slice(spec.offset, stop)
+
+        return Deck(name=spec.name or master.name, cards=deck.cards, version=master.version)
@@ -0,0 +1,228 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Optional
+
+from dmforge.application.ports.build_ledger import BuildLedger
+from dmforge.application.ports.deck_storage import DeckStorage
+from dmforge.application.ports.spell_repository import SpellRepository
+from dmforge.application.services.deck_builder import BasicDeckBuilder, matches, to_card
+from dmforge.application.services.name_index import normalize_name
+from dmforge.domain.models import Deck, DeckOptions, SpellCard
+
+
+def spell_hashes(spells: list[dict]) -> dict[str, str]:
+    """Content hash of each spell, keyed by normalized spell name."""
+    hashes = {}
+    for spell in spells:
+        # default=str resolves lazily loaded descriptions.
+        payload = json.dumps(
+            spell, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        hashes[normalize_name(spell.get("name", ""))] = hashlib.sha256(
+            payload.encode("utf-8")
+        ).hexdigest()
+    return hashes
+
+
+def spell_key(card: SpellCard) -> str:
+    return normalize_name(card.name)
+
+
+def baseline_fingerprint(hashes: dict[str, str]) -> str:
+    digest = hashlib.sha256()
+    for key in sorted(hashes):
+        digest.update(f"{key}\0{hashes[key]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CorpusChanges:
+    changed: set[str]
+    added: set[str]
+    removed: set[str]
+
+    @classmethod
+    def between(cls, old: dict[str, str], new: dict[str, str]) -> "CorpusChanges":
+        return cls(
+            changed={k for k in old.keys() & new.keys() if old[k] != new[k]},
+            added=new.keys() - old.keys(),
+            removed=old.keys() - new.keys(),
+        )
+
+    @property
+    def keys(self) -> set[str]:
+        return self.changed | self.added | self.removed
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.added or self.removed)
+
+
+@dataclass
+class RebuildReport:
+    decks: int = 0  # Decks in the ledger that were considered
+    rewritten: list[str] = field(default_factory=list)
+    rebuilt: list[str] = field(default_factory=list)  # Full rebuilds (ranked decks, no baseline)
+    missing: list[str] = field(default_factory=list)  # Deck files gone; dropped from the ledger
+    patched: int = 0
+    added: int = 0
+    removed: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class DeckRebuilder:
+    """
+    Incremental deck rebuilds against a changed spell corpus.
+
+    `record` notes each build in the ledger. `rebuild` diffs every source's
+    current corpus against the baseline its decks were built from, finds the
+    decks holding changed or removed spells through the ledger's reverse
+    index, and checks new or changed spells against each deck's filters
+    without opening it. Only affected decks are loaded, and in them only the
+    changed cards are replaced, dropped or inserted (in corpus order).
+    Search decks are ranked over the whole corpus, and sorted or limited
+    decks depend on every match, so any change rebuilds those in full.
+    """
+
+    def __init__(
+        self,
+        ledger: BuildLedger,
+        storage: DeckStorage,
+        open_repository: Callable[[Path], SpellRepository],
+    ):
+        self.ledger = ledger
+        self.storage = storage
+        self.open_repository = open_repository
+
+    def record(
+        self, source: str, spells: list[dict], path: Path, options: DeckOptions, deck: Deck
+    ) -> None:
+        hashes = spell_hashes(spells)
+        fingerprint = baseline_fingerprint(hashes)
+        self.ledger.set_baseline(fingerprint, hashes)
+        self.ledger.record(
+            str(path),
+            {
+                "source": source,
+                "corpus": fingerprint,
+                "options": asdict(options),
+                "spells": [spell_key(card) for card in deck.cards],
+            },
+        )
+        self.ledger.save()
+
+    def rebuild(self, sources: Optional[list[str]] = None, dry_run: bool = False) -> RebuildReport:
+        report = RebuildReport()
+        by_source: dict[str, dict[str, dict]] = {}
+        for path, entry in self.ledger.decks().items():
+            if sources is None or entry["source"] in sources:
+                by_source.setdefault(entry["source"], {})[path] = entry
+        for source, entries in by_source.items():
+            report.decks += len(entries)
+            self._rebuild_source(source, entries, report, dry_run)
+        if not dry_run:
+            self.ledger.save()
+        return report
+
+    def _rebuild_source(
+        self, source: str, entries: dict[str, dict], report: RebuildReport, dry_run: bool
+    ) -> None:
+        repository = self.open_repository(Path(source))
+        builder = BasicDeckBuilder(repository)
+        spells = repository.load_all_spells()
+        hashes = spell_hashes(spells)
+        fingerprint = baseline_fingerprint(hashes)
+        by_key = {normalize_name(spell.get("name", "")): spell for spell in spells}
+        positions = {key: i for i, key in enumerate(by_key)}
+
+        groups: dict[str, list[str]] = {}
+        for path, entry in entries.items():
+            if entry["corpus"] != fingerprint:
+                groups.setdefault(entry["corpus"], []).append(path)
+        if groups and not dry_run:
+            self.ledger.set_baseline(fingerprint, hashes)
+
+        for corpus, paths in groups.items():
+            old = self.ledger.baseline(corpus)
+            changes = CorpusChanges.between(old or {}, hashes)
+            affected = self.ledger.decks_containing(source, changes.changed | changes.removed)
+            incoming = [by_key[k] for k in changes.changed | changes.added]
+            for path in sorted(paths):
+                entry = entries[path]
+                options = DeckOptions(**entry["options"])
+                ranked = bool(options.search or options.sort or options.offset)
+                ranked = ranked or options.limit is not None
+                full = old is None or (ranked and bool(changes))
+                keys = entry["spells"]
+                if (
+                    full
+                    or path in affected
+                    or (not options.spells and any(matches(s, options) for s in incoming))
+                ):
+                    try:
+                        deck = self.storage.load(Path(path))
+                    except FileNotFoundError:
+                        report.missing.append(path)
+                        if not dry_run:
+                            self.ledger.forget(path)
+                        continue
+                    if full:
+                        report.rebuilt.append(path)
+                        cards = self._full_rebuild(deck, builder, spells, options)
+                    else:
+                        cards = self._patch(deck, entry, options, changes, by_key, report)
+                        if not options.spells:
+                            # Filter decks list spells in corpus order.
+                            cards.sort(key=lambda c: positions.get(spell_key(c), len(positions)))
+                    if cards != list(deck.cards):
+                        report.rewritten.append(path)
+                        if not dry_run:
+                            self.storage.save(
+                                Deck(name=deck.name, cards=cards, version=deck.version), Path(path)
+                            )
+                    keys = [spell_key(card) for card in cards]
+                if not dry_run:
+                    self.ledger.record(path, {**entry, "corpus": fingerprint, "spells": keys})
+
+    @staticmethod
+    def _full_rebuild(
+        deck: Deck, builder: BasicDeckBuilder, spells: list[dict], options: DeckOptions
+    ) -> list:
+        art = {card.name: card.art_path for card in deck.cards if card.art_path}
+        built = builder.build_from(spells, options)
+        return [replace(card, art_path=art.get(card.name)) for card in built.cards]
+
+    @staticmethod
+    def _patch(
+        deck: Deck,
+        entry: dict,
+        options: DeckOptions,
+        changes: CorpusChanges,
+        by_key: dict[str, dict],
+        report: RebuildReport,
+    ) -> list[SpellCard]:
+        cards: list[Optional[SpellCard]] = list(deck.cards)
+        index = {spell_key(card): i for i, card in enumerate(cards)}
+        # Explicit picks keep their membership; filter decks may gain matching spells.
+        picked = set(entry["spells"]) if options.spells else None
+        for key in sorted(changes.keys):
+            spell = by_key.get(key)
+            wanted = (
+                spell is not None and (picked is None or key in picked) and matches(spell, options)
+            )
+            i = index.get(key)
+            if i is not None and wanted:
+                card = replace(to_card(spell), art_path=cards[i].art_path)
+                if card != cards[i]:
+                    cards[i] = card
+                    report.patched += 1
+            elif i is not None:
+                cards[i] = None
+                report.removed += 1
+            elif wanted:
+                cards.append(to_card(spell))
+                report.added += 1
+        return [card for card in cards if card is not None]
@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from dmforge.domain.models import DeckOptions
+
+
+def _sort_key(value) -> tuple:
+    return (0, value, "") if isinstance(value, int) else (1, 0, str(value))
+
+
+@dataclass(frozen=True)
+class FacetCounts:
+    """Spell counts per filter value for the current selection."""
+
+    total: int
+    classes: dict[str, int] = field(default_factory=dict)
+    levels: dict[int, int] = field(default_factory=dict)
+    schools: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "classes": self.classes,
+            "levels": self.levels,
+            "schools": self.schools,
+        }
+
+
+class FacetEngine:
+    """
+    Bitmap facet counts over a spell corpus.
+
+    Each class, level and school value owns a bitmap (a Python int with bit
+    `i` set for spell ID `i`), so a selection is a handful of AND/OR
+    operations and each count is a single popcount. Counts for a dimension
+    ignore that dimension's own filter, so toggling "Wizard" still shows how
+    many Cleric spells would be added by selecting Cleric as well.
+    """
+
+    def __init__(self, spells: list[dict]):
+        self.size = len(spells)
+        self._all = (1 << self.size) - 1
+        self._classes: dict[str, int] = {}
+        self._levels: dict[int, int] = {}
+        self._schools: dict[str, int] = {}
+        for spell_id, spell in enumerate(spells):
+            bit = 1 << spell_id
+            for cls in set(spell.get("classes", [])):
+                self._classes[cls] = self._classes.get(cls, 0) | bit
+            level = spell.get("level")
+            self._levels[level] = self._levels.get(level, 0) | bit
+            school = spell.get("school")
+            self._schools[school] = self._schools.get(school, 0) | bit
+
+    @staticmethod
+    def bitmap(spell_ids: Iterable[int]) -> int:
+        mask = 0
+        for spell_id in spell_ids:
+            mask |= 1 << spell_id
+        return mask
+
+    def _union(self, bitmaps: dict, values: list) -> int:
+        if not values:
+            return self._all
+        mask = 0
+        for value in values:
+            mask |= bitmaps.get(value, 0)
+        return mask
+
+    def select(self, options: DeckOptions, candidates: Optional[int] = None) -> int:
+        """Bitmap of spells matching `options`, optionally within `candidates`."""
+        return (
+            (self._all if candidates is None else candidates)
+            & self._union(self._classes, options.classes)
+            & self._union(self._levels, options.levels)
+            & self._union(self._schools, options.schools)
+        )
+
+    def counts(self, options: DeckOptions, candidates: Optional[int] = None) -> FacetCounts:
+        base = self._all if candidates is None else candidates
+        by_class = self._union(self._classes, options.classes)
+        by_level = self._union(self._levels, options.levels)
+        by_school = self._union(self._schools, options.schools)
+
+        def tally(bitmaps: dict, others: int) -> dict:
+            counts = {}
+            for value in sorted((v for v in bitmaps if v is not None), key=_sort_key):
+                n = (bitmaps[value] & others).bit_count()
+                if n:
+                    counts[value] = n
+            return counts
+
+        return FacetCounts(
+            total=(base & by_class & by_level & by_school).bit_count(),
+            classes=tally(self._classes, base & by_level & by_school),
+            levels=tally(self._levels, base & by_class & by_school),
+            schools=tally(self._schools, base & by_class & by_level),
+        )
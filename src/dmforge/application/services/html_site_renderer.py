@@ -0,0 +1,182 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from dmforge.application.services.card_layout import LAYOUTS, LayoutSpec, paginate
+from dmforge.application.services.text_fit import TextFit, TextFitter
+from dmforge.domain.models import Deck, SpellCard
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).resolve().parents[2] / "resources" / "templates"
+PAGE_MANIFEST = "pages.json"
+_PAGE_TEMPLATES = ("deck_page.html.j2", "_sheets.html.j2")
+
+_environments: dict[str, Environment] = {}  # Per process, so pool workers reuse theirs
+
+
+def page_file(number: int) -> str:
+    return f"page_{number:04d}.html"
+
+
+def _environment(template_dir: str) -> Environment:
+    if template_dir not in _environments:
+        # Custom template directories may override only some templates.
+        loader = ChoiceLoader(
+            [FileSystemLoader(template_dir), FileSystemLoader(str(DEFAULT_TEMPLATE_DIR))]
+        )
+        _environments[template_dir] = Environment(loader=loader, autoescape=True)
+    return _environments[template_dir]
+
+
+def _write_page(
+    template_dir: str,
+    layout: LayoutSpec,
+    deck_name: str,
+    cards: list[SpellCard],
+    fits: dict[tuple[str, bool], TextFit],
+    number: int,
+    count: int,
+    first_card: int,
+    target: Path,
+) -> None:
+    html = (
+        _environment(template_dir)
+        .get_template("deck_page.html.j2")
+        .render(
+            deck=Deck(name=deck_name, cards=cards),
+            layout=layout,
+            pages=paginate(cards, layout),
+            fits=fits,
+            page_number=number,
+            page_count=count,
+            page_file=page_file,
+            first_card=first_card,
+        )
+    )
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(html)
+    os.replace(tmp, target)
+
+
+class PaginatedHTMLRenderer:
+    """
+    Writes a deck as a directory of HTML proofs: `page_NNNN.html` files of
+    `cards_per_page` cards each (rounded up to whole sheets) and an
+    `index.html` with page links and client-side search over a compact JSON
+    blob. Card art is lazy-loaded.
+
+    Each page file's inputs (its cards, their text fits, the layout, the page
+    templates and the page count) are hashed into `pages.json`; on re-render
+    only pages whose hash changed are rewritten. Pages are rendered in a
+    process pool when more than one needs writing.
+    """
+
+    def __init__(
+        self,
+        template_dir: Path = DEFAULT_TEMPLATE_DIR,
+        layout: LayoutSpec = LAYOUTS["6up"],
+        fitter: Optional[TextFitter] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.template_dir = template_dir
+        self.layout = layout
+        self.fitter = fitter or TextFitter()
+        self.max_workers = max_workers
+        self.rewritten = 0  # Page files written by the last render
+
+    def _template_digest(self) -> str:
+        digest = hashlib.sha256()
+        env = _environment(str(self.template_dir))
+        for name in _PAGE_TEMPLATES:
+            source, _, _ = env.loader.get_source(env, name)
+            digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _fits(self, cards: list[SpellCard]) -> dict[tuple[str, bool], TextFit]:
+        fits = {}
+        for card in cards:
+            key = (card.description, bool(card.art_path))
+            if key not in fits:
+                fits[key] = self.fitter.fit(card.description, *self.layout.description_box(key[1]))
+        return fits
+
+    def render(self, deck: Deck, output_dir: Path, cards_per_page: int = 600) -> list[Path]:
+        """Write the page files and index; returns every file of the proof, index first."""
+        if cards_per_page < 1:
+            raise ValueError("cards_per_page must be at least 1")
+        per_file = math.ceil(cards_per_page / self.layout.per_page) * self.layout.per_page
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = output_dir / PAGE_MANIFEST
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            previous = {}
+
+        chunks = [deck.cards[i : i + per_file] for i in range(0, len(deck.cards), per_file)]
+        count = len(chunks)
+        base = json.dumps(
+            [self._template_digest(), self.layout.__dict__, deck.name, count], sort_keys=True
+        )
+        manifest, jobs = {}, []
+        for number, cards in enumerate(chunks, start=1):
+            fits = self._fits(cards)
+            key = hashlib.sha256(
+                json.dumps(
+                    [base, [c.content_hash for c in cards], [f.__dict__ for f in fits.values()]],
+                    sort_keys=True,
+                ).encode("utf-8")
+            ).hexdigest()
+            name = page_file(number)
+            manifest[name] = key
+            if previous.get(name) != key or not (output_dir / name).exists():
+                first_card = (number - 1) * per_file
+                jobs.append((number, cards, fits, first_card, output_dir / name))
+
+        self._write_pages(deck.name, count, jobs)
+        self.rewritten = len(jobs)
+
+        for stale in set(previous) - set(manifest):
+            (output_dir / stale).unlink(missing_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        index = output_dir / "index.html"
+        index.write_text(self._index_html(deck, chunks, per_file), encoding="utf-8")
+        return [index] + [output_dir / name for name in manifest]
+
+    def _write_pages(self, deck_name: str, count: int, jobs: list[tuple]) -> None:
+        args = [
+            (str(self.template_dir), self.layout, deck_name, cards, fits, n, count, first, target)
+            for n, cards, fits, first, target in jobs
+        ]
+        if len(args) <= 1 or self.max_workers == 1:
+            for job in args:
+                _write_page(*job)
+            return
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            for future in [pool.submit(_write_page, *job) for job in args]:
+                future.result()
+
+    def _index_html(self, deck: Deck, chunks: list[list[SpellCard]], per_file: int) -> str:
+        search = []
+        for number, cards in enumerate(chunks, start=1):
+            for offset, card in enumerate(cards):
+                card_id = (number - 1) * per_file + offset
+                search.append([card.name, card.level, card.school, page_file(number), card_id])
+        # Compact, and safe to embed in a <script> element
+        search_data = json.dumps(search, separators=(",", ":"), ensure_ascii=False)
+        search_data = search_data.replace("</", "<\\/")
+
+        pages = [
+            {"file": page_file(n), "first": cards[0].name, "last": cards[-1].name}
+            for n, cards in enumerate(chunks, start=1)
+        ]
+        template = _environment(str(self.template_dir)).get_template("deck_index.html.j2")
+        return template.render(
+            deck=deck, page_count=len(chunks), index_pages=pages, search_data=search_data
+        )
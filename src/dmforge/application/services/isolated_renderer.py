@@ -0,0 +1,195 @@
+"""
+Runs each render in a child process under hard resource limits.
+
+The child is forked from the current process, so it inherits the wrapped
+renderer with its template environment and caches already warm. Limits:
+
+- `timeout`: wall-clock seconds; the parent kills the child when it expires.
+- `memory_mb`: address-space cap (RLIMIT_AS); allocations beyond it fail with
+  MemoryError inside the child. Linux does not enforce RLIMIT_RSS, so the
+  address space is the closest hard bound on resident memory.
+- `cpu_seconds`: CPU-time cap (RLIMIT_CPU); the kernel sends SIGXCPU.
+
+Breaches raise `RenderLimitExceeded` and are tallied in `metrics`.
+"""
+
+import multiprocessing
+import signal
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from dmforge.application.ports.render_service import RenderLimitExceeded, RenderService
+from dmforge.domain.models import Deck
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock timeout applies
+    resource = None
+
+
+@dataclass
+class RenderMetrics:
+    renders: int = 0
+    completed: int = 0
+    failed: int = 0
+    kills: dict[str, int] = field(default_factory=lambda: {"timeout": 0, "memory": 0, "cpu": 0})
+    max_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "renders": self.renders,
+            "completed": self.completed,
+            "failed": self.failed,
+            "kills": dict(self.kills),
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+def _apply_limits(memory_mb: Optional[int], cpu_seconds: Optional[int]) -> None:
+    if resource is None:
+        return
+    if memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if cpu_seconds:
+        # Soft limit sends SIGXCPU; the hard limit a second later is SIGKILL.
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+
+
+def _caused_by_memory(error: Optional[BaseException]) -> bool:
+    # Renderers wrap failures (WeasyRenderer raises RuntimeError from the original).
+    while error is not None:
+        if isinstance(error, MemoryError):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _child(renderer, method, args, memory_mb, cpu_seconds, conn) -> None:
+    try:
+        _apply_limits(memory_mb, cpu_seconds)
+        conn.send(("ok", getattr(renderer, method)(*args)))
+    except BaseException as e:
+        if _caused_by_memory(e):
+            conn.send(("memory", "out of memory"))
+        else:
+            conn.send(("error", str(e) or type(e).__name__))
+    finally:
+        conn.close()
+
+
+def check_limits(
+    timeout: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+    cpu_seconds: Optional[int] = None,
+) -> bool:
+    """
+    Raise ValueError for a limit that is set but not positive; return whether
+    any limit is set (and so whether renders need isolating).
+    """
+    limits = {"timeout": timeout, "memory_mb": memory_mb, "cpu_seconds": cpu_seconds}
+    for name, value in limits.items():
+        if value is not None and value <= 0:
+            raise ValueError(f"{name} must be positive, got {value}")
+    return any(value is not None for value in limits.values())
+
+
+class IsolatedRenderer:
+    """`RenderService` that runs the wrapped renderer in a resource-limited child process."""
+
+    def __init__(
+        self,
+        renderer: RenderService,
+        timeout: Optional[float] = None,
+        memory_mb: Optional[int] = None,
+        cpu_seconds: Optional[int] = None,
+    ):
+        check_limits(timeout, memory_mb, cpu_seconds)
+        self.renderer = renderer
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self.metrics = RenderMetrics()
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+    def render_pdf(self, deck: Deck, output_path: Path) -> None:
+        self._run("render_pdf", deck, output_path)
+
+    def render_html(self, deck: Deck, output_path: Path) -> None:
+        self._run("render_html", deck, output_path)
+
+    def render_pdf_split(
+        self, deck: Deck, output_path: Path, pages_per_file: int, max_workers: int = 1
+    ) -> list[Path]:
+        return self._run("render_pdf_split", deck, output_path, pages_per_file, max_workers)
+
+    def render_html_pages(
+        self,
+        deck: Deck,
+        output_dir: Path,
+        cards_per_page: int,
+        max_workers: Optional[int] = None,
+    ) -> list[Path]:
+        return self._run("render_html_pages", deck, output_dir, cards_per_page, max_workers)
+
+    def render_packed(self, decks: list[Deck], output_path: Path, fmt: str = "pdf") -> int:
+        return self._run("render_packed", decks, output_path, fmt)
+
+    def _run(
+        self, method: str, deck: Union[Deck, list[Deck]], output_path: Path, *extra: Any
+    ) -> Any:
+        self.metrics.renders += 1
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_child,
+            args=(
+                self.renderer,
+                method,
+                (deck, output_path, *extra),
+                self.memory_mb,
+                self.cpu_seconds,
+                sender,
+            ),
+            daemon=True,
+        )
+        started = time.monotonic()
+        process.start()
+        sender.close()
+
+        outcome = None
+        timed_out = not receiver.poll(self.timeout)  # Also wakes if the child dies
+        if not timed_out:
+            try:
+                outcome = receiver.recv()
+            except EOFError:  # Child died before reporting
+                pass
+        else:
+            process.kill()
+        process.join()
+        receiver.close()
+        self.metrics.max_seconds = max(self.metrics.max_seconds, time.monotonic() - started)
+
+        if outcome is not None and outcome[0] == "ok":
+            self.metrics.completed += 1
+            return outcome[1]
+        if outcome is not None and outcome[0] == "error":
+            self.metrics.failed += 1
+            raise RuntimeError(outcome[1])
+
+        if timed_out:
+            kind, detail = "timeout", f"exceeded {self.timeout}s"
+        elif outcome is not None:
+            kind, detail = "memory", f"exceeded {self.memory_mb} MB"
+        elif self.cpu_seconds and process.exitcode in (-signal.SIGXCPU, -signal.SIGKILL):
+            kind, detail = "cpu", f"exceeded {self.cpu_seconds}s of CPU time"
+        else:
+            self.metrics.failed += 1
+            raise RuntimeError(f"Render process exited with code {process.exitcode}")
+        self.metrics.kills[kind] += 1
+        if not Path(output_path).is_dir():  # Paginated HTML writes into a directory; keep it
+            Path(output_path).unlink(missing_ok=True)
+        name = deck.name if isinstance(deck, Deck) else " + ".join(d.name for d in deck)
+        raise RenderLimitExceeded(kind, f"Render of '{name}' {detail}")
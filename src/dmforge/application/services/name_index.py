@@ -0,0 +1,88 @@
+from bisect import bisect_left
+from typing import Optional
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(str(name).split()).casefold()
+
+
+def _within_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """Levenshtein distance between `a` and `b`, or None once it must exceed `limit`."""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class SpellNameIndex:
+    """
+    Resolves spell names to spell IDs (corpus positions).
+
+    Lookups try, in order: an exact match on the normalized name (hash map),
+    a unique prefix match (bisect over the sorted names), then the closest
+    name within `max_distance` edits. Typo lookups only compare against
+    names whose length is within `max_distance` of the query.
+    """
+
+    def __init__(self, spells: list[dict], fingerprint: str = "", max_distance: int = 2):
+        self.fingerprint = fingerprint
+        self.max_distance = max_distance
+        self._exact: dict[str, int] = {}
+        for spell_id, spell in enumerate(spells):
+            self._exact.setdefault(normalize_name(spell.get("name", "")), spell_id)
+        self._sorted = sorted(self._exact)
+        self._by_length: dict[int, list[str]] = {}
+        for name in self._sorted:
+            self._by_length.setdefault(len(name), []).append(name)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def lookup(self, name: str) -> Optional[int]:
+        key = normalize_name(name)
+        if not key:
+            return None
+        if key in self._exact:
+            return self._exact[key]
+
+        prefixed = self.prefix(key, limit=2)
+        if len(prefixed) == 1:
+            return prefixed[0]
+
+        best: Optional[tuple[int, str]] = None
+        for length in range(len(key) - self.max_distance, len(key) + self.max_distance + 1):
+            for candidate in self._by_length.get(length, ()):
+                limit = best[0] if best else self.max_distance
+                distance = _within_distance(key, candidate, limit)
+                if distance is not None and (best is None or (distance, candidate) < best):
+                    best = (distance, candidate)
+        return self._exact[best[1]] if best else None
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> list[int]:
+        """Spell IDs whose normalized name starts with `prefix`, in name order."""
+        key = normalize_name(prefix)
+        results = []
+        for name in self._sorted[bisect_left(self._sorted, key) :]:
+            if not name.startswith(key) or (limit is not None and len(results) >= limit):
+                break
+            results.append(self._exact[name])
+        return results
+
+    def resolve(self, names: list[str]) -> tuple[list[int], list[str]]:
+        """Resolve `names` in order, dropping repeats; returns (spell IDs, unresolved names)."""
+        found: dict[int, None] = {}
+        missing = []
+        for name in names:
+            spell_id = self.lookup(name)
+            if spell_id is None:
+                missing.append(name)
+            else:
+                found.setdefault(spell_id)
+        return list(found), missing
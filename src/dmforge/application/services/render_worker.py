@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from dmforge.application.controllers.render_controller import RenderController
+from dmforge.application.ports.render_queue import RenderJob, RenderQueue
+from dmforge.application.ports.render_service import RenderLimitExceeded
+
+
+class RenderWorker:
+    """
+    Pulls jobs from a `RenderQueue` and renders them one at a time.
+
+    Controllers are built by `make_controller(params)` once per distinct
+    render configuration (template, assets, layout) and reused, so the
+    template environment, text-fit cache and asset cache stay warm across
+    jobs. Run several workers, in separate processes, to scale throughput.
+
+    While a job renders, its lease is renewed every `heartbeat` seconds
+    (default: a third of the queue's `lease_seconds`). Output is rendered to
+    a temp file beside the target and only moved into place by the queue's
+    fenced `complete`, so a worker that lost its lease never clobbers the
+    output of the worker that took the job over.
+    """
+
+    def __init__(
+        self,
+        queue: RenderQueue,
+        make_controller: Callable[[dict], RenderController],
+        name: Optional[str] = None,
+        poll_interval: float = 1.0,
+        heartbeat: Optional[float] = None,
+    ):
+        self.queue = queue
+        self.make_controller = make_controller
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.heartbeat = heartbeat or getattr(queue, "lease_seconds", 600.0) / 3
+        self.processed = 0
+        self.kills: dict[str, int] = {}
+        self._controllers: dict[str, RenderController] = {}
+
+    def _controller(self, params: dict) -> RenderController:
+        config = {k: v for k, v in params.items() if k != "format"}
+        key = json.dumps(config, sort_keys=True)
+        if key not in self._controllers:
+            self._controllers[key] = self.make_controller(config)
+        return self._controllers[key]
+
+    @contextmanager
+    def _renewing(self, job: RenderJob) -> Iterator[None]:
+        stop = threading.Event()
+
+        def renew() -> None:
+            while not stop.wait(self.heartbeat):
+                if not self.queue.renew(job.id, self.name):
+                    logging.warning(f"⚠️ Job {job.id}: lost its lease while rendering")
+                    return
+
+        thread = threading.Thread(target=renew, name=f"lease-{job.id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def process(self, job: RenderJob) -> None:
+        output = Path(job.output_path)
+        # One temp file per lease: attempts go up with every claim.
+        staged = output.with_name(f".{output.stem}.{job.id}-{job.attempts}.tmp{output.suffix}")
+        try:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with self._renewing(job):
+                self._controller(job.params).render_from_file(
+                    Path(job.input_path), job.params.get("format", "pdf"), staged
+                )
+        except RenderLimitExceeded as e:
+            # Over-limit decks fail the same way every time, so don't retry them.
+            self.kills[e.kind] = self.kills.get(e.kind, 0) + 1
+            logging.warning(f"⚠️ Job {job.id} killed ({e.kind}): {e}")
+            recorded = self.queue.fail(job.id, self.name, str(e), retry=False)
+        except Exception as e:
+            logging.warning(f"⚠️ Job {job.id} failed (attempt {job.attempts}): {e}")
+            recorded = self.queue.fail(job.id, self.name, str(e))
+        else:
+            recorded = self.queue.complete(job.id, self.name, staged)
+        staged.unlink(missing_ok=True)
+        if not recorded:
+            logging.warning(f"⚠️ Job {job.id}: lease expired, result left to its new worker")
+        self.processed += 1
+
+    def run(self, drain: bool = False, max_jobs: Optional[int] = None) -> int:
+        """
+        Process jobs until `max_jobs` have run, or, with `drain`, until no job
+        is queued, waiting to retry or running. Returns the number processed.
+        """
+        start = self.processed
+        while max_jobs is None or self.processed - start < max_jobs:
+            job = self.queue.claim(self.name)
+            if job is not None:
+                self.process(job)
+                continue
+            if drain and self.queue.pending() == 0:
+                break
+            time.sleep(self.poll_interval)
+        return self.processed - start
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from dmforge.application.ports.result_cache import ResultCache
+from dmforge.domain.models import DeckOptions
+
+
+def corpus_fingerprint(spells: list[dict]) -> str:
+    """Content hash of a spell corpus, independent of dict key order."""
+    payload = json.dumps(spells, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def result_key(fingerprint: str, options: DeckOptions) -> str:
+    """
+    Cache key for a filter result. The deck name does not affect which spells
+    match, so it is left out of the key.
+    """
+    normalized = options.normalized()
+    payload = json.dumps(
+        {
+            "corpus": fingerprint,
+            "classes": normalized.classes,
+            "levels": normalized.levels,
+            "schools": normalized.schools,
+            "search": normalized.search,
+            "search_mode": normalized.search_mode,
+            "spells": normalized.spells,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUResultCache:
+    """
+    In-memory LRU of filter results (ordered corpus indices), optionally
+    backed by a slower second-tier cache such as `JSONResultCache`. Safe to
+    share between threads; backing-cache I/O runs outside the lock.
+    """
+
+    def __init__(self, max_entries: int = 128, backing: Optional[ResultCache] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.backing = backing
+        self._entries: OrderedDict[str, list[int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[list[int]]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return list(self._entries[key])
+        if self.backing is None:
+            return None
+        spell_ids = self.backing.get(key)
+        if spell_ids is not None:
+            self._remember(key, spell_ids)
+        return spell_ids
+
+    def put(self, key: str, spell_ids: list[int]) -> None:
+        self._remember(key, spell_ids)
+        if self.backing is not None:
+            self.backing.put(key, spell_ids)
+
+    def _remember(self, key: str, spell_ids: list[int]) -> None:
+        with self._lock:
+            self._entries[key] = list(spell_ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
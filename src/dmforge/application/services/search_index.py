@@ -0,0 +1,138 @@
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+SEARCH_MODES = ("token", "substring", "fuzzy")
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _trigrams(token: str) -> set[str]:
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _spell_text(spell: dict) -> str:
+    desc = spell.get("desc", "")
+    if isinstance(desc, list):
+        desc = " ".join(str(part) for part in desc)
+    return f"{spell.get('name', '')} {desc}"
+
+
+class SpellSearchIndex:
+    """
+    Inverted index over spell names and descriptions, ranked with BM25.
+
+    Postings map each token to ``[spell_id, term_frequency]`` pairs, where a
+    spell ID is the spell's position in the corpus. With ``trigrams=True`` a
+    second index from character trigrams to vocabulary tokens supports
+    substring ("fire" finds "fireball") and fuzzy ("firebal") queries without
+    scanning the vocabulary.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(
+        self,
+        fingerprint: str,
+        postings: dict[str, list[list[int]]],
+        doc_lengths: list[int],
+        trigrams: Optional[dict[str, list[str]]] = None,
+    ):
+        self.fingerprint = fingerprint
+        self.postings = postings
+        self.doc_lengths = doc_lengths
+        self.trigrams = trigrams
+        self._avg_length = (sum(doc_lengths) / len(doc_lengths)) if doc_lengths else 0.0
+
+    @classmethod
+    def build(
+        cls, spells: list[dict], fingerprint: str, trigrams: bool = False
+    ) -> "SpellSearchIndex":
+        postings: dict[str, list[list[int]]] = {}
+        doc_lengths = []
+        for spell_id, spell in enumerate(spells):
+            tokens = tokenize(_spell_text(spell))
+            doc_lengths.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                postings.setdefault(token, []).append([spell_id, tf])
+
+        trigram_index = None
+        if trigrams:
+            trigram_index = {}
+            for token in postings:
+                for gram in _trigrams(token):
+                    trigram_index.setdefault(gram, []).append(token)
+        return cls(fingerprint, postings, doc_lengths, trigram_index)
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def search(self, query: str, mode: str = "token", limit: Optional[int] = None) -> list[int]:
+        """Return spell IDs matching any query term, best match first."""
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unsupported search mode: {mode}. Use one of {SEARCH_MODES}")
+        if mode != "token" and self.trigrams is None:
+            raise ValueError(f"Search mode '{mode}' requires an index built with trigrams")
+
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            for token in self._expand(term, mode):
+                self._score(token, scores)
+
+        ranked = sorted(scores, key=lambda spell_id: (-scores[spell_id], spell_id))
+        return ranked if limit is None else ranked[:limit]
+
+    def _expand(self, term: str, mode: str) -> list[str]:
+        if mode == "token":
+            return [term] if term in self.postings else []
+
+        grams = _trigrams(term)
+        if mode == "substring":
+            inner = [g for g in grams if " " not in g]
+            if not inner:
+                # Terms under three characters have no interior trigram to look up.
+                return [t for t in self.postings if term in t]
+            candidates = set(self.trigrams.get(inner[0], ()))
+            for gram in inner[1:]:
+                candidates.intersection_update(self.trigrams.get(gram, ()))
+            return [t for t in candidates if term in t]
+
+        # Fuzzy: Dice similarity over padded trigram sets.
+        counts = Counter(token for gram in grams for token in self.trigrams.get(gram, ()))
+        return [t for t, n in counts.items() if 2 * n / (len(grams) + len(_trigrams(t))) >= 0.6]
+
+    def _score(self, token: str, scores: dict[int, float]) -> None:
+        postings = self.postings.get(token)
+        if not postings:
+            return
+        n = len(self.doc_lengths)
+        idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+        for spell_id, tf in postings:
+            norm = 1 - self.B + self.B * self.doc_lengths[spell_id] / (self._avg_length or 1)
+            scores[spell_id] = scores.get(spell_id, 0.0) + idf * tf * (self.K1 + 1) / (
+                tf + self.K1 * norm
+            )
+
+    def to_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "postings": self.postings,
+            "doc_lengths": self.doc_lengths,
+            "trigrams": self.trigrams,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpellSearchIndex":
+        return cls(
+            fingerprint=data["fingerprint"],
+            postings=data["postings"],
+            doc_lengths=data["doc_lengths"],
+            trigrams=data.get("trigrams"),
+        )
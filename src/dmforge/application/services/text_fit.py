@@ -0,0 +1,175 @@
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from dmforge.application.ports.font_metrics import FontMetrics
+
+_WORD = re.compile(r"\S+")
+
+# Times-Roman advance widths (per 1000 em) from the Adobe core font AFM.
+_TIMES_ROMAN = {
+    " ": 250, "!": 333, '"': 408, "#": 500, "$": 500, "%": 833, "&": 778, "'": 333,
+    "(": 333, ")": 333, "*": 500, "+": 564, ",": 250, "-": 333, ".": 250, "/": 278,
+    ":": 278, ";": 278, "<": 564, "=": 564, ">": 564, "?": 444, "@": 921, "[": 333,
+    "]": 333, "_": 500, "A": 722, "B": 667, "C": 667, "D": 722, "E": 611, "F": 556,
+    "G": 722, "H": 722, "I": 333, "J": 389, "K": 722, "L": 611, "M": 889, "N": 722,
+    "O": 722, "P": 556, "Q": 722, "R": 667, "S": 556, "T": 611, "U": 722, "V": 722,
+    "W": 944, "X": 722, "Y": 722, "Z": 611, "a": 444, "b": 500, "c": 444, "d": 500,
+    "e": 444, "f": 333, "g": 500, "h": 500, "i": 278, "j": 278, "k": 500, "l": 278,
+    "m": 778, "n": 500, "o": 500, "p": 500, "q": 500, "r": 333, "s": 389, "t": 278,
+    "u": 500, "v": 500, "w": 722, "x": 500, "y": 500, "z": 444,
+}  # fmt: skip
+
+
+class AFMFontMetrics:
+    """Fixed advance-width table; characters outside it use `default` (per 1000 em)."""
+
+    def __init__(self, name: str, widths: dict[str, int], default: int = 500):
+        self.name = name
+        self._widths = widths
+        self._default = default
+
+    def advance(self, char: str) -> float:
+        if "0" <= char <= "9":
+            return 0.5
+        return self._widths.get(char, self._default) / 1000
+
+
+TIMES_ROMAN = AFMFontMetrics("Times-Roman", _TIMES_ROMAN)
+
+
+@dataclass(frozen=True)
+class TextFit:
+    """
+    Largest font size (pt) at which `text` fits its box. If it doesn't fit even
+    at the minimum size, `overflow` is set and `split` is the character offset
+    where the box fills up.
+    """
+
+    font_size: float
+    lines: int
+    overflow: bool = False
+    split: Optional[int] = None
+
+    def clip(self, text: str) -> str:
+        """`text` cut at `split` with an ellipsis if it overflows, else unchanged."""
+        if self.split is None:
+            return text
+        return text[: self.split].rstrip() + "…"
+
+
+class TextFitter:
+    """
+    Picks a font size per text block by measuring it against a box, with no
+    rendering involved.
+
+    Words are measured once from per-character advances and wrapped greedily
+    at each candidate size; the size is binary-searched between `min_size`
+    and `max_size` in `step` increments. Results are memoized by
+    (text hash, font, box size), and word widths by (font, word), so a deck
+    re-render only measures descriptions it hasn't seen. Safe to share between
+    threads; fitting itself runs outside the lock.
+    """
+
+    def __init__(
+        self,
+        metrics: FontMetrics = TIMES_ROMAN,
+        min_size: float = 6.0,
+        max_size: float = 10.0,
+        step: float = 0.25,
+        line_height: float = 1.2,
+        slack: float = 0.95,
+        max_entries: int = 4096,
+    ):
+        if min_size > max_size:
+            raise ValueError("min_size must not exceed max_size")
+        self.metrics = metrics
+        self.min_size = min_size
+        self.max_size = max_size
+        self.step = step
+        self.line_height = line_height
+        self.slack = slack  # Headroom for renderer font substitution and kerning
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._fits: OrderedDict[tuple, TextFit] = OrderedDict()
+        self._words: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def fit(self, text: str, width: float, height: float) -> TextFit:
+        """Fit `text` into a `width` x `height` inch box."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        key = (digest, self.metrics.name, round(width, 4), round(height, 4))
+        with self._lock:
+            cached = self._fits.get(key)
+            if cached is not None:
+                self.hits += 1
+                self._fits.move_to_end(key)
+                return cached
+            self.misses += 1
+
+        result = self._fit(text, width, height)
+        with self._lock:
+            self._fits[key] = result
+            self._fits.move_to_end(key)
+            while len(self._fits) > self.max_entries:
+                self._fits.popitem(last=False)
+        return result
+
+    def _word_width(self, word: str) -> float:
+        width = self._words.get(word)
+        if width is None:
+            width = sum(self.metrics.advance(c) for c in word)
+            with self._lock:
+                self._words[word] = width
+        return width
+
+    def _fit(self, text: str, width: float, height: float) -> TextFit:
+        # (offset, em width, starts a new paragraph) per word
+        words = []
+        last_end = 0
+        for match in _WORD.finditer(text):
+            newline = "\n" in text[last_end : match.start()]
+            words.append((match.start(), self._word_width(match.group()), newline))
+            last_end = match.end()
+
+        steps = int(round((self.max_size - self.min_size) / self.step))
+        lo, hi, best = 0, steps, None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            size = self.min_size + mid * self.step
+            lines, split = self._wrap(words, width, height, size)
+            if split is None:
+                best, lo = (size, lines), mid + 1
+            else:
+                hi = mid - 1
+
+        if best is not None:
+            return TextFit(font_size=best[0], lines=best[1])
+        lines, split = self._wrap(words, width, height, self.min_size)
+        return TextFit(font_size=self.min_size, lines=lines, overflow=True, split=split)
+
+    def _wrap(
+        self, words: list[tuple[int, float, bool]], width: float, height: float, size: float
+    ) -> tuple[int, Optional[int]]:
+        """Line count at `size`, plus the offset of the first word that falls outside the box."""
+        line_em = width * 72 * self.slack / size
+        max_lines = int(height * 72 / (size * self.line_height))
+        space = self.metrics.advance(" ")
+        lines, used, split = 1, 0.0, None
+        for offset, word_em, newline in words:
+            if newline or (used and used + space + word_em > line_em):
+                lines += 1
+                used = 0.0
+            if word_em > line_em:
+                lines += math.ceil(word_em / line_em) - 1
+                used = word_em % line_em
+            else:
+                used += (space if used else 0.0) + word_em
+            if split is None and lines > max_lines:
+                split = offset
+        return lines, split
@@ -1,10 +1,18 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 import pydyf  # ✅ needed for version check
 import weasyprint
+from dmforge.application.services.card_layout import LAYOUTS, LayoutSpec, Page, pack, paginate
+from dmforge.application.services.html_site_renderer import (
+    DEFAULT_TEMPLATE_DIR,
+    PaginatedHTMLRenderer,
+)
+from dmforge.application.services.text_fit import TextFit, TextFitter
 from dmforge.domain.models import Deck
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, meta, select_autoescape
 from packaging.version import parse as vparse
 from weasyprint import HTML
 
@@ -15,11 +23,24 @@ if vparse(pydyf.__version__) >= vparse("0.11.0"):
     raise RuntimeError("❌ pydyf >= 0.11.0 breaks PDF constructor compatibility. Pin to 0.10.0.")
 
 
+def split_output_path(output_path: Path, first: int, last: int) -> Path:
+    return output_path.with_name(f"{output_path.stem}_{first:03d}-{last:03d}{output_path.suffix}")
+
+
 class WeasyRenderer:
-    def __init__(self, template_dir: Path, asset_dir: Path, verbose: bool = False):
+    def __init__(
+        self,
+        template_dir: Path,
+        asset_dir: Path,
+        verbose: bool = False,
+        layout: LayoutSpec = LAYOUTS["6up"],
+        fitter: Optional[TextFitter] = None,
+    ):
         self.template_dir = template_dir
         self.asset_dir = asset_dir
         self.verbose = verbose
+        self.layout = layout
+        self.fitter = fitter or TextFitter()
         self.env = self._setup_jinja_env()
 
         if verbose:
@@ -28,10 +49,12 @@ class WeasyRenderer:
             logging.getLogger("weasyprint").setLevel(logging.WARNING)
 
     def _setup_jinja_env(self) -> Environment:
-        return Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
+        # Custom template directories may override only some templates, e.g. a
+        # copied deck.html.j2 still imports the bundled _sheets.html.j2.
+        loader = ChoiceLoader(
+            [FileSystemLoader(str(self.template_dir)), FileSystemLoader(str(DEFAULT_TEMPLATE_DIR))]
         )
+        return Environment(loader=loader, autoescape=select_autoescape(["html", "xml"]))
 
     def render_html(self, deck: Deck, output_path: str) -> None:
         try:
@@ -44,6 +67,13 @@ class WeasyRenderer:
             logging.error(f"❌ HTML rendering failed: {str(e)}")
             raise RuntimeError(f"HTML rendering failed: {str(e)}") from e  # ✅ fix
 
+    def render_html_pages(
+        self, deck: Deck, output_dir: Path, cards_per_page: int, max_workers: Optional[int] = None
+    ) -> list[Path]:
+        """Write a paginated HTML proof directory; see `PaginatedHTMLRenderer`."""
+        site = PaginatedHTMLRenderer(self.template_dir, self.layout, self.fitter, max_workers)
+        return site.render(deck, output_dir, cards_per_page)
+
     def render_pdf(self, deck: Deck, output_path: Path) -> None:
         try:
             html_string = self._render_html_content(deck)
@@ -61,6 +91,82 @@ class WeasyRenderer:
             logging.error(f"❌ PDF rendering failed: {str(e)}")
             raise RuntimeError(f"PDF rendering failed: {str(e)}") from e  # ✅ fix
 
+    def render_pdf_split(
+        self, deck: Deck, output_path: Path, pages_per_file: int, max_workers: int = 1
+    ) -> list[Path]:
+        """
+        Lay the deck out once and write it as several PDFs of `pages_per_file`
+        sheets each, named `<stem>_<first>-<last>.pdf` next to `output_path`.
+        Files are written one after another from the same laid-out document.
+        `max_workers` > 1 writes them from threads, but the page copies share
+        font objects that WeasyPrint mutates while subsetting and does not
+        document as thread-safe, so the default stays sequential.
+        """
+        if pages_per_file < 1:
+            raise ValueError("pages_per_file must be at least 1")
+        try:
+            html = HTML(string=self._render_html_content(deck), base_url=str(self.asset_dir))
+            document = html.render()
+            groups = [
+                (start, document.pages[start : start + pages_per_file])
+                for start in range(0, len(document.pages), pages_per_file)
+            ]
+            targets = [
+                split_output_path(output_path, start + 1, start + len(pages))
+                for start, pages in groups
+            ]
+
+            if self.verbose:
+                logging.info(f"🔍 Writing {len(document.pages)} pages as {len(targets)} PDFs")
+
+            def write(index: int) -> None:
+                document.copy(groups[index][1]).write_pdf(target=str(targets[index]))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(write, range(len(targets))))
+            return targets
+        except Exception as e:
+            logging.error(f"❌ PDF rendering failed: {str(e)}")
+            raise RuntimeError(f"PDF rendering failed: {str(e)}") from e
+
+    def render_packed(self, decks: list[Deck], output_path: Path, fmt: str = "pdf") -> int:
+        """
+        Render several decks on shared sheets (see `card_layout.pack`) in a
+        single pass, each card marked with its deck. Returns the sheet count.
+
+        Raises ValueError if deck.html.j2 doesn't lay out `pages`: a template
+        that iterates `deck.cards` would silently drop the packing.
+        """
+        if not self._template_uses("deck.html.j2", "pages"):
+            raise ValueError(
+                "deck.html.j2 does not use `pages`, so it cannot render packed sheets; "
+                "base it on the bundled template"
+            )
+        try:
+            combined = Deck(
+                name=" + ".join(deck.name for deck in decks),
+                cards=[card for deck in decks for card in deck.cards],
+            )
+            pages = pack([list(deck.cards) for deck in decks], self.layout)
+            html_string = self._render_html_content(
+                combined, pages=pages, decks=[deck.name for deck in decks]
+            )
+            if self.verbose:
+                separate = sum(len(paginate(list(d.cards), self.layout)) for d in decks)
+                logging.info(
+                    f"🔍 Packed {len(decks)} decks onto {len(pages)} sheets ({separate} unpacked)"
+                )
+            if fmt == "pdf":
+                HTML(string=html_string, base_url=str(self.asset_dir)).write_pdf(
+                    target=str(output_path)
+                )
+            else:
+                Path(output_path).write_text(html_string, encoding="utf-8")
+            return len(pages)
+        except Exception as e:
+            logging.error(f"❌ Packed rendering failed: {str(e)}")
+            raise RuntimeError(f"Packed rendering failed: {str(e)}") from e
+
     @staticmethod
     def check_pdf_dependencies() -> dict:
         try:
@@ -87,6 +193,33 @@ class WeasyRenderer:
                 "error": str(e),
             }
 
-    def _render_html_content(self, deck: Deck) -> str:
+    def _fit_descriptions(self, deck: Deck) -> dict[tuple[str, bool], TextFit]:
+        fits = {}
+        for card in deck.cards:
+            key = (card.description, bool(card.art_path))
+            if key not in fits:
+                fits[key] = self.fitter.fit(card.description, *self.layout.description_box(key[1]))
+                if fits[key].overflow:
+                    logging.warning(
+                        f"⚠️ Description of '{card.name}' overflows its card at "
+                        f"{fits[key].font_size}pt (cut at character {fits[key].split})"
+                    )
+        return fits
+
+    def _template_uses(self, name: str, variable: str) -> bool:
+        source, _, _ = self.env.loader.get_source(self.env, name)
+        return variable in meta.find_undeclared_variables(self.env.parse(source))
+
+    def _render_html_content(
+        self, deck: Deck, pages: Optional[list[Page]] = None, decks: Optional[list[str]] = None
+    ) -> str:
+        # Pages, slots and description font sizes are fixed here, so WeasyPrint
+        # only places boxes and never decides where a page breaks.
         template = self.env.get_template("deck.html.j2")
-        return template.render(deck=deck)
+        return template.render(
+            deck=deck,
+            layout=self.layout,
+            pages=pages if pages is not None else paginate(deck.cards, self.layout),
+            fits=self._fit_descriptions(deck),
+            decks=decks,
+        )
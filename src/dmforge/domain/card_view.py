@@ -0,0 +1,93 @@
+"""
+Shared card storage for derived decks.
+
+A `CardPool` is an immutable tuple of cards; a `CardView` is a pool plus an
+array of positions in it. Deriving a deck from another (filtering, slicing,
+set operations) builds a new index array over the same pool, so cards are
+never copied and a derived deck costs four bytes per card.
+"""
+
+from array import array
+from typing import Callable, Iterable, Iterator, Sequence, Union, overload
+
+
+class CardPool:
+    def __init__(self, cards: Iterable):
+        self.cards = tuple(cards)
+        self._positions: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def position(self, card) -> int:
+        """Position of the first card with `card`'s content hash, or -1."""
+        if not self._positions and self.cards:
+            for i in range(len(self.cards) - 1, -1, -1):
+                self._positions[self.cards[i].content_hash] = i
+        return self._positions.get(card.content_hash, -1)
+
+    def extended(self, cards: Iterable) -> "CardPool":
+        """A new pool with `cards` appended; existing positions stay valid."""
+        return CardPool(self.cards + tuple(cards))
+
+
+class CardView(Sequence):
+    """Read-only sequence of cards: positions into a shared `CardPool`."""
+
+    def __init__(self, pool: CardPool, indices: Union[array, Iterable[int], None] = None):
+        self.pool = pool
+        if indices is None:
+            indices = range(len(pool))
+        self.indices = indices if isinstance(indices, array) else array("I", indices)
+
+    @classmethod
+    def of(cls, cards: Sequence) -> "CardView":
+        return cards if isinstance(cards, CardView) else cls(CardPool(cards))
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, i: int): ...
+    @overload
+    def __getitem__(self, i: slice) -> "CardView": ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CardView(self.pool, self.indices[i])
+        return self.pool.cards[self.indices[i]]
+
+    def __iter__(self) -> Iterator:
+        cards = self.pool.cards
+        return (cards[i] for i in self.indices)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CardView) and other.pool is self.pool:
+            return self.indices == other.indices
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"CardView({len(self)} of {len(self.pool)} pooled cards)"
+
+    def select(self, keep: Callable[[int, object], bool]) -> "CardView":
+        """Positions whose card passes `keep(position, card)`, in view order."""
+        cards = self.pool.cards
+        return CardView(self.pool, array("I", (i for i in self.indices if keep(i, cards[i]))))
+
+    def concat(self, other: "CardView") -> "CardView":
+        """
+        `self` followed by `other`. Stays on `self`'s pool when `other` shares it;
+        otherwise only `other`'s cards missing from the pool (by content hash)
+        are appended to a new pool, which references them rather than copying.
+        """
+        if other.pool is self.pool:
+            return CardView(self.pool, self.indices + other.indices)
+        pool, extra, mapped = self.pool, {}, array("I")
+        for card in other:
+            position = pool.position(card)
+            if position < 0:
+                position = extra.setdefault(card.content_hash, (len(pool) + len(extra), card))[0]
+            mapped.append(position)
+        if extra:
+            pool = pool.extended(card for _, card in extra.values())
+        return CardView(pool, self.indices + mapped)
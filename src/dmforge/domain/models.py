@@ -4,44 +4,220 @@ Domain models for DMForge: SpellCard, Deck, DeckOptions
 These are pure Python types with no dependencies or side effects.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import hashlib
+import json
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import Any, Callable, List, Optional, Protocol, Tuple, Union
+
+from dmforge.domain.card_view import CardView
+
+
+class TextSource(Protocol):
+    def read(self, offset: int, length: int) -> str: ...
+
+
+class LazyText:
+    """
+    A description not read yet: `length` bytes at `offset` of a text source,
+    such as a memory-mapped blob. Pickling resolves it to a plain str.
+    """
+
+    __slots__ = ("source", "offset", "length")
+
+    def __init__(self, source: TextSource, offset: int, length: int):
+        self.source = source
+        self.offset = offset
+        self.length = length
+
+    def resolve(self) -> str:
+        return self.source.read(self.offset, self.length)
+
+    def __str__(self) -> str:
+        return self.resolve()
+
+    def __reduce__(self):
+        return (str, (self.resolve(),))
+
+
+class ResolvedOnRead:
+    """
+    Data descriptor for a dataclass field that may be given as a LazyText:
+    the text is read on first access and kept from then on. Has no class-level
+    value, so the field stays required.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> str:
+        if obj is None:
+            raise AttributeError(self.name)
+        value = obj.__dict__[self.name]
+        if isinstance(value, LazyText):
+            value = obj.__dict__[self.name] = value.resolve()
+        return value
+
+    def __set__(self, obj: Any, value: Union[str, LazyText]) -> None:
+        # Frozen dataclasses only get here from their generated __init__.
+        obj.__dict__[self.name] = value
 
 
 @dataclass(frozen=True)
 class SpellCard:
-    """A single spell card with optional art."""
+    """
+    A single spell card with optional art.
+
+    `description` may be given as a LazyText; it is read on first access
+    and kept from then on.
+    """
 
     name: str
     level: int
     school: str
     classes: List[str]
-    description: str
+    description: str = ResolvedOnRead()  # type: ignore[assignment]
     duration: str
     art_path: Optional[str] = None  # Local image path or None
 
+    def to_dict(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA-256 of the card's fields; computed on first use, then memoized."""
+        payload = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class DeckDiff:
+    """Card-level differences between two decks, matched by card name."""
+
+    added: List[SpellCard] = field(default_factory=list)
+    removed: List[SpellCard] = field(default_factory=list)
+    changed: List[Tuple[SpellCard, SpellCard]] = field(default_factory=list)  # (old, new)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self) -> dict:
+        return {
+            "added": [card.name for card in self.added],
+            "removed": [card.name for card in self.removed],
+            "changed": [new.name for _, new in self.changed],
+        }
+
 
 @dataclass(frozen=True)
 class Deck:
-    """A collection of spell cards with metadata."""
+    """
+    A collection of spell cards with metadata.
+
+    The set-like methods (union, intersection, difference, filter, sorted,
+    slice) return decks whose `cards` is a `CardView` over this deck's card
+    storage, so deriving decks copies index arrays, never cards. Set
+    operations match cards by content hash.
+    """
 
     name: str
-    cards: List[SpellCard]
+    cards: List[SpellCard]  # A CardView for derived decks
     version: str = "v1"
 
+    @cached_property
+    def _view(self) -> CardView:
+        return CardView.of(self.cards)
+
+    @cached_property
+    def _hashes(self) -> frozenset:
+        return frozenset(card.content_hash for card in self._view)
+
+    def _derive(self, view: CardView, name: Optional[str]) -> "Deck":
+        return Deck(name=name or self.name, cards=view, version=self.version)
+
+    def union(self, other: "Deck", name: Optional[str] = None) -> "Deck":
+        """This deck's cards, then `other`'s cards not already in it."""
+        seen = set(self._hashes)
+
+        def unseen(_: int, card: SpellCard) -> bool:
+            if card.content_hash in seen:
+                return False
+            seen.add(card.content_hash)
+            return True
+
+        return self._derive(self._view.concat(other._view.select(unseen)), name)
+
+    def intersection(self, other: "Deck", name: Optional[str] = None) -> "Deck":
+        keep = other._hashes
+        return self._derive(self._view.select(lambda _, card: card.content_hash in keep), name)
+
+    def difference(self, other: "Deck", name: Optional[str] = None) -> "Deck":
+        drop = other._hashes
+        return self._derive(self._view.select(lambda _, card: card.content_hash not in drop), name)
+
+    def filter(self, predicate: Callable[[SpellCard], bool], name: Optional[str] = None) -> "Deck":
+        return self._derive(self._view.select(lambda _, card: predicate(card)), name)
+
+    def sorted(
+        self, key: Callable[[SpellCard], Any], reverse: bool = False, name: Optional[str] = None
+    ) -> "Deck":
+        view = self._view
+        cards = view.pool.cards
+        order = sorted(view.indices, key=lambda i: key(cards[i]), reverse=reverse)
+        return self._derive(CardView(view.pool, order), name)
+
+    def slice(
+        self, start: Optional[int] = None, stop: Optional[int] = None, name: Optional[str] = None
+    ) -> "Deck":
+        return self._derive(self._view[start:stop], name)
+
     def to_dict(self) -> dict:
         """Convert the deck to a dict for serialization."""
         return {
             "name": self.name,
             "version": self.version,
-            "cards": [card.__dict__ for card in self.cards],
+            "cards": [card.to_dict() for card in self.cards],
         }
 
-    def to_json(self) -> str:
-        """Convert the deck to a JSON string (requires manual import in adapter)."""
-        import json
+    def fingerprint(self, template: str = "") -> str:
+        """
+        Merkle-style root over the cards' memoized content hashes, the deck
+        name and version, and an optional template identity (e.g. a digest of
+        the template source). Equal fingerprints mean identical rendered input.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps([self.name, self.version, template]).encode("utf-8"))
+        for card in self.cards:
+            digest.update(bytes.fromhex(card.content_hash))
+        return digest.hexdigest()
+
+    def diff(self, other: "Deck") -> DeckDiff:
+        """
+        What changes going from this deck to `other`, in one pass over each.
+        Cards are matched by name (repeated names pair up in order); a matched
+        card whose content hash differs is reported as changed.
+        """
+        by_name: dict[str, List[SpellCard]] = {}  # Reversed, so pop() yields the first
+        for card in reversed(self.cards):
+            by_name.setdefault(card.name, []).append(card)
 
-        return json.dumps(self.to_dict(), indent=2)
+        added, changed = [], []
+        for card in other.cards:
+            olds = by_name.get(card.name)
+            if not olds:
+                added.append(card)
+                continue
+            old = olds.pop()
+            if old.content_hash != card.content_hash:
+                changed.append((old, card))
+        removed = [card for cards in by_name.values() for card in reversed(cards)]
+        return DeckDiff(added=added, removed=removed, changed=changed)
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Convert the deck to a JSON string, compact like deck files unless `indent` is set."""
+        if indent is None:
+            return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
 
 @dataclass(frozen=True)
@@ -52,3 +228,27 @@ class DeckOptions:
     levels: List[int] = field(default_factory=list)
     schools: List[str] = field(default_factory=list)
     name: str = "Untitled Deck"
+    search: str = ""  # Free-text query over spell names and descriptions
+    search_mode: str = "token"  # token, substring or fuzzy
+    spells: List[str] = field(default_factory=list)  # Explicit picks, in deck order
+    sort: str = ""  # "name", "level" or "school"; prefix "-" for descending
+    offset: int = 0
+    limit: Optional[int] = None
+
+    def normalized(self) -> "DeckOptions":
+        """
+        Return an equivalent copy with filter lists sorted and deduplicated.
+        Explicit spell names keep their order, since it is the deck order.
+        """
+        return DeckOptions(
+            classes=sorted(set(self.classes)),
+            levels=sorted(set(self.levels)),
+            schools=sorted(set(self.schools)),
+            name=self.name,
+            search=" ".join(self.search.split()),
+            search_mode=self.search_mode,
+            spells=list(dict.fromkeys(" ".join(n.split()).casefold() for n in self.spells)),
+            sort=self.sort,
+            offset=self.offset,
+            limit=self.limit,
+        )
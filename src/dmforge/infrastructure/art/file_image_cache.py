@@ -0,0 +1,27 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+class FileImageCache:
+    """Content-addressed image store: `<directory>/<key[:2]>/<key>.png`."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.png"
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self._path(key)
+        return path if path.exists() else None
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        return path
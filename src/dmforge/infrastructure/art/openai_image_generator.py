@@ -0,0 +1,28 @@
+import base64
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+
+class OpenAIImageGenerator:
+    """
+    Image generation through the OpenAI Images API. `base_url` points the
+    client at any compatible endpoint, e.g. a proxy or a local stub server.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_retries: int = 2,
+        timeout: float = 120.0,
+    ):
+        self.client = AsyncOpenAI(
+            api_key=api_key, base_url=base_url, max_retries=max_retries, timeout=timeout
+        )
+
+    async def generate(self, prompt: str, model: str, size: str) -> bytes:
+        response = await self.client.images.generate(
+            model=model, prompt=prompt, size=size, n=1, response_format="b64_json"
+        )
+        return base64.b64decode(response.data[0].b64_json)
@@ -0,0 +1,110 @@
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
+
+from dmforge.domain.models import Deck
+from PIL import Image
+
+
+def _process_image(source: Path, target: Path, max_px: tuple[int, int], quality: int) -> None:
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=target.suffix)
+    os.close(fd)
+    with Image.open(source) as image:
+        image.thumbnail(max_px, Image.LANCZOS)
+        if target.suffix == ".png":
+            image.convert("RGBA").save(tmp, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(
+                tmp, format="JPEG", quality=quality, optimize=True, progressive=True
+            )
+    os.replace(tmp, target)
+
+
+class PrintAssetProcessor:
+    """
+    Prepares card art for print before rendering.
+
+    Each referenced image is downscaled to the card's print size at `dpi`
+    and recompressed: PNG/GIF sources stay lossless PNG to keep transparency,
+    everything else becomes progressive JPEG. Results are cached under
+    `cache_dir` by source content hash plus processing parameters, and cards
+    whose sources have identical bytes point at the same output file, so the
+    PDF embeds each image once.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        asset_dir: Optional[Path] = None,
+        width_in: float = 2.5,
+        height_in: float = 3.5,
+        dpi: int = 300,
+        quality: int = 85,
+        max_workers: Optional[int] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.asset_dir = asset_dir
+        self.max_px = (round(width_in * dpi), round(height_in * dpi))
+        self.quality = quality
+        self.max_workers = max_workers
+
+    def _source(self, art_path: str) -> Path:
+        path = Path(art_path)
+        if not path.is_absolute() and self.asset_dir is not None:
+            path = self.asset_dir / path
+        return path
+
+    def _target(self, source_hash: str, lossless: bool) -> Path:
+        params = f"{source_hash}:{self.max_px[0]}x{self.max_px[1]}:q{self.quality}"
+        key = hashlib.sha256(params.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}{'.png' if lossless else '.jpg'}"
+
+    def prepare(self, deck: Deck) -> Deck:
+        targets: dict[str, Path] = {}  # art_path -> processed file
+        by_hash: dict[str, Path] = {}
+        jobs: list[tuple[Path, Path]] = []
+
+        for art_path in dict.fromkeys(card.art_path for card in deck.cards if card.art_path):
+            source = self._source(art_path)
+            if not source.is_file():
+                logging.warning(f"⚠️ Art not found, leaving as-is: {source}")
+                continue
+            source_hash = hashlib.sha256(source.read_bytes()).hexdigest()
+            if source_hash not in by_hash:
+                target = self._target(source_hash, source.suffix.lower() in (".png", ".gif"))
+                by_hash[source_hash] = target
+                if not target.exists():
+                    jobs.append((source, target))
+            targets[art_path] = by_hash[source_hash]
+
+        self._run(jobs)
+
+        cards = [
+            (
+                replace(card, art_path=str(targets[card.art_path].resolve()))
+                if card.art_path in targets
+                else card
+            )
+            for card in deck.cards
+        ]
+        return Deck(name=deck.name, cards=cards, version=deck.version)
+
+    def _run(self, jobs: list[tuple[Path, Path]]) -> None:
+        for _, target in jobs:
+            target.parent.mkdir(parents=True, exist_ok=True)
+        if len(jobs) <= 1:
+            for source, target in jobs:
+                _process_image(source, target, self.max_px, self.quality)
+            return
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(_process_image, source, target, self.max_px, self.quality)
+                for source, target in jobs
+            ]
+            for future in futures:
+                future.result()
@@ -0,0 +1,327 @@
+import errno
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Callable, Iterator, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: lock stripes use msvcrt byte-range locks instead
+    fcntl = None
+    import msvcrt
+
+CACHE_DIR_ENV = "DMFORGE_CACHE_DIR"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+INDEX_NAME = "index.sqlite"
+LOCK_TIMEOUT = 600.0  # Seconds to wait for a lock stripe where locks can't block (msvcrt)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed);
+CREATE TABLE IF NOT EXISTS counters (
+    namespace TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0,
+    evictions INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_NAMESPACE_RE = re.compile(r"[a-z0-9][a-z0-9_-]*")
+_KEY_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*")
+
+
+def default_cache_dir() -> Path:
+    """$DMFORGE_CACHE_DIR, else ~/.cache/dmforge."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    return Path(configured) if configured else Path.home() / ".cache" / "dmforge"
+
+
+def content_key(*parts: Union[str, bytes]) -> str:
+    """SHA-256 over `parts`, each length-prefixed so ("ab", "c") != ("a", "bc")."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _acquire(f: IO) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    # LK_LOCK gives up after ~10 seconds; keep trying while the lock is merely busy.
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EDEADLK, errno.EACCES):
+                raise
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for cache lock {f.name}") from e
+
+
+def _release(f: IO) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class DiskCache:
+    """
+    On-disk cache shared by concurrent jobs on one host.
+
+    Entries are files at `<root>/<namespace>/<key[:2]>/<key>`, written to a
+    temp file and renamed into place. A SQLite index (WAL mode) beside them
+    records each entry's size and last use plus per-namespace hit, miss and
+    eviction counters. After every write the least recently used entries,
+    across all namespaces, are evicted until the total fits `max_bytes`.
+
+    `get_or_create` holds an exclusive file lock on the key's lock stripe
+    while it builds, so parallel workers build an entry once and the others
+    wait and reuse it.
+
+    So far only generated card art uses it (`deck art --shared-cache`, the
+    "art" namespace); the result, search index, print asset and HTML page
+    caches keep their own stores.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.root = root
+        self.max_bytes = max_bytes
+        root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.root / INDEX_NAME, timeout=30.0, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+
+    @contextmanager
+    def _lock(self, namespace: str, key: str) -> Iterator[None]:
+        # 256 lock stripes per namespace keep the number of lock files bounded.
+        locks = self.root / ".locks"
+        locks.mkdir(exist_ok=True)
+        with open(locks / f"{namespace}.{key[:2]}.lock", "a") as f:
+            _acquire(f)
+            try:
+                yield
+            finally:
+                _release(f)
+
+    def _path(self, namespace: str, key: str) -> Path:
+        if not _NAMESPACE_RE.fullmatch(namespace):
+            raise ValueError(f"Invalid cache namespace: {namespace!r}")
+        if not _KEY_RE.fullmatch(key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self.root / namespace / key[:2] / key
+
+    @staticmethod
+    def _count(db: sqlite3.Connection, namespace: str, column: str, amount: int = 1) -> None:
+        db.execute("INSERT OR IGNORE INTO counters (namespace) VALUES (?)", (namespace,))
+        db.execute(
+            f"UPDATE counters SET {column} = {column} + ? WHERE namespace = ?", (amount, namespace)
+        )
+
+    def namespace(self, name: str, suffix: str = "") -> "CacheNamespace":
+        self._path(name, "0")
+        return CacheNamespace(self, name, suffix)
+
+    def get(self, namespace: str, key: str) -> Optional[Path]:
+        """Path of a cached entry, or None; counts a hit or miss and marks it recently used."""
+        return self._get(namespace, key, count_miss=True)
+
+    def _get(self, namespace: str, key: str, count_miss: bool) -> Optional[Path]:
+        path = self._path(namespace, key)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            size = None
+        with self._transaction() as db:
+            if size is None:
+                db.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                if count_miss:
+                    self._count(db, namespace, "misses")
+                return None
+            # Upsert so files written by a process that died before indexing are adopted.
+            db.execute(
+                "INSERT INTO entries (namespace, key, size, accessed) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET accessed = excluded.accessed",
+                (namespace, key, size, time.time()),
+            )
+            self._count(db, namespace, "hits")
+        return path
+
+    def read(self, namespace: str, key: str) -> Optional[bytes]:
+        path = self.get(namespace, key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:  # Evicted by another process in between
+            return None
+
+    def put(self, namespace: str, key: str, data: bytes) -> Path:
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._transaction() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (namespace, key, len(data), time.time()),
+            )
+            self._evict(db, self.max_bytes, keep=(namespace, key))
+        return path
+
+    def get_or_create(self, namespace: str, key: str, create: Callable[[], bytes]) -> Path:
+        """Return the cached entry, building it with `create` at most once across processes."""
+        path = self.get(namespace, key)
+        if path is not None:
+            return path
+        with self._lock(namespace, key):
+            path = self._get(namespace, key, count_miss=False)
+            if path is None:
+                path = self.put(namespace, key, create())
+        return path
+
+    def _evict(
+        self,
+        db: sqlite3.Connection,
+        max_bytes: int,
+        namespace: Optional[str] = None,
+        keep: Optional[tuple[str, str]] = None,
+    ) -> tuple[int, int]:
+        where, args = ("WHERE namespace = ?", (namespace,)) if namespace else ("", ())
+        total = db.execute(f"SELECT COALESCE(SUM(size), 0) FROM entries {where}", args).fetchone()
+        excess = total[0] - max_bytes
+        removed = freed = 0
+        if excess <= 0:
+            return removed, freed
+        rows = db.execute(
+            f"SELECT namespace, key, size FROM entries {where} ORDER BY accessed", args
+        )
+        for entry_namespace, key, size in rows.fetchall():
+            if freed >= excess:
+                break
+            if (entry_namespace, key) == keep:
+                continue
+            self._path(entry_namespace, key).unlink(missing_ok=True)
+            db.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?", (entry_namespace, key)
+            )
+            self._count(db, entry_namespace, "evictions")
+            removed += 1
+            freed += size
+        return removed, freed
+
+    def prune(self, max_bytes: Optional[int] = None, namespace: Optional[str] = None) -> dict:
+        """
+        Evict least recently used entries until the cache (or one namespace)
+        fits `max_bytes`, defaulting to the cache's budget. Index rows whose
+        files have gone are dropped first.
+        """
+        if namespace is not None:
+            self._path(namespace, "0")
+        with self._transaction() as db:
+            rows = db.execute("SELECT namespace, key FROM entries").fetchall()
+            for entry_namespace, key in rows:
+                if not self._path(entry_namespace, key).exists():
+                    db.execute(
+                        "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                        (entry_namespace, key),
+                    )
+            limit = self.max_bytes if max_bytes is None else max_bytes
+            removed, freed = self._evict(db, limit, namespace)
+        return {"removed": removed, "freed_bytes": freed}
+
+    def stats(self) -> dict:
+        with self._connect() as db:
+            sizes = db.execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace"
+            ).fetchall()
+            counters = db.execute(
+                "SELECT namespace, hits, misses, evictions FROM counters"
+            ).fetchall()
+        namespaces: dict[str, dict] = {}
+        for name, entries, size in sizes:
+            namespaces.setdefault(name, {"entries": 0, "bytes": 0}).update(
+                entries=entries, bytes=size
+            )
+        for name, hits, misses, evictions in counters:
+            namespaces.setdefault(name, {"entries": 0, "bytes": 0}).update(
+                hits=hits, misses=misses, evictions=evictions
+            )
+        for entry in namespaces.values():
+            for counter in ("hits", "misses", "evictions"):
+                entry.setdefault(counter, 0)
+            lookups = entry["hits"] + entry["misses"]
+            entry["hit_rate"] = round(entry["hits"] / lookups, 4) if lookups else 0.0
+        return {
+            "root": str(self.root),
+            "max_bytes": self.max_bytes,
+            "entries": sum(n["entries"] for n in namespaces.values()),
+            "bytes": sum(n["bytes"] for n in namespaces.values()),
+            "namespaces": dict(sorted(namespaces.items())),
+        }
+
+
+class CacheNamespace:
+    """
+    One namespace of a `DiskCache`; usable wherever an `ImageCache` is
+    expected. `suffix` is appended to every key, e.g. ".png" for images.
+    """
+
+    def __init__(self, cache: DiskCache, name: str, suffix: str = ""):
+        self.cache = cache
+        self.name = name
+        self.suffix = suffix
+
+    def get(self, key: str) -> Optional[Path]:
+        return self.cache.get(self.name, key + self.suffix)
+
+    def read(self, key: str) -> Optional[bytes]:
+        return self.cache.read(self.name, key + self.suffix)
+
+    def put(self, key: str, data: bytes) -> Path:
+        return self.cache.put(self.name, key + self.suffix, data)
+
+    def get_or_create(self, key: str, create: Callable[[], bytes]) -> Path:
+        return self.cache.get_or_create(self.name, key + self.suffix, create)
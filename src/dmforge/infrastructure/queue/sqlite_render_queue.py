@@ -0,0 +1,285 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from dmforge.application.ports.render_queue import RenderJob
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint TEXT NOT NULL UNIQUE,
+    input_path TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    error TEXT,
+    worker TEXT,
+    available_at REAL NOT NULL,
+    lease_until REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at);
+"""
+
+_COLUMNS = "id, fingerprint, input_path, output_path, params, status, attempts, max_attempts, error"
+
+
+def render_fingerprint(input_path: Path, params: dict) -> str:
+    """
+    Identity of a render: the deck file's bytes, every file in the template
+    directory, and the render options. Equal fingerprints produce equal output.
+    """
+    digest = hashlib.sha256()
+    digest.update(Path(input_path).read_bytes())
+    template_dir = params.get("template_dir")
+    if template_dir and Path(template_dir).is_dir():
+        for path in sorted(p for p in Path(template_dir).rglob("*") if p.is_file()):
+            digest.update(str(path.relative_to(template_dir)).encode("utf-8"))
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SQLiteRenderQueue:
+    """
+    Durable render job queue in a single SQLite file, safe to share between
+    processes.
+
+    Workers claim a job by leasing it for `lease_seconds`; a job whose worker
+    died is handed out again once its lease expires, so nothing is lost across
+    restarts, unless that worker used the job's last attempt: a deck that
+    keeps killing its worker is then marked failed ("worker lost") instead of
+    taking down every worker in turn. Workers renew the lease while they
+    render, and only the worker holding a job's lease can complete or fail
+    it; completing moves its staged output into place in the same
+    transaction, so a worker that lost the lease never overwrites the
+    result. Failed jobs are retried with exponential backoff
+    (`retry_delay`, doubled per attempt) until `max_attempts` is reached.
+    Enqueuing a render whose fingerprint is already queued, running or done
+    returns the existing job instead of adding a new one.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        lease_seconds: float = 600.0,
+        retry_delay: float = 5.0,
+        max_attempts: int = 3,
+        output_dir: Path = Path("exports/jobs"),
+    ):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self.output_dir = output_dir
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Autocommit mode so transactions are opened explicitly with BEGIN IMMEDIATE,
+        # which takes the write lock up front and keeps claims race-free.
+        db = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+
+    @staticmethod
+    def _job(row: tuple, deduped: bool = False) -> RenderJob:
+        return RenderJob(
+            id=row[0],
+            fingerprint=row[1],
+            input_path=row[2],
+            output_path=row[3],
+            params=json.loads(row[4]),
+            status=row[5],
+            attempts=row[6],
+            max_attempts=row[7],
+            error=row[8],
+            deduped=deduped,
+        )
+
+    def enqueue(
+        self,
+        input_path: Path,
+        output_path: Optional[Path],
+        params: dict,
+        max_attempts: Optional[int] = None,
+    ) -> RenderJob:
+        fingerprint = render_fingerprint(input_path, params)
+        if output_path is None:
+            output_path = self.output_dir / f"{fingerprint[:16]}.{params.get('format', 'pdf')}"
+        max_attempts = max_attempts or self.max_attempts
+        now = time.time()
+
+        with self._transaction() as db:
+            row = db.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+            if row is not None:
+                job = self._job(row, deduped=True)
+                if job.status != "failed" and (
+                    job.status != "done" or Path(job.output_path).exists()
+                ):
+                    return job
+                # Permanently failed, or done but the output is gone: run it again.
+                db.execute(
+                    "UPDATE jobs SET status = 'queued', attempts = 0, max_attempts = ?, "
+                    "error = NULL, available_at = ?, updated_at = ? WHERE id = ?",
+                    (max_attempts, now, now, job.id),
+                )
+            else:
+                db.execute(
+                    "INSERT INTO jobs (fingerprint, input_path, output_path, params, "
+                    "max_attempts, available_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        fingerprint,
+                        str(input_path),
+                        str(output_path),
+                        json.dumps(params, sort_keys=True),
+                        max_attempts,
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+            row = db.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+        return self._job(row)
+
+    def claim(self, worker: str) -> Optional[RenderJob]:
+        """Lease the oldest ready job to `worker`, or return None if there is none."""
+        now = time.time()
+        with self._transaction() as db:
+            while True:
+                row = db.execute(
+                    f"SELECT {_COLUMNS} FROM jobs "
+                    "WHERE (status = 'queued' AND available_at <= ?) "
+                    "OR (status = 'running' AND lease_until < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (now, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                job = self._job(row)
+                if job.status == "queued" or job.attempts < job.max_attempts:
+                    break
+                # Its worker died on the last attempt; don't hand it to another one.
+                error = "worker lost" + (f" (last error: {job.error})" if job.error else "")
+                db.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, lease_until = NULL, "
+                    "updated_at = ? WHERE id = ?",
+                    (error, now, job.id),
+                )
+            db.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?, "
+                "lease_until = ?, updated_at = ? WHERE id = ?",
+                (worker, now + self.lease_seconds, now, row[0]),
+            )
+            row = db.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (row[0],)).fetchone()
+        return self._job(row)
+
+    def renew(self, job_id: int, worker: str) -> bool:
+        """Extend the lease by `lease_seconds`; False if `worker` no longer holds it."""
+        now = time.time()
+        with self._transaction() as db:
+            updated = db.execute(
+                "UPDATE jobs SET lease_until = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'running' AND worker = ?",
+                (now + self.lease_seconds, now, job_id, worker),
+            )
+            return updated.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, staged: Optional[Path] = None) -> bool:
+        """
+        Mark done, first moving `staged` (if given) to the job's output path.
+        False (and no change) if `worker` no longer holds the job's lease.
+        """
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT output_path FROM jobs WHERE id = ? AND status = 'running' AND worker = ?",
+                (job_id, worker),
+            ).fetchone()
+            if row is None:
+                return False
+            if staged is not None:
+                os.replace(staged, row[0])
+            db.execute(
+                "UPDATE jobs SET status = 'done', error = NULL, lease_until = NULL, "
+                "updated_at = ? WHERE id = ?",
+                (time.time(), job_id),
+            )
+        return True
+
+    def fail(self, job_id: int, worker: str, error: str, retry: bool = True) -> bool:
+        """
+        Requeue with backoff, or mark failed once out of attempts or if `retry`
+        is False. False (and no change) if `worker` no longer holds the lease.
+        """
+        now = time.time()
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT attempts, max_attempts FROM jobs "
+                "WHERE id = ? AND status = 'running' AND worker = ?",
+                (job_id, worker),
+            ).fetchone()
+            if row is None:
+                return False
+            attempts, max_attempts = row
+            if retry and attempts < max_attempts:
+                delay = self.retry_delay * 2 ** (attempts - 1)
+                db.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, available_at = ?, "
+                    "lease_until = NULL, updated_at = ? WHERE id = ?",
+                    (error, now + delay, now, job_id),
+                )
+            else:
+                db.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, lease_until = NULL, "
+                    "updated_at = ? WHERE id = ?",
+                    (error, now, job_id),
+                )
+        return True
+
+    def get(self, job_id: int) -> Optional[RenderJob]:
+        with self._connect() as db:
+            row = db.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job(row) if row is not None else None
+
+    def counts(self) -> dict[str, int]:
+        with self._connect() as db:
+            rows = db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def pending(self) -> int:
+        """Jobs not yet finished one way or the other (queued, waiting to retry, or running)."""
+        with self._connect() as db:
+            return db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchone()[0]
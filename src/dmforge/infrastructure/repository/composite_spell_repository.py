@@ -0,0 +1,117 @@
+import glob
+import hashlib
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Union
+
+from dmforge.infrastructure.repository.json_spell_repository import JSONSpellRepository
+
+
+def _parse_source(path: Path, strict: bool = False) -> tuple[str, list[dict]]:
+    repo = JSONSpellRepository(path, strict=strict)
+    spells = repo.load_all_spells()
+    return repo.fingerprint(), spells
+
+
+def _spell_key(spell: dict) -> str:
+    return " ".join(str(spell.get("name", "")).split()).casefold()
+
+
+class CompositeSpellRepository:
+    """
+    Merges every spell JSON file matched by a directory (``*.json``) or glob.
+
+    Sources are ordered by path and later sources override earlier ones:
+    a spell whose name (case- and whitespace-insensitive) was already seen
+    replaces the earlier entry in place, so ``00_srd.json`` can be patched by
+    ``10_homebrew.json``. Parsed sources are cached per instance by
+    ``(mtime_ns, size)``, so only new or modified files are parsed again.
+
+    That cache lives in memory only: it saves re-parsing in a long-lived
+    process (rebuilds, workers, the async controller), but each new process
+    parses every source again. Reading parsed records back from disk costs
+    as much as parsing the JSON, so for fast cold starts compile the sources
+    with ``deck compile`` instead. Concurrent loads are safe: each works on
+    its own snapshot of the cache and swaps the result in under a lock.
+    """
+
+    def __init__(
+        self,
+        source: Union[Path, str],
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        strict: bool = False,
+    ):
+        self.source = source
+        self.strict = strict
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._parsed: dict[Path, tuple[tuple[int, int], str, list[dict]]] = {}
+        self._fingerprint: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def source_paths(self) -> list[Path]:
+        source = Path(self.source)
+        if source.is_dir():
+            paths = source.glob("*.json")
+        else:
+            paths = (Path(p) for p in glob.glob(str(self.source), recursive=True))
+        return sorted(p for p in paths if p.is_file())
+
+    def load_all_spells(self) -> list[dict]:
+        paths = self.source_paths()
+        if not paths:
+            raise FileNotFoundError(f"No spell data files found for: {self.source}")
+
+        with self._lock:
+            cached = dict(self._parsed)
+        parsed = {}
+        stale = []
+        for path in paths:
+            stat = path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            entry = cached.get(path)
+            if entry is None or entry[0] != stamp:
+                stale.append((path, stamp))
+            else:
+                parsed[path] = entry
+        parsed.update(self._parse(stale))
+        with self._lock:
+            self._parsed = parsed  # Also drops sources that have gone
+
+        merged: dict[str, dict] = {}
+        digest = hashlib.sha256()
+        for path in paths:
+            _, source_hash, spells = parsed[path]
+            digest.update(f"{path}:{source_hash}\n".encode("utf-8"))
+            for spell in spells:
+                merged[_spell_key(spell)] = spell
+        self._fingerprint = digest.hexdigest()
+        return list(merged.values())
+
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self.load_all_spells()
+        return self._fingerprint
+
+    def _parse(
+        self, stale: list[tuple[Path, tuple[int, int]]]
+    ) -> dict[Path, tuple[tuple[int, int], str, list[dict]]]:
+        if not stale:
+            return {}
+        if len(stale) == 1:
+            results = [_parse_source(stale[0][0], self.strict)]
+        else:
+            with self._executor() as pool:
+                paths = [path for path, _ in stale]
+                results = list(pool.map(_parse_source, paths, [self.strict] * len(paths)))
+        return {
+            path: (stamp, source_hash, spells)
+            for (path, stamp), (source_hash, spells) in zip(stale, results, strict=True)
+        }
+
+    def _executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from dmforge.infrastructure.repository.json_codec import JSONCodec, get_codec
+
+LEDGER_VERSION = 1
+
+
+class JSONBuildLedger:
+    """
+    Build ledger kept in one JSON file. Alongside the deck entries and corpus
+    baselines it maintains a reverse index from spell key to the decks that
+    contain it, per spell source, so finding the decks touched by a spell
+    change never means opening decks. Baselines no deck refers to any more
+    are dropped on save.
+    """
+
+    def __init__(self, path: Path, codec: Optional[JSONCodec] = None):
+        self.path = path
+        self.codec = codec or get_codec()
+        self._data: Optional[dict] = None
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            if self.path.exists():
+                data = self.codec.load_path(self.path)
+                if data.get("version") != LEDGER_VERSION:
+                    raise ValueError(f"Unsupported build ledger version: {data.get('version')}")
+            else:
+                data = {"version": LEDGER_VERSION, "decks": {}, "baselines": {}, "index": {}}
+            self._data = data
+        return self._data
+
+    def decks(self) -> dict[str, dict]:
+        return dict(self.data["decks"])
+
+    def baseline(self, fingerprint: str) -> Optional[dict[str, str]]:
+        return self.data["baselines"].get(fingerprint)
+
+    def set_baseline(self, fingerprint: str, hashes: dict[str, str]) -> None:
+        self.data["baselines"][fingerprint] = hashes
+
+    def decks_containing(self, source: str, keys: Iterable[str]) -> set[str]:
+        index = self.data["index"].get(source, {})
+        return {path for key in keys for path in index.get(key, ())}
+
+    def record(self, path: str, entry: dict) -> None:
+        self.forget(path)
+        self.data["decks"][path] = entry
+        index = self.data["index"].setdefault(entry["source"], {})
+        for key in set(entry["spells"]):
+            index.setdefault(key, []).append(path)
+
+    def forget(self, path: str) -> None:
+        old = self.data["decks"].pop(path, None)
+        if old is None:
+            return
+        index = self.data["index"].get(old["source"], {})
+        for key in set(old["spells"]):
+            paths = index.get(key, [])
+            if path in paths:
+                paths.remove(path)
+            if not paths:
+                index.pop(key, None)
+
+    def save(self) -> None:
+        data = self.data
+        used = {entry["corpus"] for entry in data["decks"].values()}
+        data["baselines"] = {fp: h for fp, h in data["baselines"].items() if fp in used}
+        data["index"] = {source: keys for source, keys in data["index"].items() if keys}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.codec.dumps(data))
+        os.replace(tmp, self.path)
@@ -0,0 +1,118 @@
+"""
+Pluggable JSON encoding/decoding for repositories and deck storage.
+
+The backend is chosen by name ("orjson", "msgspec", "stdlib" or "auto"),
+falling back to the ``DMFORGE_JSON_BACKEND`` environment variable and then
+to "auto", which picks the fastest installed library. Output is compact
+unless indentation is requested explicitly.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+BACKEND_ENV = "DMFORGE_JSON_BACKEND"
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+
+class JSONCodec:
+    def __init__(
+        self,
+        name: str,
+        decode: Callable[[Any], Any],
+        encode: Callable[[Any, bool], bytes],
+        accepts_buffers: bool,
+    ):
+        self.name = name
+        self._decode = decode
+        self._encode = encode
+        self._accepts_buffers = accepts_buffers
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decode(data)
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        return self._encode(obj, indent)
+
+    def load_path(self, path: Path, digest: Optional[Any] = None) -> Any:
+        """
+        Decode a file through a read-only memory map where the backend allows
+        it. If a hashlib `digest` is given it is updated with the file's bytes too.
+        """
+        with open(path, "rb") as f:
+            if not self._accepts_buffers or os.fstat(f.fileno()).st_size == 0:
+                data = f.read()
+                if digest is not None:
+                    digest.update(data)
+                return self._decode(data)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    if digest is not None:
+                        digest.update(view)
+                    return self._decode(view)
+
+    def dump_path(self, obj: Any, path: Path, indent: bool = False) -> None:
+        path.write_bytes(self._encode(obj, indent))
+
+
+def _stdlib_codec() -> JSONCodec:
+    def encode(obj: Any, indent: bool) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    return JSONCodec("stdlib", json.loads, encode, accepts_buffers=False)
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    def encode(obj: Any, indent: bool) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    return JSONCodec("orjson", orjson.loads, encode, accepts_buffers=True)
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+
+    def decode(data: Any) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def encode(obj: Any, indent: bool) -> bytes:
+        data = encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+
+    return JSONCodec("msgspec", decode, encode, accepts_buffers=True)
+
+
+_FACTORIES = {"orjson": _orjson_codec, "msgspec": _msgspec_codec, "stdlib": _stdlib_codec}
+_codecs: dict[str, JSONCodec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return the named codec, the one from $DMFORGE_JSON_BACKEND, or the best installed."""
+    name = (name or os.environ.get(BACKEND_ENV) or "auto").lower()
+    if name in _codecs:
+        return _codecs[name]
+
+    if name == "auto":
+        for candidate in BACKENDS:
+            try:
+                codec = get_codec(candidate)
+            except ImportError:
+                continue
+            _codecs["auto"] = codec
+            return codec
+
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend: {name}. Use one of {BACKENDS} or 'auto'")
+    _codecs[name] = _FACTORIES[name]()
+    return _codecs[name]
@@ -1,18 +1,24 @@
-import json
 from pathlib import Path
+from typing import Optional
 
 from dmforge.application.ports.deck_storage import DeckStorage
-from dmforge.domain.models import Deck, SpellCard
+from dmforge.domain.models import Deck
+from dmforge.infrastructure.repository.json_codec import JSONCodec, get_codec
+from dmforge.infrastructure.repository.schemas import parse_deck
 
 
 class JSONDeckStorage(DeckStorage):
+    """
+    Deck files are written compact unless `indent` is set. Loading goes
+    through pydantic's native JSON parser, which validates as it decodes.
+    """
+
+    def __init__(self, indent: bool = False, codec: Optional[JSONCodec] = None):
+        self.indent = indent
+        self.codec = codec or get_codec()
+
     def save(self, deck: Deck, path: Path) -> None:
-        path.write_text(deck.to_json(), encoding="utf-8")
+        self.codec.dump_path(deck.to_dict(), path, indent=self.indent)
 
     def load(self, path: Path) -> Deck:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return Deck(
-            name=data["name"],
-            version=data["version"],
-            cards=[SpellCard(**card) for card in data["cards"]],
-        )
+        return parse_deck(path.read_bytes())
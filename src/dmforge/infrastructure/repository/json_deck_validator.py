@@ -0,0 +1,281 @@
+import glob
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, TextIO, Union
+
+from dmforge.infrastructure.repository.schemas import check_card
+from pydantic import ValidationError
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+CHUNK_SIZE = 64 * 1024
+
+# Field name -> (accepted types, required); matches what JSONDeckStorage.load accepts.
+_DECK_FIELDS = {"name": ((str,), True), "version": ((str,), False), "cards": ((list,), True)}
+
+
+class _StructureError(Exception):
+    def __init__(self, pos: int, message: str):
+        super().__init__(message)
+        self.pos = pos
+        self.message = message
+
+
+class _Reader:
+    """
+    A window over a text file, read in chunks. Positions index the current
+    buffer; `compact` drops what has been consumed and keeps line and column
+    numbering of the rest.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.eof = False
+        self.line = 1  # Line and column of buf[0]
+        self.column = 1
+
+    def fill(self) -> bool:
+        """Read more (at least doubling the buffer, so long values load in O(n)); False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.file.read(max(self.chunk_size, len(self.buf)))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def skip(self, pos: int) -> int:
+        """Position of the next non-whitespace character, or the buffer end at EOF."""
+        while True:
+            while pos < len(self.buf) and self.buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(self.buf) or not self.fill():
+                return pos
+
+    def peek(self, pos: int) -> str:
+        return self.buf[pos] if pos < len(self.buf) or self.fill() else ""
+
+    def expect(self, pos: int, char: str) -> int:
+        pos = self.skip(pos)
+        if self.peek(pos) != char:
+            found = repr(self.buf[pos]) if pos < len(self.buf) else "end of file"
+            raise _StructureError(pos, f"Expected '{char}', found {found}")
+        return pos + 1
+
+    def decode(self, pos: int) -> tuple[Any, int]:
+        """Decode the JSON value at `pos`, reading on while it may be cut off by the buffer end."""
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number at the buffer end may continue in the next chunk.
+            if end < len(self.buf) or not self.fill():
+                return value, end
+
+    def compact(self, pos: int) -> int:
+        consumed = self.buf[:pos]
+        newlines = consumed.count("\n")
+        if newlines:
+            self.line += newlines
+            self.column = pos - consumed.rfind("\n")
+        else:
+            self.column += pos
+        self.buf = self.buf[pos:]
+        return 0
+
+    def location(self, pos: int) -> tuple[int, int]:
+        newlines = self.buf.count("\n", 0, pos)
+        if not newlines:
+            return self.line, self.column + pos
+        return self.line + newlines, pos - self.buf.rfind("\n", 0, pos)
+
+
+_JSON_TYPES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+
+# pydantic error type -> JSON type it expected
+_EXPECTED = {
+    "string_type": "string",
+    "int_type": "integer",
+    "float_type": "number",
+    "bool_type": "boolean",
+    "list_type": "array",
+    "dict_type": "object",
+}
+
+
+def _type_name(value) -> str:
+    return _JSON_TYPES.get(type(value), type(value).__name__)
+
+
+def _field_path(loc: tuple) -> str:
+    return "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in loc)
+
+
+def _message(error: dict) -> str:
+    if error["type"] == "missing":
+        return "Missing required field"
+    if error["type"] == "extra_forbidden":
+        return "Unknown field"
+    if error["type"] in _EXPECTED:
+        return f"Expected {_EXPECTED[error['type']]}, got {_type_name(error['input'])}"
+    return error["msg"]
+
+
+class _FileCheck:
+    def __init__(self, reader: _Reader):
+        self.reader = reader
+        self.errors: list[dict] = []
+        self.cards = 0
+
+    def error(self, pos: int, field: str, message: str) -> None:
+        self.error_at(self.reader.location(pos), field, message)
+
+    def error_at(self, location: tuple[int, int], field: str, message: str) -> None:
+        line, column = location
+        self.errors.append({"line": line, "column": column, "field": field, "message": message})
+
+    def check_fields(self, obj: dict, location: tuple[int, int], prefix: str, spec: dict) -> None:
+        for key, (types, required) in spec.items():
+            if key not in obj:
+                if required:
+                    self.error_at(location, f"{prefix}{key}", "Missing required field")
+            elif not isinstance(obj[key], types) or isinstance(obj[key], bool):
+                expected = " or ".join(_JSON_TYPES[t] for t in types)
+                self.error_at(
+                    location, f"{prefix}{key}", f"Expected {expected}, got {_type_name(obj[key])}"
+                )
+        for key in obj.keys() - spec.keys():
+            self.error_at(location, f"{prefix}{key}", "Unknown field")
+
+    def check_card(self, card: Any, pos: int, index: int) -> None:
+        # The card schema lives in schemas.py; this only maps its errors to a location.
+        try:
+            check_card(card)
+        except ValidationError as e:
+            for error in e.errors():
+                self.error(pos, f"cards[{index}]{_field_path(error['loc'])}", _message(error))
+
+    def run(self) -> None:
+        reader = self.reader
+        pos = reader.expect(0, "{")
+        # Taken now: scanning the cards drops the start of the buffer.
+        header = reader.location(pos - 1)
+        fields: dict = {}
+        if reader.peek(reader.skip(pos)) == "}":
+            pos = reader.skip(pos) + 1
+        else:
+            while True:
+                key_pos = reader.skip(pos)
+                key, pos = reader.decode(key_pos)
+                if not isinstance(key, str):
+                    raise _StructureError(key_pos, "Expected a string key")
+                pos = reader.expect(pos, ":")
+                value_pos = reader.skip(pos)
+                if key == "cards" and reader.peek(value_pos) == "[":
+                    pos = self.scan_cards(value_pos + 1)
+                    fields["cards"] = []
+                else:
+                    fields[key], pos = reader.decode(value_pos)
+                pos = reader.skip(pos)
+                if reader.peek(pos) == ",":
+                    pos += 1
+                    continue
+                pos = reader.expect(pos, "}")
+                break
+        if reader.skip(pos) != len(reader.buf):
+            raise _StructureError(reader.skip(pos), "Extra data after deck object")
+        self.check_fields(fields, header, "", _DECK_FIELDS)
+
+    def scan_cards(self, pos: int) -> int:
+        reader = self.reader
+        pos = reader.skip(pos)
+        if reader.peek(pos) == "]":
+            return pos + 1
+        while True:
+            card_pos = reader.skip(pos)
+            card, pos = reader.decode(card_pos)
+            self.check_card(card, card_pos, self.cards)
+            self.cards += 1
+            if pos > reader.chunk_size:
+                pos = reader.compact(pos)
+            pos = reader.skip(pos)
+            if reader.peek(pos) == ",":
+                pos += 1
+                continue
+            return reader.expect(pos, "]")
+
+
+def validate_deck_file(path: Union[Path, str], chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Structurally validate one deck JSON file without building a Deck.
+
+    The file is read in chunks and cards are decoded and checked one at a
+    time, so memory stays flat however large the deck, and every error
+    carries the line and column of the offending card (or of the syntax error).
+    """
+    result = {"path": str(path), "valid": False, "cards": 0, "errors": []}
+    try:
+        file = open(path, encoding="utf-8")
+    except OSError as e:
+        result["errors"].append({"line": 0, "column": 0, "field": "", "message": str(e)})
+        return result
+
+    with file:
+        check = _FileCheck(_Reader(file, chunk_size))
+        try:
+            check.run()
+        except json.JSONDecodeError as e:
+            line, column = check.reader.location(e.pos)
+            check.errors.append(
+                {"line": line, "column": column, "field": "", "message": f"Invalid JSON: {e.msg}"}
+            )
+        except _StructureError as e:
+            check.error(e.pos, "", e.message)
+        except (OSError, UnicodeDecodeError) as e:
+            check.errors.append({"line": 0, "column": 0, "field": "", "message": str(e)})
+    result.update(valid=not check.errors, cards=check.cards, errors=check.errors)
+    return result
+
+
+def find_deck_files(directory: Optional[Path] = None, pattern: str = "*.json") -> list[Path]:
+    if directory is None:
+        return sorted(Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+    return sorted(p for p in directory.glob(pattern) if p.is_file())
+
+
+class JSONDeckValidator:
+    """Validates many deck files across a process pool and summarizes the results."""
+
+    def __init__(self, max_workers: Optional[int] = None, chunksize: int = 32):
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+
+    def validate_many(self, paths: list[Path]) -> dict:
+        if len(paths) <= self.chunksize or self.max_workers == 1:
+            results = [validate_deck_file(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(validate_deck_file, paths, chunksize=self.chunksize))
+        invalid = sum(1 for r in results if not r["valid"])
+        return {
+            "files": len(results),
+            "valid": len(results) - invalid,
+            "invalid": invalid,
+            "results": results,
+        }
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+class JSONResultCache:
+    """
+    On-disk filter result cache: one small JSON file per key. Entries are
+    touched on read so the oldest-by-mtime files are evicted first once
+    `max_entries` is exceeded.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = directory
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[list[int]]:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if not isinstance(data, list):
+            return None
+        os.utime(path)
+        return data
+
+    def put(self, key: str, spell_ids: list[int]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(spell_ids, f, separators=(",", ":"))
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in entries[: max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,30 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from dmforge.infrastructure.repository.json_codec import JSONCodec, get_codec
+
+
+class JSONSearchIndexStore:
+    """Persists a search index as a JSON sidecar next to the spell corpus."""
+
+    def __init__(self, path: Path, codec: Optional[JSONCodec] = None):
+        self.path = path
+        self.codec = codec or get_codec()
+
+    def load(self, fingerprint: str) -> Optional[dict]:
+        try:
+            data = self.codec.load_path(self.path)
+        except (FileNotFoundError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return None
+        return data
+
+    def save(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.codec.dumps(data))
+        os.replace(tmp, self.path)
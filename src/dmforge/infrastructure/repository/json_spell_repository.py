@@ -1,16 +1,34 @@
-import json
+import hashlib
 from pathlib import Path
+from typing import Optional
+
+from dmforge.infrastructure.repository.json_codec import JSONCodec, get_codec
+from dmforge.infrastructure.repository.schemas import parse_spells
 
 
 class JSONSpellRepository:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, strict: bool = False, codec: Optional[JSONCodec] = None):
         self.path = path
+        self.strict = strict
+        self.codec = codec or get_codec()
+        self._fingerprint: Optional[str] = None
 
     def load_all_spells(self) -> list[dict]:
         if not self.path.exists():
             raise FileNotFoundError(f"Spell data file not found: {self.path}")
-        with self.path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        if self.strict:
+            raw = self.path.read_bytes()
+            self._fingerprint = hashlib.sha256(raw).hexdigest()
+            return parse_spells(raw)
+        digest = hashlib.sha256()
+        data = self.codec.load_path(self.path, digest=digest)
+        self._fingerprint = digest.hexdigest()
         if not isinstance(data, list):
             raise ValueError("Expected a list of spells in the JSON file.")
         return data
+
+    def fingerprint(self) -> str:
+        """SHA-256 of the spell file as last loaded (or as it is now, if never loaded)."""
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(self.path.read_bytes()).hexdigest()
+        return self._fingerprint
@@ -0,0 +1,28 @@
+import mmap
+from pathlib import Path
+from typing import Optional
+
+
+class MappedText:
+    """
+    UTF-8 text blob read through a read-only memory map. The file is mapped
+    on the first read, so only the pages holding requested slices are
+    ever paged in.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._map: Optional[mmap.mmap] = None
+
+    def read(self, offset: int, length: int) -> str:
+        if length == 0:
+            return ""
+        if self._map is None:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset : offset + length].decode("utf-8")
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,64 @@
+"""
+Compiled pydantic validators for deck files and spell corpora.
+
+Validation runs in pydantic-core straight from JSON bytes: a whole deck is
+type-checked and constructed as domain objects in one native pass, and a
+spell corpus is checked field by field instead of being defaulted later.
+Bulk validation checks decoded deck cards against `CardRecord` instead, so
+no SpellCard is built.
+"""
+
+from typing import NewType, Optional, Union
+
+from dmforge.domain.models import Deck
+from pydantic import ConfigDict, TypeAdapter, with_config
+from typing_extensions import NotRequired, Required, TypedDict
+
+
+@with_config(ConfigDict(extra="allow"))
+class SpellRecord(TypedDict, total=False):
+    """A raw spell entry as found in spell JSON; unknown keys are kept."""
+
+    name: Required[str]
+    level: NotRequired[int]
+    school: NotRequired[str]
+    classes: NotRequired[list[str]]
+    desc: NotRequired[Union[str, list[str]]]
+    duration: NotRequired[str]
+
+
+@with_config(ConfigDict(extra="forbid"))
+class CardRecord(TypedDict):
+    """A deck card as stored in deck JSON; the fields of SpellCard."""
+
+    name: str
+    level: int
+    school: str
+    classes: list[str]
+    description: str
+    duration: str
+    art_path: NotRequired[Optional[str]]
+
+
+# The domain dataclasses know nothing of pydantic. Validating through a NewType
+# lets this adapter carry the config, which nested SpellCards inherit.
+DeckFile = NewType("DeckFile", Deck)
+
+DECK_ADAPTER = TypeAdapter(DeckFile, config=ConfigDict(extra="forbid"))
+CARD_RECORD_ADAPTER = TypeAdapter(CardRecord)
+SPELL_CORPUS_ADAPTER = TypeAdapter(list[SpellRecord])
+
+
+def parse_deck(data: Union[bytes, str]) -> Deck:
+    """Validate and build a Deck from JSON; raises pydantic.ValidationError (a ValueError)."""
+    return DECK_ADAPTER.validate_json(data, strict=True)
+
+
+def check_card(data: object) -> None:
+    """Type-check one decoded card without building it; raises pydantic.ValidationError."""
+    CARD_RECORD_ADAPTER.validate_python(data, strict=True)
+
+
+def parse_spells(data: Union[bytes, str]) -> list[dict]:
+    """Validate a spell corpus from JSON; raises pydantic.ValidationError (a ValueError)."""
+    return SPELL_CORPUS_ADAPTER.validate_json(data, strict=True)
@@ -0,0 +1,173 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from dmforge.domain.models import DeckOptions, LazyText
+from dmforge.infrastructure.repository.json_codec import JSONCodec, get_codec
+from dmforge.infrastructure.repository.mapped_text import MappedText
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+READABLE_VERSIONS = (1, 2)  # Version 1 kept descriptions inline in the shards
+DESCRIPTIONS_NAME = "descriptions.txt"
+DESC_REF = "_desc_at"  # [offset, length] of a spell's description in the blob
+
+
+def _shard_key(spell: dict) -> str:
+    level = spell.get("level")
+    return str(level) if isinstance(level, int) and not isinstance(level, bool) else "none"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class ShardedSpellRepository:
+    """
+    Spell corpus split into one shard per level, plus a manifest recording
+    each shard's classes and schools.
+
+    `load_spells_for(options)` reads only the shards that can contain a match,
+    so a "level 1 Wizard" build touches one shard. Name and keyword selections
+    can match any level and load every shard. Spell order is by level, then
+    the original corpus order within a level.
+
+    Text descriptions live in one blob beside the shards; shard records hold
+    their offset and length. With `lazy_descriptions`, loaded spells carry a
+    `LazyText` into the memory-mapped blob instead of the text, so only the
+    descriptions of cards that are actually read are ever touched.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        codec: Optional[JSONCodec] = None,
+        lazy_descriptions: bool = False,
+    ):
+        self.directory = directory
+        self.codec = codec or get_codec()
+        self.lazy_descriptions = lazy_descriptions
+        self._manifest: Optional[dict] = None
+        self._fingerprint: Optional[str] = None
+        self._descriptions: Optional[MappedText] = None
+
+    @classmethod
+    def compile(
+        cls, spells: list[dict], directory: Path, codec: Optional[JSONCodec] = None
+    ) -> "ShardedSpellRepository":
+        """Write `spells` as a sharded corpus under `directory` and return a repository for it."""
+        codec = codec or get_codec()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        shards: dict[str, list[dict]] = {}
+        for spell in spells:
+            shards.setdefault(_shard_key(spell), []).append(spell)
+
+        digest = hashlib.sha256()
+        entries = {}
+        blob = bytearray()
+        for key in sorted(shards, key=lambda k: (k == "none", int(k) if k != "none" else 0)):
+            records = []
+            for spell in shards[key]:
+                desc = spell.get("desc")
+                if isinstance(desc, str):
+                    text = desc.encode("utf-8")
+                    spell = {k: v for k, v in spell.items() if k != "desc"}
+                    spell[DESC_REF] = [len(blob), len(text)]
+                    blob += text
+                records.append(spell)
+            data = codec.dumps(records)
+            digest.update(f"{key}:".encode("utf-8") + hashlib.sha256(data).digest())
+            filename = f"level_{key}.json"
+            _write_atomic(directory / filename, data)
+            entries[key] = {
+                "file": filename,
+                "count": len(shards[key]),
+                "classes": sorted({c for s in shards[key] for c in s.get("classes", [])}),
+                "schools": sorted({s["school"] for s in shards[key] if s.get("school")}),
+            }
+
+        for stale in set(directory.glob("level_*.json")) - {
+            directory / e["file"] for e in entries.values()
+        }:
+            stale.unlink()
+
+        digest.update(b"descriptions:" + hashlib.sha256(blob).digest())
+        _write_atomic(directory / DESCRIPTIONS_NAME, bytes(blob))
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "fingerprint": digest.hexdigest(),
+            "count": len(spells),
+            "shards": entries,
+            "descriptions": {"file": DESCRIPTIONS_NAME, "bytes": len(blob)},
+        }
+        _write_atomic(directory / MANIFEST_NAME, codec.dumps(manifest, indent=True))
+        return cls(directory, codec)
+
+    def manifest(self) -> dict:
+        if self._manifest is None:
+            path = self.directory / MANIFEST_NAME
+            if not path.exists():
+                raise FileNotFoundError(f"Sharded corpus manifest not found: {path}")
+            manifest = self.codec.load_path(path)
+            if manifest.get("version") not in READABLE_VERSIONS:
+                raise ValueError(f"Unsupported corpus manifest version: {manifest.get('version')}")
+            self._manifest = manifest
+        return self._manifest
+
+    def shards_for(self, options: DeckOptions) -> list[str]:
+        shards = self.manifest()["shards"]
+        if options.spells or options.search:
+            return list(shards)
+        return [
+            key
+            for key, entry in shards.items()
+            if (not options.levels or (key != "none" and int(key) in options.levels))
+            and (not options.classes or set(options.classes) & set(entry["classes"]))
+            and (not options.schools or set(options.schools) & set(entry["schools"]))
+        ]
+
+    def load_all_spells(self) -> list[dict]:
+        return self._load(list(self.manifest()["shards"]))
+
+    def load_spells_for(self, options: DeckOptions) -> list[dict]:
+        return self._load(self.shards_for(options))
+
+    def fingerprint(self) -> str:
+        """Identifies the compiled corpus plus which shards were last loaded."""
+        if self._fingerprint is None:
+            self.load_all_spells()
+        return self._fingerprint
+
+    def _load(self, keys: list[str]) -> list[dict]:
+        manifest = self.manifest()
+        spells: list[dict] = []
+        for key in keys:
+            spells.extend(self.codec.load_path(self.directory / manifest["shards"][key]["file"]))
+        if "descriptions" in manifest:
+            self._attach_descriptions(spells, manifest["descriptions"]["file"])
+        shard_set = ",".join(keys)
+        self._fingerprint = hashlib.sha256(
+            f"{manifest['fingerprint']}:{shard_set}".encode("utf-8")
+        ).hexdigest()
+        return spells
+
+    def _attach_descriptions(self, spells: list[dict], filename: str) -> None:
+        if self._descriptions is None:
+            self._descriptions = MappedText(self.directory / filename)
+        blob = self._descriptions
+        for spell in spells:
+            ref = spell.pop(DESC_REF, None)
+            if ref is not None:
+                offset, length = ref
+                spell["desc"] = (
+                    LazyText(blob, offset, length)
+                    if self.lazy_descriptions
+                    else blob.read(offset, length)
+                )
@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from dmforge.infrastructure.cache.disk_cache import DEFAULT_MAX_BYTES, DiskCache, default_cache_dir
+
+# Top-level app used by main.py as "cache"
+app = typer.Typer()
+
+_MB = 1024 * 1024
+
+
+def _open(cache_dir: Optional[Path], max_mb: Optional[float]) -> DiskCache:
+    max_bytes = DEFAULT_MAX_BYTES if max_mb is None else int(max_mb * _MB)
+    return DiskCache(cache_dir or default_cache_dir(), max_bytes=max_bytes)
+
+
+@app.command()
+def stats(
+    cache_dir: Annotated[
+        Optional[Path],
+        typer.Option("--cache-dir", help="Shared cache root (default: $DMFORGE_CACHE_DIR)"),
+    ] = None,
+    as_json: Annotated[bool, typer.Option("--json", help="Print stats as JSON")] = False,
+):
+    """
+    Show entries, size, hit rate and evictions per namespace of the shared
+    cache (used by `deck art --shared-cache`).
+    """
+    summary = _open(cache_dir, None).stats()
+    if as_json:
+        typer.echo(json.dumps(summary, indent=2))
+        return
+    typer.echo(
+        f"Cache at {summary['root']}: {summary['entries']} entries, "
+        f"{summary['bytes'] / _MB:.1f} MB of {summary['max_bytes'] / _MB:.0f} MB"
+    )
+    for name, entry in summary["namespaces"].items():
+        typer.echo(
+            f"  {name}: {entry['entries']} entries, {entry['bytes'] / _MB:.1f} MB, "
+            f"{entry['hits']} hits, {entry['misses']} misses "
+            f"({entry['hit_rate']:.0%}), {entry['evictions']} evicted"
+        )
+
+
+@app.command()
+def prune(
+    cache_dir: Annotated[
+        Optional[Path],
+        typer.Option("--cache-dir", help="Shared cache root (default: $DMFORGE_CACHE_DIR)"),
+    ] = None,
+    max_mb: Annotated[
+        Optional[float],
+        typer.Option("--max-mb", help="Evict least recently used entries down to this size"),
+    ] = None,
+    namespace: Annotated[
+        Optional[str], typer.Option("--namespace", help="Only prune this namespace")
+    ] = None,
+):
+    """
+    Evict least recently used shared cache entries until the cache fits its budget.
+    """
+    if max_mb is not None and max_mb < 0:
+        typer.echo("❌ --max-mb must not be negative", err=True)
+        raise typer.Exit(1)
+    try:
+        result = _open(cache_dir, max_mb).prune(namespace=namespace)
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+    typer.echo(
+        f"✅ Removed {result['removed']} entries ({result['freed_bytes'] / _MB:.1f} MB freed)"
+    )
@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+from typing import Annotated, Optional
+from urllib.parse import urlparse
+
+import typer
+from dmforge.application.controllers.art_controller import ArtController
+from dmforge.application.services.art_pipeline import ArtPipeline
+from dmforge.infrastructure.art.file_image_cache import FileImageCache
+from dmforge.infrastructure.art.openai_image_generator import OpenAIImageGenerator
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+
+app = typer.Typer()
+
+_LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def _is_local(base_url: Optional[str]) -> bool:
+    return bool(base_url) and urlparse(base_url).hostname in _LOCAL_HOSTS
+
+
+@app.command()
+def art(
+    input: Annotated[Path, typer.Option("--input", help="Path to deck JSON file")] = Path(
+        "exports/dev/deck_latest.json"
+    ),
+    output: Annotated[
+        Optional[Path], typer.Option("--output", help="Deck JSON with art paths (default: input)")
+    ] = None,
+    cache_dir: Annotated[
+        Path, typer.Option("--cache-dir", help="Content-addressed image cache directory")
+    ] = Path("exports/art_cache"),
+    shared_cache: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--shared-cache",
+            help="Store images in the shared cache at this root ('art' namespace) instead; "
+            "cached images may be evicted under the cache's size budget",
+        ),
+    ] = None,
+    model: Annotated[str, typer.Option("--model", help="Image model")] = "dall-e-3",
+    size: Annotated[str, typer.Option("--size", help="Image size")] = "1024x1024",
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", help="Maximum requests in flight")
+    ] = 4,
+    rate_limit: Annotated[
+        float, typer.Option("--rate-limit", help="Maximum requests per second (0 = unlimited)")
+    ] = 0.0,
+    base_url: Annotated[
+        Optional[str], typer.Option("--base-url", help="Images API base URL override")
+    ] = None,
+    overwrite: Annotated[
+        bool, typer.Option("--overwrite", help="Replace art on cards that already have it")
+    ] = False,
+):
+    """
+    Generate card art for a deck and record the image paths on its cards.
+    """
+    if not input.exists():
+        typer.echo(f"❌ Input file not found: {input}", err=True)
+        raise typer.Exit(1)
+
+    # Only a local stub may run without a key; anything else would fail every request.
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key and not _is_local(base_url):
+        typer.echo("❌ OPENAI_API_KEY is not set", err=True)
+        raise typer.Exit(1)
+
+    output = output or input
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    generator = OpenAIImageGenerator(api_key=api_key or "unset", base_url=base_url)
+    if shared_cache:
+        # Imported here so the default per-deck cache doesn't depend on the shared one.
+        from dmforge.infrastructure.cache.disk_cache import DiskCache
+
+        image_cache = DiskCache(shared_cache).namespace("art", ".png")
+    else:
+        image_cache = FileImageCache(cache_dir)
+    pipeline = ArtPipeline(
+        generator,
+        image_cache,
+        model=model,
+        size=size,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+    )
+    controller = ArtController(pipeline, JSONDeckStorage())
+
+    try:
+        deck = controller.generate_from_file(input, output, overwrite=overwrite)
+    except Exception as e:
+        typer.echo(f"❌ Art generation failed: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    with_art = sum(1 for card in deck.cards if card.art_path)
+    typer.echo(f"✅ {with_art}/{len(deck.cards)} cards have art ({pipeline.requests} generated)")
+    typer.echo(f"✅ Deck saved to: {output}")
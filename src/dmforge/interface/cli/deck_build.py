@@ -1,20 +1,55 @@
+import glob
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 from dmforge.application.controllers.deck_controller import DeckController
-from dmforge.application.services.deck_builder import BasicDeckBuilder
+from dmforge.application.ports.spell_repository import SpellRepository
+from dmforge.application.services.deck_builder import SORT_KEYS, BasicDeckBuilder
+from dmforge.application.services.deck_rebuilder import DeckRebuilder
+from dmforge.application.services.result_cache import LRUResultCache
+from dmforge.application.services.search_index import SEARCH_MODES
+from dmforge.domain.models import DeckOptions
+from dmforge.infrastructure.repository.composite_spell_repository import (
+    CompositeSpellRepository,
+)
+from dmforge.infrastructure.repository.json_build_ledger import JSONBuildLedger
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+from dmforge.infrastructure.repository.json_result_cache import JSONResultCache
+from dmforge.infrastructure.repository.json_search_index_store import JSONSearchIndexStore
 from dmforge.infrastructure.repository.json_spell_repository import JSONSpellRepository
+from dmforge.infrastructure.repository.sharded_spell_repository import (
+    MANIFEST_NAME,
+    ShardedSpellRepository,
+)
 
 app = typer.Typer()
 
 
+def open_spell_repository(
+    spell_data: Path, strict: bool = False, lazy_descriptions: bool = False
+) -> SpellRepository:
+    """
+    A single JSON file, a compiled sharded corpus (a directory with a
+    manifest), or a merged view over a directory/glob of JSON files.
+    Lazy descriptions apply to compiled corpora only.
+    """
+    if (spell_data / MANIFEST_NAME).is_file():
+        return ShardedSpellRepository(spell_data, lazy_descriptions=lazy_descriptions)
+    if spell_data.is_dir() or glob.has_magic(str(spell_data)):
+        return CompositeSpellRepository(spell_data, strict=strict)
+    return JSONSpellRepository(spell_data, strict=strict)
+
+
 @app.command()
 def build(
-    spell_data: Annotated[Path, typer.Option("--spell-data", help="Path to spell JSON")] = Path(
-        "data/spells/spells.json"
-    ),
+    spell_data: Annotated[
+        Path,
+        typer.Option(
+            "--spell-data", help="Path to spell JSON, or a directory/glob of spell JSON files"
+        ),
+    ] = Path("data/spells/spells.json"),
     output: Annotated[Path, typer.Option("--output", help="Path to save deck JSON")] = None,
     name: Annotated[str, typer.Option("--name", help="Deck name")] = "Untitled Deck",
     classes: Annotated[
@@ -26,15 +61,86 @@ def build(
     schools: Annotated[
         Optional[list[str]], typer.Option("--school", "-s", help="School filters")
     ] = None,
+    search: Annotated[
+        Optional[str],
+        typer.Option("--search", help="Ranked keyword search over spell names and descriptions"),
+    ] = None,
+    search_mode: Annotated[
+        str, typer.Option("--search-mode", help="Search matching: token, substring or fuzzy")
+    ] = "token",
+    search_index: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--search-index", help="Search index file (default: alongside the spell data)"
+        ),
+    ] = None,
+    spell_names: Annotated[
+        Optional[list[str]],
+        typer.Option("--spell", help="Pick a spell by name (prefix and typo tolerant)"),
+    ] = None,
+    spell_list: Annotated[
+        Optional[Path],
+        typer.Option("--spell-list", help="File with one spell name per line ('#' comments)"),
+    ] = None,
+    sort: Annotated[
+        Optional[str],
+        typer.Option("--sort", help=f"Sort by {', '.join(SORT_KEYS)}; prefix '-' to reverse"),
+    ] = None,
+    offset: Annotated[int, typer.Option("--offset", help="Skip this many cards")] = 0,
+    limit: Annotated[Optional[int], typer.Option("--limit", help="Keep at most N cards")] = None,
+    pretty: Annotated[
+        bool, typer.Option("--pretty", help="Write indented deck JSON (default: compact)")
+    ] = False,
+    strict: Annotated[
+        bool, typer.Option("--strict", help="Type-check every spell record while loading")
+    ] = False,
+    lazy_descriptions: Annotated[
+        bool,
+        typer.Option(
+            "--lazy-descriptions",
+            help="With a compiled corpus, read descriptions only for the cards in the deck",
+        ),
+    ] = False,
+    cache_dir: Annotated[
+        Optional[Path],
+        typer.Option("--cache-dir", help="Directory for cached filter results (disabled if unset)"),
+    ] = None,
+    ledger: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--ledger",
+            help="Record this build in a build ledger so 'deck rebuild' can patch it "
+            "(e.g. exports/build_ledger.json)",
+        ),
+    ] = None,
 ):
     """
     Build a filtered deck of spells from input data.
     """
+    multi_source = spell_data.is_dir() or glob.has_magic(str(spell_data))
+
     # Validate spell_data file exists
-    if not spell_data.exists():
+    if not multi_source and not spell_data.exists():
         typer.echo(f"❌ Spell data not found at: {spell_data}", err=True)
         raise typer.Exit(1)
 
+    if search_mode not in SEARCH_MODES:
+        typer.echo(f"❌ Unsupported search mode: {search_mode}", err=True)
+        raise typer.Exit(1)
+
+    if search_index is None and not glob.has_magic(str(spell_data)):
+        search_index = spell_data.parent / f"{spell_data.name}.search.idx"
+
+    spell_names = list(spell_names or [])
+    if spell_list is not None:
+        if not spell_list.exists():
+            typer.echo(f"❌ Spell list not found at: {spell_list}", err=True)
+            raise typer.Exit(1)
+        for line in spell_list.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                spell_names.append(line)
+
     # Default output file if not provided
     if output is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -47,8 +153,10 @@ def build(
     levels = levels or []
     schools = schools or []
 
-    repo = JSONSpellRepository(spell_data)
-    builder = BasicDeckBuilder(repo)
+    repo = open_spell_repository(spell_data, strict=strict, lazy_descriptions=lazy_descriptions)
+    cache = LRUResultCache(backing=JSONResultCache(cache_dir)) if cache_dir else None
+    index_store = JSONSearchIndexStore(search_index) if search_index else None
+    builder = BasicDeckBuilder(repo, cache=cache, index_store=index_store)
     controller = DeckController(builder)
 
     options_dict = {
@@ -56,8 +164,42 @@ def build(
         "classes": classes,
         "levels": levels,
         "schools": schools,
+        "search": search,
+        "search_mode": search_mode,
+        "spells": spell_names,
+        "sort": sort,
+        "offset": offset,
+        "limit": limit,
     }
+    options = DeckOptions(
+        name=name,
+        classes=classes,
+        levels=levels,
+        schools=schools,
+        search=search or "",
+        search_mode=search_mode,
+        spells=spell_names,
+        sort=sort or "",
+        offset=offset,
+        limit=limit,
+    )
 
-    deck = controller.build_from_cli(options_dict)
-    output.write_text(deck.to_json(), encoding="utf-8")
+    try:
+        if ledger is None:
+            deck = controller.build_from_cli(options_dict)
+        else:
+            # The ledger records the whole corpus; build from that one load.
+            spells = repo.load_all_spells()
+            deck = builder.build_from(spells, options)
+    except FileNotFoundError as e:
+        typer.echo(f"❌ Spell data not found at: {spell_data}", err=True)
+        raise typer.Exit(1) from e
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+    storage = JSONDeckStorage(indent=pretty)
+    storage.save(deck, output)
+    if ledger is not None:
+        rebuilder = DeckRebuilder(JSONBuildLedger(ledger), storage, open_spell_repository)
+        rebuilder.record(str(spell_data), spells, output, options, deck)
     typer.echo(f"✅ Deck saved to: {output}")
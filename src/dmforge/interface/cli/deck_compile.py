@@ -0,0 +1,34 @@
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from dmforge.infrastructure.repository.sharded_spell_repository import ShardedSpellRepository
+from dmforge.interface.cli.deck_build import open_spell_repository
+
+app = typer.Typer()
+
+
+@app.command()
+def compile_corpus(
+    spell_data: Annotated[
+        Path, typer.Option("--spell-data", help="Path to spell JSON, or a directory/glob")
+    ] = Path("data/spells/spells.json"),
+    output: Annotated[
+        Path, typer.Option("--output", help="Directory for the sharded corpus")
+    ] = Path("data/spells/compiled"),
+    strict: Annotated[
+        bool, typer.Option("--strict", help="Type-check every spell record while loading")
+    ] = False,
+):
+    """
+    Compile spell data into a sharded corpus (one shard per level plus a manifest).
+    """
+    try:
+        spells = open_spell_repository(spell_data, strict=strict).load_all_spells()
+        repo = ShardedSpellRepository.compile(spells, output)
+    except (OSError, ValueError) as e:
+        typer.echo(f"❌ Compile failed: {e}", err=True)
+        raise typer.Exit(1) from e
+
+    shards = repo.manifest()["shards"]
+    typer.echo(f"✅ Compiled {len(spells)} spells into {len(shards)} shards at: {output}")
@@ -0,0 +1,110 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from dmforge.application.services.deck_deriver import SORT_KEYS, DeckDeriver, DeriveSpec
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+
+app = typer.Typer()
+
+
+@app.command()
+def derive(
+    input: Annotated[Path, typer.Option("--input", help="Master deck JSON file")] = Path(
+        "exports/dev/deck_latest.json"
+    ),
+    output: Annotated[Optional[Path], typer.Option("--output", help="Derived deck path")] = None,
+    name: Annotated[Optional[str], typer.Option("--name", help="Derived deck name")] = None,
+    union: Annotated[
+        Optional[list[Path]], typer.Option("--union", help="Add the cards of another deck")
+    ] = None,
+    intersect: Annotated[
+        Optional[list[Path]],
+        typer.Option("--intersect", help="Keep only cards also in another deck"),
+    ] = None,
+    minus: Annotated[
+        Optional[list[Path]],
+        typer.Option("--minus", help="Drop cards found in another deck (e.g. already printed)"),
+    ] = None,
+    classes: Annotated[
+        Optional[list[str]], typer.Option("--class", "-c", help="Class filters")
+    ] = None,
+    levels: Annotated[
+        Optional[list[int]], typer.Option("--level", "-l", help="Level filters")
+    ] = None,
+    schools: Annotated[
+        Optional[list[str]], typer.Option("--school", "-s", help="School filters")
+    ] = None,
+    sort: Annotated[
+        Optional[str],
+        typer.Option("--sort", help=f"Sort by {', '.join(SORT_KEYS)}; prefix '-' to reverse"),
+    ] = None,
+    offset: Annotated[int, typer.Option("--offset", help="Skip this many cards")] = 0,
+    limit: Annotated[Optional[int], typer.Option("--limit", help="Keep at most N cards")] = None,
+    spec: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--spec",
+            help="JSON list of derivations, each with an 'output' plus any of the options above",
+        ),
+    ] = None,
+    pretty: Annotated[
+        bool, typer.Option("--pretty", help="Write indented deck JSON (default: compact)")
+    ] = False,
+):
+    """
+    Derive decks from a master deck with set operations, filters, sorting and slicing.
+
+    With --spec, many decks are derived from one loaded master in a single run.
+    """
+    if not input.exists():
+        typer.echo(f"❌ Input file not found: {input}", err=True)
+        raise typer.Exit(1)
+
+    if spec is not None:
+        if not spec.exists():
+            typer.echo(f"❌ Spec file not found: {spec}", err=True)
+            raise typer.Exit(1)
+        entries = json.loads(spec.read_text(encoding="utf-8"))
+        if not isinstance(entries, list) or not all("output" in e for e in entries):
+            typer.echo("❌ Spec must be a JSON list of objects with an 'output' path", err=True)
+            raise typer.Exit(1)
+    else:
+        if output is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output = Path(f"exports/dev/deck_derived_{timestamp}.json")
+        entries = [
+            {
+                "output": str(output),
+                "name": name or "",
+                "union": [str(p) for p in union or []],
+                "intersect": [str(p) for p in intersect or []],
+                "minus": [str(p) for p in minus or []],
+                "classes": classes or [],
+                "levels": levels or [],
+                "schools": schools or [],
+                "sort": sort or "",
+                "offset": offset,
+                "limit": limit,
+            }
+        ]
+
+    storage = JSONDeckStorage(indent=pretty)
+    deriver = DeckDeriver(storage)
+    try:
+        master = storage.load(input)
+        for entry in entries:
+            deck = deriver.derive(master, DeriveSpec.from_dict(entry))
+            path = Path(entry["output"])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            storage.save(deck, path)
+            if spec is None:
+                typer.echo(f"✅ Derived deck with {len(deck.cards)} cards saved to: {path}")
+    except (ValueError, TypeError, FileNotFoundError) as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    if spec is not None:
+        typer.echo(f"✅ Derived {len(entries)} decks from: {input}")
@@ -0,0 +1,48 @@
+import glob
+import json
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from dmforge.application.controllers.deck_controller import DeckController
+from dmforge.application.services.deck_builder import BasicDeckBuilder
+from dmforge.interface.cli.deck_build import open_spell_repository
+
+app = typer.Typer()
+
+
+@app.command()
+def facets(
+    spell_data: Annotated[
+        Path, typer.Option("--spell-data", help="Path to spell JSON, or a directory/glob")
+    ] = Path("data/spells/spells.json"),
+    classes: Annotated[
+        Optional[list[str]], typer.Option("--class", "-c", help="Class filters")
+    ] = None,
+    levels: Annotated[
+        Optional[list[int]], typer.Option("--level", "-l", help="Level filters")
+    ] = None,
+    schools: Annotated[
+        Optional[list[str]], typer.Option("--school", "-s", help="School filters")
+    ] = None,
+    search: Annotated[
+        Optional[str], typer.Option("--search", help="Keyword search over spell text")
+    ] = None,
+):
+    """
+    Print per-class/level/school spell counts for the given filters as JSON.
+    """
+    if not spell_data.exists() and not glob.has_magic(str(spell_data)):
+        typer.echo(f"❌ Spell data not found at: {spell_data}", err=True)
+        raise typer.Exit(1)
+
+    controller = DeckController(BasicDeckBuilder(open_spell_repository(spell_data)))
+    counts = controller.facet_counts(
+        {
+            "classes": classes or [],
+            "levels": levels or [],
+            "schools": schools or [],
+            "search": search,
+        }
+    )
+    typer.echo(json.dumps(counts, indent=2))
@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from dmforge.application.services.deck_rebuilder import DeckRebuilder
+from dmforge.infrastructure.repository.json_build_ledger import JSONBuildLedger
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+from dmforge.interface.cli.deck_build import open_spell_repository
+
+app = typer.Typer()
+
+
+@app.command()
+def rebuild(
+    ledger: Annotated[
+        Path, typer.Option("--ledger", help="Build ledger written by 'deck build --ledger'")
+    ] = Path("exports/build_ledger.json"),
+    spell_data: Annotated[
+        Optional[list[str]],
+        typer.Option("--spell-data", help="Only rebuild decks built from this spell data"),
+    ] = None,
+    dry_run: Annotated[
+        bool, typer.Option("--dry-run", help="Report affected decks without writing anything")
+    ] = False,
+    pretty: Annotated[
+        bool, typer.Option("--pretty", help="Write indented deck JSON (default: compact)")
+    ] = False,
+    as_json: Annotated[bool, typer.Option("--json", help="Print the report as JSON")] = False,
+):
+    """
+    Bring recorded decks up to date with their spell data, rewriting only the
+    decks and cards that the spell changes affect.
+    """
+    if not ledger.exists():
+        typer.echo(f"❌ Build ledger not found: {ledger}", err=True)
+        raise typer.Exit(1)
+
+    rebuilder = DeckRebuilder(
+        JSONBuildLedger(ledger), JSONDeckStorage(indent=pretty), open_spell_repository
+    )
+    try:
+        report = rebuilder.rebuild(sources=spell_data or None, dry_run=dry_run)
+    except (ValueError, FileNotFoundError) as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    if as_json:
+        typer.echo(json.dumps(report.to_dict(), indent=2))
+        return
+    for path in report.missing:
+        typer.echo(f"⚠️ Deck file missing, dropped from ledger: {path}", err=True)
+    verb = "would rewrite" if dry_run else "rewrote"
+    typer.echo(
+        f"✅ Checked {report.decks} decks, {verb} {len(report.rewritten)} "
+        f"({report.patched} cards patched, {report.added} added, {report.removed} removed, "
+        f"{len(report.rebuilt)} full rebuilds)"
+    )
+    for path in report.rewritten:
+        typer.echo(f"  {path}")
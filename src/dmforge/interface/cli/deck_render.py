@@ -1,11 +1,20 @@
+import json
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 
 import typer
 from dmforge.application.controllers.render_controller import RenderController
+from dmforge.application.ports.render_service import RenderLimitExceeded
+from dmforge.application.services.card_layout import get_layout
+from dmforge.application.services.isolated_renderer import IsolatedRenderer, check_limits
 from dmforge.application.services.weasy_renderer import WeasyRenderer
+from dmforge.infrastructure.art.print_asset_processor import PrintAssetProcessor
 from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+from dmforge.infrastructure.repository.json_deck_validator import (
+    JSONDeckValidator,
+    find_deck_files,
+)
 
 # Top-level app used by main.py as "render"
 app = typer.Typer()
@@ -28,15 +37,81 @@ def render(
     asset_dir: Annotated[Path, typer.Option("--asset-dir", help="Path to assets directory")] = Path(
         "src/dmforge/resources/assets"
     ),
+    layout: Annotated[
+        str, typer.Option("--layout", help="Cards per sheet: 4up, 6up, 9up or COLSxROWS")
+    ] = "6up",
+    art_dpi: Annotated[
+        Optional[int],
+        typer.Option("--art-dpi", help="Downscale card art to this print DPI (default: off)"),
+    ] = None,
+    asset_cache_dir: Annotated[
+        Path, typer.Option("--asset-cache-dir", help="Cache for print-ready art")
+    ] = Path("exports/asset_cache"),
+    split_pages: Annotated[
+        Optional[int],
+        typer.Option("--split-pages", help="Write the PDF as separate files of N sheets each"),
+    ] = None,
+    split_workers: Annotated[
+        int,
+        typer.Option(
+            "--split-workers",
+            help="Split files to write concurrently (default 1, sequential; more threads share "
+            "font objects WeasyPrint does not document as thread-safe)",
+        ),
+    ] = 1,
+    html_pages: Annotated[
+        Optional[int],
+        typer.Option(
+            "--html-pages",
+            help="Write HTML as a directory of page files with N cards each, plus an index",
+        ),
+    ] = None,
+    pack: Annotated[
+        Optional[list[Path]],
+        typer.Option(
+            "--pack",
+            help="Deck JSON to pack onto shared sheets with the other --pack decks (repeatable; "
+            "replaces --input)",
+        ),
+    ] = None,
+    timeout: Annotated[
+        Optional[float], typer.Option("--timeout", help="Kill the render after this many seconds")
+    ] = None,
+    memory_limit: Annotated[
+        Optional[int], typer.Option("--memory-limit", help="Render memory cap in MB")
+    ] = None,
+    cpu_limit: Annotated[
+        Optional[int], typer.Option("--cpu-limit", help="Render CPU time cap in seconds")
+    ] = None,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Enable verbose output")] = False,
 ):
     """
     Render a deck as a PDF or HTML using the given JSON input.
+
+    Any of --timeout, --memory-limit or --cpu-limit runs the render in a
+    child process that is killed if it goes over. With --pack, several decks
+    share sheets, each card marked with its deck, in a single render pass.
     """
+    if split_pages is not None and (split_pages < 1 or format.lower() != "pdf"):
+        typer.echo("❌ --split-pages needs a positive page count and PDF output", err=True)
+        raise typer.Exit(1)
+    if html_pages is not None and (html_pages < 1 or format.lower() != "html"):
+        typer.echo("❌ --html-pages needs a positive card count and HTML output", err=True)
+        raise typer.Exit(1)
+    if pack and (split_pages is not None or html_pages is not None):
+        typer.echo("❌ --pack cannot be combined with --split-pages or --html-pages", err=True)
+        raise typer.Exit(1)
     try:
-        if not input.exists():
-            typer.echo(f"❌ Input file not found: {input}", err=True)
-            raise
+        isolate = check_limits(timeout, memory_limit, cpu_limit)
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+
+    try:
+        for path in pack or [input]:
+            if not path.exists():
+                typer.echo(f"❌ Input file not found: {path}", err=True)
+                raise
 
         if not template_dir.exists():
             typer.echo(f"❌ Template directory not found: {template_dir}", err=True)
@@ -49,24 +124,62 @@ def render(
 
         if output is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output = Path(f"exports/dev/render_{timestamp}.{format_lower}")
+            suffix = "" if html_pages else f".{format_lower}"
+            output = Path(f"exports/dev/render_{timestamp}{suffix}")
 
         output.parent.mkdir(parents=True, exist_ok=True)
 
-        renderer = WeasyRenderer(template_dir=template_dir, asset_dir=asset_dir, verbose=verbose)
+        renderer = WeasyRenderer(
+            template_dir=template_dir,
+            asset_dir=asset_dir,
+            verbose=verbose,
+            layout=get_layout(layout),
+        )
+        if isolate:
+            renderer = IsolatedRenderer(renderer, timeout, memory_limit, cpu_limit)
         storage = JSONDeckStorage()
-        controller = RenderController(renderer, storage)
+        assets = (
+            PrintAssetProcessor(asset_cache_dir, asset_dir=asset_dir, dpi=art_dpi)
+            if art_dpi and art_dpi > 0
+            else None
+        )
+        controller = RenderController(renderer, storage, assets=assets)
 
         if verbose:
             typer.echo(f"🔧 Input:        {input}")
             typer.echo(f"🔧 Output:       {output}")
             typer.echo(f"🔧 Format:       {format_lower}")
+            typer.echo(f"🔧 Layout:       {layout}")
             typer.echo(f"🔧 Template dir: {template_dir}")
             typer.echo(f"🔧 Asset dir:    {asset_dir}")
 
-        controller.render_from_file(input_path=input, fmt=format_lower, output_path=output)
-        typer.echo(f"✅ Rendered {format.upper()} to: {output}")
-
+        if pack:
+            sheets = controller.render_packed_files(pack, format_lower, output)
+            typer.echo(
+                f"✅ Packed {len(pack)} decks onto {sheets} sheets in {format.upper()}: {output}"
+            )
+            return
+
+        written = controller.render_from_file(
+            input_path=input,
+            fmt=format_lower,
+            output_path=output,
+            split_pages=split_pages,
+            split_workers=split_workers,
+            html_pages=html_pages,
+        )
+        if html_pages:
+            typer.echo(f"✅ Rendered {len(written) - 1} HTML pages and index to: {output}")
+        elif split_pages:
+            typer.echo(f"✅ Rendered {len(written)} PDF files:")
+            for path in written:
+                typer.echo(f"   {path}")
+        else:
+            typer.echo(f"✅ Rendered {format.upper()} to: {output}")
+
+    except RenderLimitExceeded as e:
+        typer.echo(f"❌ Render stopped ({e.kind} limit): {e}", err=True)
+        raise typer.Exit(1) from e
     except Exception as e:
         typer.echo(f"❌ Error during rendering: {str(e)}", err=True)
         if verbose:
@@ -81,10 +194,33 @@ def validate(
     input: Annotated[Path, typer.Option("--input", help="Path to deck JSON file")] = Path(
         "exports/dev/deck_latest.json"
     ),
+    dir: Annotated[
+        Optional[Path], typer.Option("--dir", help="Validate every deck file in this directory")
+    ] = None,
+    pattern: Annotated[
+        Optional[str],
+        typer.Option("--glob", help="File pattern, relative to --dir if given (e.g. '**/*.json')"),
+    ] = None,
+    workers: Annotated[
+        Optional[int], typer.Option("--workers", help="Worker processes for bulk validation")
+    ] = None,
 ):
     """
     Validate a deck JSON file without rendering.
+
+    With --dir and/or --glob, validates many files in parallel and prints a JSON summary.
     """
+    if dir is not None or pattern is not None:
+        if dir is not None and not dir.is_dir():
+            typer.echo(f"❌ Directory not found: {dir}", err=True)
+            raise typer.Exit(1)
+        paths = find_deck_files(dir, pattern or "*.json")
+        summary = JSONDeckValidator(max_workers=workers).validate_many(paths)
+        typer.echo(json.dumps(summary, indent=2))
+        if summary["invalid"]:
+            raise typer.Exit(1)
+        return
+
     try:
         if not input.exists():
             typer.echo(f"❌ Input file not found: {input}", err=True)
@@ -0,0 +1,213 @@
+import functools
+import json
+import logging
+import multiprocessing
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from dmforge.application.controllers.render_controller import RenderController
+from dmforge.application.services.isolated_renderer import check_limits
+from dmforge.application.services.render_worker import RenderWorker
+from dmforge.infrastructure.queue.sqlite_render_queue import SQLiteRenderQueue
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+
+# Job queue commands, mounted under "render" by main.py
+app = typer.Typer()
+
+QueueOption = Annotated[Path, typer.Option("--queue", help="Path to the render job queue database")]
+DEFAULT_QUEUE = Path("exports/render_queue.db")
+
+
+def make_controller(
+    params: dict,
+    timeout: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+    cpu_seconds: Optional[int] = None,
+) -> RenderController:
+    # Imported here so enqueue/status/result don't pay for loading WeasyPrint.
+    from dmforge.application.services.card_layout import get_layout
+    from dmforge.application.services.isolated_renderer import IsolatedRenderer
+    from dmforge.application.services.weasy_renderer import WeasyRenderer
+    from dmforge.infrastructure.art.print_asset_processor import PrintAssetProcessor
+
+    asset_dir = Path(params["asset_dir"])
+    renderer = WeasyRenderer(
+        template_dir=Path(params["template_dir"]),
+        asset_dir=asset_dir,
+        layout=get_layout(params["layout"]),
+    )
+    if check_limits(timeout, memory_mb, cpu_seconds):
+        renderer = IsolatedRenderer(renderer, timeout, memory_mb, cpu_seconds)
+    assets = (
+        PrintAssetProcessor(
+            Path(params["asset_cache_dir"]), asset_dir=asset_dir, dpi=params["art_dpi"]
+        )
+        if (params.get("art_dpi") or 0) > 0
+        else None
+    )
+    return RenderController(renderer, JSONDeckStorage(), assets=assets)
+
+
+def _run_worker(queue_path: Path, poll_interval: float, drain: bool, limits: dict) -> None:
+    factory = functools.partial(make_controller, **limits)
+    worker = RenderWorker(SQLiteRenderQueue(queue_path), factory, poll_interval=poll_interval)
+    worker.run(drain=drain)
+    if worker.kills:
+        logging.warning(f"⚠️ Worker {worker.name} killed renders: {worker.kills}")
+
+
+@app.command()
+def enqueue(
+    inputs: Annotated[
+        list[Path], typer.Option("--input", help="Deck JSON file to render (repeatable)")
+    ],
+    output: Annotated[
+        Optional[Path],
+        typer.Option("--output", help="Output path (single input only; default: exports/jobs/)"),
+    ] = None,
+    format: Annotated[
+        str, typer.Option("--format", "-f", help="Output format: pdf or html")
+    ] = "pdf",
+    template_dir: Annotated[
+        Path, typer.Option("--template-dir", help="Path to templates directory")
+    ] = Path("src/dmforge/resources/templates"),
+    asset_dir: Annotated[Path, typer.Option("--asset-dir", help="Path to assets directory")] = Path(
+        "src/dmforge/resources/assets"
+    ),
+    layout: Annotated[
+        str, typer.Option("--layout", help="Cards per sheet: 4up, 6up, 9up or COLSxROWS")
+    ] = "6up",
+    art_dpi: Annotated[
+        Optional[int],
+        typer.Option("--art-dpi", help="Downscale card art to this print DPI (default: off)"),
+    ] = None,
+    asset_cache_dir: Annotated[
+        Path, typer.Option("--asset-cache-dir", help="Cache for print-ready art")
+    ] = Path("exports/asset_cache"),
+    max_attempts: Annotated[
+        int, typer.Option("--max-attempts", help="Tries per job before it is marked failed")
+    ] = 3,
+    queue: QueueOption = DEFAULT_QUEUE,
+):
+    """
+    Queue deck renders for `render worker`. Prints the jobs as JSON; a render
+    identical to one already queued or done is not queued again.
+    """
+    format_lower = format.lower()
+    if format_lower not in ["pdf", "html"]:
+        typer.echo(f"❌ Unsupported format: {format}. Use 'pdf' or 'html'", err=True)
+        raise typer.Exit(1)
+    if output is not None and len(inputs) > 1:
+        typer.echo("❌ --output can only be used with a single --input", err=True)
+        raise typer.Exit(1)
+    missing = [str(p) for p in inputs if not p.is_file()]
+    if missing:
+        typer.echo(f"❌ Input file not found: {', '.join(missing)}", err=True)
+        raise typer.Exit(1)
+
+    params = {
+        "format": format_lower,
+        "template_dir": str(template_dir),
+        "asset_dir": str(asset_dir),
+        "layout": layout,
+        "art_dpi": art_dpi,
+        "asset_cache_dir": str(asset_cache_dir),
+    }
+    job_queue = SQLiteRenderQueue(queue)
+    jobs = [job_queue.enqueue(path, output, params, max_attempts) for path in inputs]
+    typer.echo(json.dumps([job.to_dict() for job in jobs], indent=2))
+
+
+@app.command()
+def status(
+    job: Annotated[Optional[int], typer.Option("--job", help="Show a single job")] = None,
+    queue: QueueOption = DEFAULT_QUEUE,
+):
+    """
+    Show job counts by status, or the details of one job.
+    """
+    job_queue = SQLiteRenderQueue(queue)
+    if job is None:
+        typer.echo(json.dumps(job_queue.counts(), indent=2))
+        return
+    found = job_queue.get(job)
+    if found is None:
+        typer.echo(f"❌ No such job: {job}", err=True)
+        raise typer.Exit(1)
+    typer.echo(json.dumps(found.to_dict(), indent=2))
+
+
+@app.command()
+def result(
+    job: Annotated[int, typer.Option("--job", help="Job ID")],
+    queue: QueueOption = DEFAULT_QUEUE,
+):
+    """
+    Print the output path of a finished job (exit 1 if it isn't done).
+    """
+    found = SQLiteRenderQueue(queue).get(job)
+    if found is None:
+        typer.echo(f"❌ No such job: {job}", err=True)
+        raise typer.Exit(1)
+    if found.status != "done":
+        detail = f": {found.error}" if found.error else ""
+        typer.echo(f"❌ Job {job} is {found.status}{detail}", err=True)
+        raise typer.Exit(1)
+    typer.echo(found.output_path)
+
+
+@app.command()
+def worker(
+    concurrency: Annotated[int, typer.Option("--concurrency", help="Worker processes to run")] = 1,
+    poll_interval: Annotated[
+        float, typer.Option("--poll-interval", help="Seconds between polls of an empty queue")
+    ] = 1.0,
+    drain: Annotated[
+        bool, typer.Option("--drain", help="Exit once no jobs are queued or running")
+    ] = False,
+    timeout: Annotated[
+        Optional[float], typer.Option("--timeout", help="Kill a render after this many seconds")
+    ] = None,
+    memory_limit: Annotated[
+        Optional[int], typer.Option("--memory-limit", help="Per-render memory cap in MB")
+    ] = None,
+    cpu_limit: Annotated[
+        Optional[int], typer.Option("--cpu-limit", help="Per-render CPU time cap in seconds")
+    ] = None,
+    queue: QueueOption = DEFAULT_QUEUE,
+):
+    """
+    Render queued jobs. Each worker process keeps its renderer warm between jobs.
+
+    With any limit set, each render runs in a child process that is killed on a
+    breach; killed jobs are marked failed without retrying.
+    """
+    if concurrency < 1:
+        typer.echo("❌ --concurrency must be at least 1", err=True)
+        raise typer.Exit(1)
+    try:
+        check_limits(timeout, memory_limit, cpu_limit)
+    except ValueError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+    SQLiteRenderQueue(queue)  # Create the database before workers race to do it
+    limits = {"timeout": timeout, "memory_mb": memory_limit, "cpu_seconds": cpu_limit}
+
+    if concurrency == 1:
+        _run_worker(queue, poll_interval, drain, limits)
+    else:
+        processes = [
+            multiprocessing.Process(target=_run_worker, args=(queue, poll_interval, drain, limits))
+            for _ in range(concurrency)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+            raise
+    typer.echo(f"✅ Workers finished: {json.dumps(SQLiteRenderQueue(queue).counts())}")
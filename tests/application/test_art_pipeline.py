@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+from dmforge.application.services.art_pipeline import ArtPipeline, art_key
+from dmforge.domain.models import Deck, SpellCard
+from dmforge.infrastructure.cache.disk_cache import DiskCache
+
+
+class FakeGenerator:
+    def __init__(self):
+        self.prompts = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate(self, prompt: str, model: str, size: str) -> bytes:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return prompt.encode("utf-8")
+
+
+class MemoryImageCache:
+    def __init__(self):
+        self.items = {}
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def put(self, key, data):
+        self.items[key] = f"/cache/{key}.png"
+        return self.items[key]
+
+
+def card(name: str, art_path=None) -> SpellCard:
+    return SpellCard(
+        name=name,
+        level=1,
+        school="Evocation",
+        classes=["Wizard"],
+        description=f"{name} does things. More text.",
+        duration="Instantaneous",
+        art_path=art_path,
+    )
+
+
+def test_art_key_depends_on_prompt_model_and_size():
+    assert art_key("p", "m", "s") == art_key("p", "m", "s")
+    assert len({art_key("p", "m", "s"), art_key("q", "m", "s"), art_key("p", "m", "t")}) == 3
+
+
+def test_duplicate_prompts_share_one_request():
+    generator = FakeGenerator()
+    pipeline = ArtPipeline(generator, MemoryImageCache())
+    deck = Deck(name="D", cards=[card("Shield"), card("Fireball"), card("Shield")])
+
+    result = asyncio.run(pipeline.run(deck))
+
+    assert len(generator.prompts) == 2
+    assert result.cards[0].art_path == result.cards[2].art_path
+    assert result.cards[0].art_path != result.cards[1].art_path
+
+
+def test_cached_images_are_not_regenerated_and_existing_art_kept():
+    generator = FakeGenerator()
+    cache = MemoryImageCache()
+    deck = Deck(name="D", cards=[card("Shield"), card("Light", art_path="mine.png")])
+
+    asyncio.run(ArtPipeline(generator, cache).run(deck))
+    result = asyncio.run(ArtPipeline(generator, cache).run(deck))
+
+    assert len(generator.prompts) == 1
+    assert result.cards[1].art_path == "mine.png"
+
+
+def test_concurrency_limit_is_respected():
+    generator = FakeGenerator()
+    pipeline = ArtPipeline(generator, MemoryImageCache(), concurrency=2)
+    deck = Deck(name="D", cards=[card(f"Spell {i}") for i in range(8)])
+
+    asyncio.run(pipeline.run(deck))
+
+    assert generator.peak == 2
+    assert pipeline.requests == 8
+
+
+def test_concurrent_runs_on_a_locking_cache_request_each_image_once(tmp_path):
+    generator = FakeGenerator()
+    deck = Deck(name="D", cards=[card("Shield"), card("Fireball")])
+    results = []
+
+    def run():
+        cache = DiskCache(tmp_path).namespace("art", ".png")
+        results.append(asyncio.run(ArtPipeline(generator, cache).run(deck)))
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(generator.prompts) == 2
+    assert len({tuple(c.art_path for c in deck.cards) for deck in results}) == 1
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+from dmforge.application.controllers.deck_controller import AsyncDeckController
+from dmforge.application.services import deck_builder
+from dmforge.application.services.async_adapters import (
+    ConcurrencyLimiter,
+    ExecutorDeckStorage,
+    ExecutorRenderService,
+    ExecutorSpellRepository,
+)
+from dmforge.application.services.deck_builder import BasicDeckBuilder
+from dmforge.application.services.result_cache import LRUResultCache
+from dmforge.domain.models import Deck, DeckOptions
+
+
+class SlowRenderer:
+    def __init__(self):
+        self.threads = set()
+
+    def render_pdf(self, deck: Deck, output_path: Path) -> None:
+        self.threads.add(threading.get_ident())
+        time.sleep(0.05)
+
+    def render_html(self, deck: Deck, output_path: Path) -> None:
+        self.render_pdf(deck, output_path)
+
+
+def test_renders_run_off_the_loop_within_the_limit():
+    renderer = SlowRenderer()
+    service = ExecutorRenderService(renderer, concurrency=2)
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    async def main():
+        beat = asyncio.create_task(heartbeat())
+        deck = Deck(name="D", cards=[])
+        await asyncio.gather(*(service.render_pdf(deck, Path(f"{i}.pdf")) for i in range(6)))
+        beat.cancel()
+
+    asyncio.run(main())
+
+    assert threading.get_ident() not in renderer.threads
+    assert service.limiter.peak == 2
+    assert ticks > 10  # The loop kept running while renders were in flight
+
+
+def test_shared_limiter_caps_adapters_jointly():
+    class Storage:
+        def load(self, path: Path) -> Deck:
+            time.sleep(0.02)
+            return Deck(name=path.stem, cards=[])
+
+        def save(self, deck: Deck, path: Path) -> None:
+            pass
+
+    class Repository:
+        def load_all_spells(self) -> list[dict]:
+            time.sleep(0.02)
+            return [{"name": "Shield"}]
+
+    limiter = ConcurrencyLimiter(1)
+    storage = ExecutorDeckStorage(Storage(), limiter=limiter)
+    repository = ExecutorSpellRepository(Repository(), limiter=limiter)
+
+    async def main():
+        return await asyncio.gather(
+            storage.load(Path("a.json")), repository.load_all_spells(), storage.load(Path("b.json"))
+        )
+
+    deck_a, spells, deck_b = asyncio.run(main())
+    assert (deck_a.name, deck_b.name, spells) == ("a", "b", [{"name": "Shield"}])
+    assert limiter.peak == 1
+
+
+def test_async_deck_controller_builds_in_executor():
+    class Builder:
+        def build(self, options: DeckOptions) -> Deck:
+            return Deck(name=options.name, cards=[])
+
+    controller = AsyncDeckController(Builder())
+    deck = asyncio.run(controller.build_from_cli({"name": "Async Deck"}))
+    assert deck.name == "Async Deck"
+
+
+def test_concurrent_builds_share_one_builder_safely(monkeypatch):
+    spells = [
+        {"name": f"Spell {i}", "level": i % 10, "classes": ["Wizard"], "desc": f"burst {i}"}
+        for i in range(200)
+    ]
+
+    class Repository:
+        def load_all_spells(self) -> list[dict]:
+            return spells
+
+        def fingerprint(self) -> str:
+            return "corpus"
+
+    builds = []
+    original = deck_builder.SpellSearchIndex.build
+
+    def slow_build(*args, **kwargs):
+        builds.append(threading.get_ident())
+        time.sleep(0.05)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(deck_builder.SpellSearchIndex, "build", slow_build)
+    # A two-entry LRU under ten distinct queries keeps evicting while others read.
+    builder = BasicDeckBuilder(Repository(), cache=LRUResultCache(max_entries=2))
+    controller = AsyncDeckController(builder, concurrency=8)
+
+    async def run():
+        return await asyncio.gather(
+            *(
+                controller.build_from_cli({"search": "burst", "levels": [n % 10]})
+                for n in range(80)
+            ),
+            *(controller.facet_counts({"search": "burst"}) for _ in range(8)),
+        )
+
+    results = asyncio.run(run())
+
+    assert len(builds) == 1
+    for n, deck in enumerate(results[:80]):
+        assert len(deck.cards) == 20
+        assert {card.level for card in deck.cards} == {n % 10}
+    assert all(counts["total"] == 200 for counts in results[80:])
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+from dmforge.application.services.card_layout import (
+    LAYOUTS,
+    LayoutSpec,
+    get_layout,
+    pack,
+    paginate,
+)
+from dmforge.application.services.text_fit import TextFit
+from dmforge.domain.models import Deck, SpellCard
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATE_DIR = Path("src/dmforge/resources/templates")
+
+
+def make_cards(n: int) -> list[SpellCard]:
+    return [
+        SpellCard(f"Spell {i}", 1, "Evocation", ["Wizard"], "Boom.", "Instant") for i in range(n)
+    ]
+
+
+def test_six_up_pages_fill_row_by_row():
+    pages = paginate(make_cards(8), LAYOUTS["6up"])
+
+    assert [p.number for p in pages] == [1, 2]
+    assert [len(p.slots) for p in pages] == [6, 6]
+    assert [c.name for c in pages[1].cards] == ["Spell 6", "Spell 7"]
+    assert [(s.row, s.column) for s in pages[0].slots[:4]] == [(0, 0), (0, 1), (0, 2), (1, 0)]
+
+
+def test_grid_is_centred_on_the_sheet():
+    first, last = paginate(make_cards(6), LAYOUTS["6up"])[0].slots[::5]
+    assert (first.left, first.top) == (1.75, 0.75)
+    assert (last.left, last.top) == (6.75, 4.25)
+
+
+def test_get_layout_parses_custom_grids():
+    assert get_layout("9up").per_page == 9
+    spec = get_layout("4x2")
+    assert (spec.columns, spec.rows, spec.page_width) == (4, 2, 11.0)
+    with pytest.raises(ValueError):
+        get_layout("lots")
+    with pytest.raises(ValueError):
+        LayoutSpec(5, 5, 8.5, 11.0)
+
+
+def test_template_emits_one_container_per_page():
+    spec = LAYOUTS["6up"]
+    template = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR))).get_template("deck.html.j2")
+    cards = make_cards(7)
+    fits = {("Boom.", False): TextFit(font_size=9.5, lines=1)}
+    html = template.render(
+        deck=Deck("Sheet", cards), layout=spec, pages=paginate(cards, spec), fits=fits
+    )
+
+    assert html.count('class="page"') == 2
+    assert html.count('class="card"') == 7
+    assert "size: 11.0in 8.5in" in html
+    assert "font-size: 9.5pt" in html
+
+
+def test_description_box_leaves_room_for_art():
+    spec = LAYOUTS["6up"]
+    assert spec.description_box(False) == (2.26, 2.51)
+    assert spec.description_box(True) == (2.26, 1.11)
+
+
+def test_pack_shares_sheets_between_decks():
+    spec = LAYOUTS["6up"]
+    decks = [make_cards(8), make_cards(4), make_cards(3), make_cards(1)]
+    pages = pack(decks, spec)
+
+    # Separately these decks need 2 + 1 + 1 + 1 sheets; packed they need ceil(16 / 6).
+    assert len(pages) == 3
+    assert [s.deck for s in pages[0].slots] == [0] * 6
+    # Leftovers go first fit decreasing: 4 + 2 on one sheet, 3 + 1 on the next.
+    assert [s.deck for s in pages[1].slots] == [1, 1, 1, 1, 0, 0]
+    assert [s.deck for s in pages[2].slots] == [2, 2, 2, 3, None, None]
+
+
+def test_pack_lets_decks_straddle_sheets_only_to_save_one():
+    pages = pack([make_cards(4), make_cards(4), make_cards(4)], LAYOUTS["6up"])
+    assert len(pages) == 2
+    assert [s.deck for p in pages for s in p.slots] == [0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2]
+
+
+def test_template_marks_packed_decks():
+    spec = LAYOUTS["6up"]
+    template = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR))).get_template("deck.html.j2")
+    fits = {("Boom.", False): TextFit(font_size=9.5, lines=1)}
+    pages = pack([make_cards(2), make_cards(3)], spec)
+    html = template.render(
+        deck=Deck("Packed", make_cards(5)), layout=spec, pages=pages, fits=fits, decks=["A", "B"]
+    )
+
+    assert html.count('class="page"') == 1
+    assert html.count('class="card deck-1"') == 3
+    assert html.count('<span class="deck-mark">A</span>') == 2
@@ -1,4 +1,6 @@
+import pytest
 from dmforge.application.services.deck_builder import BasicDeckBuilder
+from dmforge.application.services.result_cache import LRUResultCache
 from dmforge.domain.models import DeckOptions
 
 
@@ -65,3 +67,140 @@ def test_deck_builder_with_no_filters():
     assert "Fireball" in names
     assert "Cure Wounds" in names
     assert "Invisibility" in names
+
+
+class CountingSpellRepository(FakeSpellRepository):
+    def __init__(self):
+        self.loads = 0
+
+    def load_all_spells(self) -> list[dict]:
+        self.loads += 1
+        return super().load_all_spells()
+
+
+def test_deck_builder_reuses_cached_result(monkeypatch):
+    repo = CountingSpellRepository()
+    builder = BasicDeckBuilder(repo, cache=LRUResultCache())
+    first = builder.build(DeckOptions(classes=["Wizard"], name="First"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("filters should not run on a cache hit")
+
+    monkeypatch.setattr(BasicDeckBuilder, "_filter_ids", fail)
+    second = builder.build(DeckOptions(classes=["Wizard", "Wizard"], name="Second"))
+
+    assert [c.name for c in second.cards] == [c.name for c in first.cards]
+    assert second.name == "Second"
+    assert repo.loads == 2
+
+
+def test_deck_builder_search_ranks_and_filters():
+    builder = BasicDeckBuilder(FakeSpellRepository())
+    deck = builder.build(DeckOptions(search="heals boom unseen", classes=["Wizard"]))
+    assert sorted(c.name for c in deck.cards) == ["Fireball", "Invisibility"]
+
+
+def test_deck_builder_persists_search_index():
+    class MemoryIndexStore:
+        def __init__(self):
+            self.saved = None
+
+        def load(self, fingerprint):
+            if self.saved and self.saved["fingerprint"] == fingerprint:
+                return self.saved
+            return None
+
+        def save(self, index):
+            self.saved = index
+
+    store = MemoryIndexStore()
+    BasicDeckBuilder(FakeSpellRepository(), index_store=store).build(DeckOptions(search="boom"))
+    assert store.saved is not None
+
+    deck = BasicDeckBuilder(FakeSpellRepository(), index_store=store).build(
+        DeckOptions(search="invisib", search_mode="substring")
+    )
+    assert [c.name for c in deck.cards] == ["Invisibility"]
+
+
+def test_deck_builder_selects_named_spells_in_order():
+    builder = BasicDeckBuilder(FakeSpellRepository())
+    deck = builder.build(DeckOptions(spells=["invisibilty", "Fireball"]))
+    assert [c.name for c in deck.cards] == ["Invisibility", "Fireball"]
+
+
+def test_deck_builder_rejects_unknown_spell_names():
+    builder = BasicDeckBuilder(FakeSpellRepository())
+    with pytest.raises(ValueError, match="Wish"):
+        builder.build(DeckOptions(spells=["Wish"]))
+
+
+def test_deck_builder_facet_counts_follow_corpus_changes():
+    class ChangingRepository(FakeSpellRepository):
+        def __init__(self):
+            self.spells = super().load_all_spells()
+
+        def load_all_spells(self) -> list[dict]:
+            return list(self.spells)
+
+        def fingerprint(self) -> str:
+            return str(len(self.spells))
+
+    repository = ChangingRepository()
+    builder = BasicDeckBuilder(repository)
+    assert builder.facet_counts(DeckOptions()).total == 3
+
+    repository.spells.append({"name": "Wish", "level": 9, "classes": ["Wizard"]})
+    counts = builder.facet_counts(DeckOptions())
+
+    assert counts.total == 4
+    assert counts.levels[9] == 1
+
+
+def test_deck_builder_facet_counts_with_search():
+    builder = BasicDeckBuilder(FakeSpellRepository())
+    counts = builder.facet_counts(DeckOptions(search="boom heals", levels=[3]))
+    assert counts.total == 1
+    assert counts.levels == {1: 1, 3: 1}
+    assert counts.classes == {"Sorcerer": 1, "Wizard": 1}
+
+
+def test_deck_builder_uses_filtered_loading_when_available():
+    class PruningRepository(FakeSpellRepository):
+        def __init__(self):
+            self.requested = []
+
+        def load_spells_for(self, options):
+            self.requested.append(options.levels)
+            return [s for s in self.load_all_spells() if s["level"] in options.levels]
+
+    repo = PruningRepository()
+    deck = BasicDeckBuilder(repo).build(DeckOptions(levels=[2]))
+    assert [c.name for c in deck.cards] == ["Invisibility"]
+    assert repo.requested == [[2]]
+
+
+def test_deck_builder_sorts_and_pages_before_building_cards(monkeypatch):
+    builder = BasicDeckBuilder(FakeSpellRepository())
+    built = []
+    to_card = builder._to_card
+    monkeypatch.setattr(builder, "_to_card", lambda spell: built.append(spell) or to_card(spell))
+
+    deck = builder.build(DeckOptions(sort="level", offset=1, limit=1))
+    assert [c.name for c in deck.cards] == ["Invisibility"]
+    assert len(built) == 1
+
+    deck = builder.build(DeckOptions(sort="-level"))
+    assert [c.name for c in deck.cards] == ["Fireball", "Invisibility", "Cure Wounds"]
+    deck = builder.build(DeckOptions(sort="name", limit=2))
+    assert [c.name for c in deck.cards] == ["Cure Wounds", "Fireball"]
+    deck = builder.build(DeckOptions(offset=2))
+    assert [c.name for c in deck.cards] == ["Invisibility"]
+
+
+def test_deck_builder_rejects_bad_paging():
+    builder = BasicDeckBuilder(FakeSpellRepository())
+    with pytest.raises(ValueError, match="Unknown sort key"):
+        builder.build(DeckOptions(sort="power"))
+    with pytest.raises(ValueError, match="negative"):
+        builder.build(DeckOptions(limit=-1))
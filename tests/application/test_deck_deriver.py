@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+from dmforge.application.services.deck_deriver import DeckDeriver, DeriveSpec
+from dmforge.domain.models import Deck, SpellCard
+
+
+def card(name: str, level: int, cls: str = "Wizard") -> SpellCard:
+    return SpellCard(name, level, "Evocation", [cls], f"{name} effect.", "Instantaneous")
+
+
+MASTER = Deck(
+    name="Master",
+    cards=[
+        card("Fireball", 3),
+        card("Shield", 1),
+        card("Cure Wounds", 1, "Cleric"),
+        card("Wish", 9),
+    ],
+)
+
+
+class MemoryStorage:
+    def __init__(self, decks: dict):
+        self.decks = decks
+        self.loads = 0
+
+    def load(self, path: Path) -> Deck:
+        self.loads += 1
+        return self.decks[str(path)]
+
+    def save(self, deck: Deck, path: Path) -> None:
+        self.decks[str(path)] = deck
+
+
+def test_derive_applies_steps_in_order():
+    storage = MemoryStorage({"printed.json": Deck(name="P", cards=[card("Shield", 1)])})
+    deriver = DeckDeriver(storage)
+
+    spec = DeriveSpec(
+        name="Wizard reprints", minus=["printed.json"], classes=["Wizard"], sort="-level", limit=2
+    )
+    deck = deriver.derive(MASTER, spec)
+    assert deck.name == "Wizard reprints"
+    assert [c.name for c in deck.cards] == ["Wish", "Fireball"]
+
+    deriver.derive(MASTER, DeriveSpec(minus=["printed.json"]))
+    assert storage.loads == 1
+
+
+def test_spec_validation():
+    with pytest.raises(ValueError):
+        DeriveSpec.from_dict({"output": "x.json", "colour": "red"})
+    with pytest.raises(ValueError):
+        DeckDeriver(MemoryStorage({})).derive(MASTER, DeriveSpec(sort="power"))
@@ -0,0 +1,170 @@
+from dataclasses import replace
+from pathlib import Path
+
+from dmforge.application.services.deck_builder import BasicDeckBuilder
+from dmforge.application.services.deck_rebuilder import CorpusChanges, DeckRebuilder
+from dmforge.domain.models import Deck, DeckOptions
+from dmforge.infrastructure.repository.json_build_ledger import JSONBuildLedger
+
+
+def spell(name: str, level: int, cls: str = "Wizard", desc: str = "") -> dict:
+    return {
+        "name": name,
+        "level": level,
+        "school": "Evocation",
+        "classes": [cls],
+        "desc": desc or f"{name} effect.",
+        "duration": "Instantaneous",
+    }
+
+
+class MemoryRepository:
+    def __init__(self, spells: list[dict]):
+        self.spells = spells
+
+    def load_all_spells(self) -> list[dict]:
+        return list(self.spells)
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.decks: dict[str, Deck] = {}
+        self.loads: list[str] = []
+        self.saves: list[str] = []
+
+    def load(self, path: Path) -> Deck:
+        self.loads.append(str(path))
+        if str(path) not in self.decks:
+            raise FileNotFoundError(path)
+        return self.decks[str(path)]
+
+    def save(self, deck: Deck, path: Path) -> None:
+        self.saves.append(str(path))
+        self.decks[str(path)] = deck
+
+
+def setup(tmp_path: Path, spells: list[dict], builds: dict[str, DeckOptions]):
+    repo = MemoryRepository(spells)
+    storage = MemoryStorage()
+    rebuilder = DeckRebuilder(JSONBuildLedger(tmp_path / "ledger.json"), storage, lambda _: repo)
+    for path, options in builds.items():
+        deck = BasicDeckBuilder(repo).build(options)
+        storage.save(deck, Path(path))
+        rebuilder.record("spells.json", repo.load_all_spells(), Path(path), options, deck)
+    storage.loads.clear()
+    storage.saves.clear()
+    return repo, storage, rebuilder
+
+
+def names(deck: Deck) -> list[str]:
+    return [card.name for card in deck.cards]
+
+
+def test_corpus_changes():
+    changes = CorpusChanges.between({"a": "1", "b": "2", "c": "3"}, {"a": "1", "b": "9", "d": "4"})
+    assert (changes.changed, changes.added, changes.removed) == ({"b"}, {"d"}, {"c"})
+    assert not CorpusChanges.between({"a": "1"}, {"a": "1"})
+
+
+def test_unchanged_corpus_touches_no_decks(tmp_path):
+    _, storage, rebuilder = setup(
+        tmp_path, [spell("Fireball", 3)], {"a.json": DeckOptions(levels=[3])}
+    )
+    report = rebuilder.rebuild()
+    assert report.decks == 1 and report.rewritten == []
+    assert storage.loads == []
+
+
+def test_errata_patches_only_affected_decks(tmp_path):
+    spells = [spell("Fireball", 3), spell("Shield", 1), spell("Cure Wounds", 1, "Cleric")]
+    repo, storage, rebuilder = setup(
+        tmp_path,
+        spells,
+        {
+            "wizard.json": DeckOptions(classes=["Wizard"]),
+            "cleric.json": DeckOptions(classes=["Cleric"]),
+        },
+    )
+    fireball, shield = storage.decks["wizard.json"].cards
+    storage.decks["wizard.json"] = Deck(
+        "Wizard", [fireball, replace(shield, art_path="shield.png")]
+    )
+    repo.spells[1] = spell("Shield", 1, desc="Errata: +5 AC.")
+
+    report = rebuilder.rebuild()
+
+    assert report.rewritten == ["wizard.json"] and report.patched == 1
+    assert storage.loads == ["wizard.json"]
+    shield = storage.decks["wizard.json"].cards[1]
+    assert shield.description == "Errata: +5 AC." and shield.art_path == "shield.png"
+    assert storage.decks["wizard.json"].name == "Wizard"
+    # The new corpus is now the baseline.
+    assert rebuilder.rebuild().rewritten == []
+
+
+def test_membership_changes_follow_filters(tmp_path):
+    spells = [spell("Fireball", 3), spell("Shield", 1), spell("Wish", 9)]
+    repo, storage, rebuilder = setup(
+        tmp_path,
+        spells,
+        {
+            "low.json": DeckOptions(levels=[1, 2, 3]),
+            "picks.json": DeckOptions(spells=["Fireball", "Wish"]),
+        },
+    )
+    repo.spells[:] = [
+        spell("Magic Missile", 1),
+        spell("Fireball", 4),  # No longer level 3
+        spell("Shield", 1),
+        spell("Wish", 9, desc="Errata."),
+    ]
+
+    report = rebuilder.rebuild()
+
+    assert names(storage.decks["low.json"]) == ["Magic Missile", "Shield"]
+    assert names(storage.decks["picks.json"]) == ["Fireball", "Wish"]
+    assert storage.decks["picks.json"].cards[0].level == 4
+    assert (report.patched, report.added, report.removed) == (2, 1, 1)
+
+
+def test_search_decks_rebuild_in_full_and_missing_decks_are_dropped(tmp_path):
+    spells = [spell("Fireball", 3, desc="A burst of flame."), spell("Shield", 1)]
+    repo, storage, rebuilder = setup(
+        tmp_path,
+        spells,
+        {"fire.json": DeckOptions(search="flame"), "gone.json": DeckOptions(levels=[1])},
+    )
+    del storage.decks["gone.json"]
+    repo.spells.append(spell("Flame Blade", 2, desc="A flame sword."))
+    repo.spells[1] = spell("Shield", 1, desc="Errata.")
+
+    report = rebuilder.rebuild()
+
+    assert report.rebuilt == ["fire.json"]
+    assert sorted(names(storage.decks["fire.json"])) == ["Fireball", "Flame Blade"]
+    assert report.missing == ["gone.json"]
+    assert "gone.json" not in rebuilder.ledger.decks()
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    repo, storage, rebuilder = setup(
+        tmp_path, [spell("Shield", 1)], {"a.json": DeckOptions(levels=[1])}
+    )
+    repo.spells[0] = spell("Shield", 1, desc="Errata.")
+
+    assert rebuilder.rebuild(dry_run=True).rewritten == ["a.json"]
+    assert storage.saves == []
+    assert rebuilder.rebuild().rewritten == ["a.json"]
+
+
+def test_limited_decks_rebuild_in_full(tmp_path):
+    spells = [spell("Shield", 1), spell("Fireball", 3), spell("Wish", 9)]
+    repo, storage, rebuilder = setup(
+        tmp_path, spells, {"top.json": DeckOptions(sort="-level", limit=2)}
+    )
+    repo.spells.append(spell("Meteor Swarm", 9))
+
+    report = rebuilder.rebuild()
+
+    assert report.rebuilt == ["top.json"]
+    assert names(storage.decks["top.json"]) == ["Wish", "Meteor Swarm"]
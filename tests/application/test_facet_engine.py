@@ -0,0 +1,39 @@
+from dmforge.application.services.facet_engine import FacetEngine
+from dmforge.domain.models import DeckOptions
+
+SPELLS = [
+    {"name": "Fireball", "level": 3, "school": "Evocation", "classes": ["Wizard", "Sorcerer"]},
+    {"name": "Cure Wounds", "level": 1, "school": "Evocation", "classes": ["Cleric"]},
+    {"name": "Invisibility", "level": 2, "school": "Illusion", "classes": ["Wizard"]},
+    {"name": "Shield", "level": 1, "school": "Abjuration", "classes": ["Wizard", "Wizard"]},
+]
+
+
+def test_counts_without_filters():
+    counts = FacetEngine(SPELLS).counts(DeckOptions())
+    assert counts.total == 4
+    assert counts.classes == {"Cleric": 1, "Sorcerer": 1, "Wizard": 3}
+    assert counts.levels == {1: 2, 2: 1, 3: 1}
+    assert counts.schools == {"Abjuration": 1, "Evocation": 2, "Illusion": 1}
+
+
+def test_each_dimension_ignores_its_own_filter():
+    counts = FacetEngine(SPELLS).counts(DeckOptions(classes=["Wizard"], levels=[1]))
+    assert counts.total == 1
+    # Class counts are restricted by level only; level counts by class only.
+    assert counts.classes == {"Cleric": 1, "Wizard": 1}
+    assert counts.levels == {1: 1, 2: 1, 3: 1}
+    assert counts.schools == {"Abjuration": 1}
+
+
+def test_select_matches_builder_semantics():
+    engine = FacetEngine(SPELLS)
+    selected = engine.select(DeckOptions(schools=["Evocation"], classes=["Cleric", "Sorcerer"]))
+    assert selected == engine.bitmap([0, 1])
+
+
+def test_candidates_restrict_counts():
+    engine = FacetEngine(SPELLS)
+    counts = engine.counts(DeckOptions(), candidates=engine.bitmap([2, 3]))
+    assert counts.total == 2
+    assert counts.classes == {"Wizard": 2}
@@ -0,0 +1,85 @@
+import json
+
+from dmforge.application.services.card_layout import LAYOUTS
+from dmforge.application.services.html_site_renderer import PaginatedHTMLRenderer
+from dmforge.domain.models import Deck, SpellCard
+
+
+def make_deck(n: int, art: bool = False) -> Deck:
+    cards = [
+        SpellCard(
+            name=f"Spell {i}",
+            level=i % 10,
+            school="Evocation",
+            classes=["Wizard"],
+            description=f"Effect {i}.",
+            duration="Instant",
+            art_path="art/spell.png" if art else None,
+        )
+        for i in range(n)
+    ]
+    return Deck(name="Huge", cards=cards)
+
+
+def test_writes_pages_and_index_with_search_data(tmp_path):
+    renderer = PaginatedHTMLRenderer(layout=LAYOUTS["6up"], max_workers=1)
+    files = renderer.render(make_deck(25, art=True), tmp_path, cards_per_page=10)
+
+    # 10 cards per page rounds up to 12 (two full 6-up sheets)
+    assert [f.name for f in files] == [
+        "index.html",
+        "page_0001.html",
+        "page_0002.html",
+        "page_0003.html",
+    ]
+    page = (tmp_path / "page_0003.html").read_text()
+    assert page.count('class="card"') == 1
+    assert 'id="card-24"' in page
+    assert 'loading="lazy"' in page
+
+    index = (tmp_path / "index.html").read_text()
+    blob = index.split('type="application/json">')[1].split("</script>")[0]
+    assert json.loads(blob)[13] == ["Spell 13", 3, "Evocation", "page_0002.html", 13]
+
+
+def test_rerender_rewrites_only_changed_pages(tmp_path):
+    renderer = PaginatedHTMLRenderer(max_workers=1)
+    deck = make_deck(18)
+    renderer.render(deck, tmp_path, cards_per_page=6)
+    assert renderer.rewritten == 3
+
+    renderer.render(deck, tmp_path, cards_per_page=6)
+    assert renderer.rewritten == 0
+
+    cards = list(deck.cards)
+    cards[7] = SpellCard("Changed", 1, "Evocation", ["Wizard"], "New.", "Instant")
+    renderer.render(Deck(name="Huge", cards=cards), tmp_path, cards_per_page=6)
+    assert renderer.rewritten == 1
+    assert "Changed" in (tmp_path / "page_0002.html").read_text()
+
+
+def test_shrinking_deck_removes_stale_pages(tmp_path):
+    renderer = PaginatedHTMLRenderer()
+    renderer.render(make_deck(30), tmp_path, cards_per_page=6)
+    files = renderer.render(make_deck(12), tmp_path, cards_per_page=6)
+    assert len(files) == 3
+    assert not (tmp_path / "page_0003.html").exists()
+
+
+def test_pages_render_in_parallel(tmp_path):
+    renderer = PaginatedHTMLRenderer(max_workers=2)
+    renderer.render(make_deck(24), tmp_path, cards_per_page=6)
+    assert sorted(p.name for p in tmp_path.glob("page_*.html")) == [
+        f"page_{n:04d}.html" for n in range(1, 5)
+    ]
+
+
+def test_overflowing_description_is_clipped_and_empty_art_path_is_no_art(tmp_path):
+    long_text = " ".join(["Each creature in the area must make a saving throw."] * 60)
+    card = SpellCard("Storm", 9, "Evocation", ["Wizard"], long_text, "1 minute", art_path="")
+    PaginatedHTMLRenderer(max_workers=1).render(Deck(name="D", cards=[card]), tmp_path)
+
+    page = (tmp_path / "page_0001.html").read_text()
+    assert "<img" not in page
+    assert "…</p>" in page
+    assert long_text not in page
@@ -0,0 +1,107 @@
+import time
+from pathlib import Path
+
+import pytest
+from dmforge.application.controllers.render_controller import RenderController
+from dmforge.application.ports.render_service import RenderLimitExceeded
+from dmforge.application.services.isolated_renderer import IsolatedRenderer
+from dmforge.domain.models import Deck
+
+DECK = Deck(name="Pathological", cards=[])
+
+
+class MisbehavingRenderer:
+    def __init__(self, behaviour: str):
+        self.behaviour = behaviour
+
+    def render_pdf(self, deck: Deck, output_path: Path) -> None:
+        output_path.write_text("partial")
+        if self.behaviour == "hang":
+            time.sleep(30)
+        elif self.behaviour == "spin":
+            while True:
+                pass
+        elif self.behaviour == "hog":
+            try:
+                _ = bytearray(2 * 1024**3)
+            except MemoryError as e:
+                raise RuntimeError("PDF rendering failed") from e
+        elif self.behaviour == "error":
+            raise RuntimeError("bad template")
+
+    def render_html(self, deck: Deck, output_path: Path) -> None:
+        output_path.write_text("<html></html>")
+
+    def render_pdf_split(self, deck, output_path, pages_per_file, max_workers=1):
+        return [output_path.with_name(f"part{i}.pdf") for i in range(pages_per_file)]
+
+    def render_html_pages(self, deck, output_dir, cards_per_page, max_workers=None):
+        output_dir.mkdir(exist_ok=True)
+        if self.behaviour == "hang":
+            time.sleep(30)
+        return [output_dir / "index.html"]
+
+
+def test_successful_render_writes_output(tmp_path):
+    renderer = IsolatedRenderer(MisbehavingRenderer("ok"), timeout=10)
+    renderer.render_html(DECK, tmp_path / "out.html")
+    assert (tmp_path / "out.html").read_text() == "<html></html>"
+    assert renderer.metrics.completed == 1
+    parts = renderer.render_pdf_split(DECK, tmp_path / "out.pdf", 2)
+    assert parts == [tmp_path / "part0.pdf", tmp_path / "part1.pdf"]
+
+
+def test_paginated_html_runs_in_the_child(tmp_path):
+    renderer = IsolatedRenderer(MisbehavingRenderer("ok"), timeout=10)
+    assert renderer.render_html_pages(DECK, tmp_path / "site", 9) == [tmp_path / "site/index.html"]
+    assert (tmp_path / "site").is_dir()
+
+    with pytest.raises(RenderLimitExceeded):
+        IsolatedRenderer(MisbehavingRenderer("hang"), timeout=0.3).render_html_pages(
+            DECK, tmp_path / "slow", 9
+        )
+    assert (tmp_path / "slow").is_dir()
+
+
+def test_timeout_kills_the_child_and_removes_partial_output(tmp_path):
+    renderer = IsolatedRenderer(MisbehavingRenderer("hang"), timeout=0.3)
+    started = time.monotonic()
+    with pytest.raises(RenderLimitExceeded) as exc:
+        renderer.render_pdf(DECK, tmp_path / "out.pdf")
+    assert exc.value.kind == "timeout"
+    assert time.monotonic() - started < 5
+    assert not (tmp_path / "out.pdf").exists()
+
+
+def test_memory_limit_surfaces_through_the_controller(tmp_path):
+    class Storage:
+        def load(self, path):
+            return DECK
+
+    renderer = IsolatedRenderer(MisbehavingRenderer("hog"), timeout=10, memory_mb=512)
+    controller = RenderController(renderer, Storage())
+    with pytest.raises(RenderLimitExceeded) as exc:
+        controller.render_from_file(Path("deck.json"), "pdf", tmp_path / "out.pdf")
+    assert exc.value.kind == "memory"
+    assert renderer.metrics.kills == {"timeout": 0, "memory": 1, "cpu": 0}
+
+
+def test_cpu_limit(tmp_path):
+    renderer = IsolatedRenderer(MisbehavingRenderer("spin"), timeout=10, cpu_seconds=1)
+    with pytest.raises(RenderLimitExceeded) as exc:
+        renderer.render_pdf(DECK, tmp_path / "out.pdf")
+    assert exc.value.kind == "cpu"
+
+
+def test_ordinary_errors_are_not_kills(tmp_path):
+    renderer = IsolatedRenderer(MisbehavingRenderer("error"), timeout=10)
+    with pytest.raises(RuntimeError, match="bad template"):
+        renderer.render_pdf(DECK, tmp_path / "out.pdf")
+    assert renderer.metrics.to_dict()["failed"] == 1
+    assert sum(renderer.metrics.kills.values()) == 0
+
+
+@pytest.mark.parametrize("limits", [{"timeout": 0}, {"memory_mb": -1}, {"cpu_seconds": 0}])
+def test_non_positive_limits_are_rejected(limits):
+    with pytest.raises(ValueError, match="must be positive"):
+        IsolatedRenderer(MisbehavingRenderer("ok"), **limits)
@@ -0,0 +1,38 @@
+from dmforge.application.services.name_index import SpellNameIndex, normalize_name
+
+SPELLS = [
+    {"name": "Fireball"},
+    {"name": "Fire Bolt"},
+    {"name": "Magic Missile"},
+    {"name": "Mage Hand"},
+    {"name": "Shield"},
+]
+
+
+def test_normalize_name():
+    assert normalize_name("  Magic   MISSILE ") == "magic missile"
+
+
+def test_exact_lookup_is_case_and_space_insensitive():
+    index = SpellNameIndex(SPELLS)
+    assert index.lookup("magic  missile") == 2
+
+
+def test_unique_prefix_lookup():
+    index = SpellNameIndex(SPELLS)
+    assert index.lookup("Magic") == 2
+    assert index.prefix("fire") == [1, 0]
+
+
+def test_typo_lookup_within_distance():
+    index = SpellNameIndex(SPELLS)
+    assert index.lookup("Sheild") == 4
+    assert index.lookup("Firebal") == 0
+    assert index.lookup("Wish") is None
+
+
+def test_resolve_keeps_order_and_reports_missing():
+    index = SpellNameIndex(SPELLS)
+    ids, missing = index.resolve(["Shield", "Fireball", "shield", "Nope"])
+    assert ids == [4, 0]
+    assert missing == ["Nope"]
@@ -0,0 +1,110 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from dmforge.application.controllers.render_controller import (
+    AsyncRenderController,
+    RenderController,
+)
+from dmforge.domain.models import Deck
+
+
+class FakeStorage:
+    def load(self, path: Path) -> Deck:
+        return Deck(name="Loaded", cards=[])
+
+    def save(self, deck: Deck, path: Path) -> None:
+        pass
+
+
+class FakeRenderer:
+    def __init__(self):
+        self.rendered = []
+
+    def render_pdf(self, deck: Deck, output_path: Path) -> None:
+        self.rendered.append(("pdf", deck.name))
+
+    def render_html(self, deck: Deck, output_path: Path) -> None:
+        self.rendered.append(("html", deck.name))
+
+
+class RenamingAssets:
+    def prepare(self, deck: Deck) -> Deck:
+        return Deck(name="Prepared", cards=deck.cards)
+
+
+def test_assets_are_prepared_before_pdf_render():
+    renderer = FakeRenderer()
+    controller = RenderController(renderer, FakeStorage(), assets=RenamingAssets())
+
+    controller.render_from_file(Path("in.json"), "pdf", Path("out.pdf"))
+    controller.render_from_file(Path("in.json"), "html", Path("out.html"))
+
+    assert renderer.rendered == [("pdf", "Prepared"), ("html", "Loaded")]
+
+
+def test_unsupported_format_raises():
+    controller = RenderController(FakeRenderer(), FakeStorage())
+    with pytest.raises(ValueError):
+        controller.render_from_file(Path("in.json"), "xyz", Path("out.xyz"))
+
+
+def test_async_controller_awaits_storage_and_renderer():
+    class AsyncStorage:
+        async def load(self, path: Path) -> Deck:
+            return Deck(name="Loaded", cards=[])
+
+        async def save(self, deck: Deck, path: Path) -> None:
+            pass
+
+    class AsyncRenderer(FakeRenderer):
+        async def render_pdf(self, deck: Deck, output_path: Path) -> None:
+            super().render_pdf(deck, output_path)
+
+        async def render_html(self, deck: Deck, output_path: Path) -> None:
+            super().render_html(deck, output_path)
+
+    renderer = AsyncRenderer()
+    controller = AsyncRenderController(renderer, AsyncStorage(), assets=RenamingAssets())
+
+    asyncio.run(controller.render_from_file(Path("in.json"), "pdf", Path("out.pdf")))
+    asyncio.run(controller.render_from_file(Path("in.json"), "html", Path("out.html")))
+    with pytest.raises(ValueError):
+        asyncio.run(controller.render_from_file(Path("in.json"), "xyz", Path("out.xyz")))
+
+    assert renderer.rendered == [("pdf", "Prepared"), ("html", "Loaded")]
+
+
+def test_split_render_returns_every_file():
+    class SplittingRenderer(FakeRenderer):
+        def render_pdf_split(self, deck, output_path, pages_per_file, max_workers=1):
+            self.rendered.append(("split", pages_per_file, max_workers))
+            return [Path("out_001-002.pdf"), Path("out_003-003.pdf")]
+
+    renderer = SplittingRenderer()
+    controller = RenderController(renderer, FakeStorage())
+
+    written = controller.render_from_file(
+        Path("in.json"), "pdf", Path("out.pdf"), split_pages=2, split_workers=3
+    )
+    assert written == [Path("out_001-002.pdf"), Path("out_003-003.pdf")]
+    assert renderer.rendered == [("split", 2, 3)]
+    assert controller.render_from_file(Path("in.json"), "html", Path("o.html")) == [Path("o.html")]
+    with pytest.raises(ValueError):
+        controller.render_from_file(Path("in.json"), "html", Path("o.html"), split_pages=2)
+
+
+def test_packed_render_loads_and_prepares_every_deck():
+    class PackingRenderer(FakeRenderer):
+        def render_packed(self, decks, output_path, fmt="pdf"):
+            self.rendered.append(("packed", fmt, [d.name for d in decks]))
+            return 2
+
+    renderer = PackingRenderer()
+    controller = RenderController(renderer, FakeStorage(), assets=RenamingAssets())
+
+    sheets = controller.render_packed_files([Path("a.json"), Path("b.json")], "pdf", Path("o.pdf"))
+    assert sheets == 2
+    assert renderer.rendered == [("packed", "pdf", ["Prepared", "Prepared"])]
+    with pytest.raises(ValueError):
+        RenderController(FakeRenderer(), FakeStorage()).render_packed_files([], "pdf", Path("o"))
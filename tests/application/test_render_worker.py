@@ -0,0 +1,115 @@
+import json
+import time
+from pathlib import Path
+
+from dmforge.application.services.render_worker import RenderWorker
+from dmforge.infrastructure.queue.sqlite_render_queue import SQLiteRenderQueue
+
+
+class FakeController:
+    def __init__(self, fail_first: set):
+        self.fail_first = fail_first
+        self.rendered = []
+
+    def render_from_file(self, input_path: Path, fmt: str, output_path: Path) -> None:
+        if input_path.name in self.fail_first:
+            self.fail_first.discard(input_path.name)
+            raise RuntimeError("transient")
+        self.rendered.append((input_path.name, fmt))
+        output_path.write_text("rendered")
+
+
+def test_worker_drains_queue_with_retries_and_warm_controllers(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", retry_delay=0.0)
+    for name in ("a", "b", "c"):
+        deck = tmp_path / f"{name}.json"
+        deck.write_text(json.dumps({"name": name, "version": "v1", "cards": []}))
+        fmt = "html" if name == "c" else "pdf"
+        queue.enqueue(deck, tmp_path / "out" / f"{name}.{fmt}", {"format": fmt, "layout": "6up"})
+
+    built = []
+    controller = FakeController(fail_first={"b.json"})
+
+    def make_controller(params):
+        built.append(params)
+        return controller
+
+    worker = RenderWorker(queue, make_controller, name="w1", poll_interval=0.0)
+    assert worker.run(drain=True) == 4
+
+    assert controller.rendered == [("a.json", "pdf"), ("b.json", "pdf"), ("c.json", "html")]
+    assert built == [{"layout": "6up"}]  # one controller for every job, whatever the format
+    assert queue.counts()["done"] == 3
+    assert (tmp_path / "out" / "b.pdf").read_text() == "rendered"
+
+
+def test_killed_jobs_fail_without_retry(tmp_path):
+    from dmforge.application.ports.render_service import RenderLimitExceeded
+
+    class KillingController:
+        def render_from_file(self, input_path, fmt, output_path):
+            raise RenderLimitExceeded("timeout", "too slow")
+
+    queue = SQLiteRenderQueue(tmp_path / "q.db", retry_delay=0.0, max_attempts=3)
+    deck = tmp_path / "a.json"
+    deck.write_text("{}")
+    job = queue.enqueue(deck, tmp_path / "a.pdf", {"format": "pdf"})
+
+    worker = RenderWorker(queue, lambda params: KillingController(), poll_interval=0.0)
+    assert worker.run(drain=True) == 1
+    assert (queue.get(job.id).status, queue.get(job.id).attempts) == ("failed", 1)
+    assert worker.kills == {"timeout": 1}
+
+
+class SlowController:
+    def __init__(self, queue, seconds):
+        self.queue = queue
+        self.seconds = seconds
+        self.stolen = []
+
+    def render_from_file(self, input_path, fmt, output_path):
+        deadline = time.time() + self.seconds
+        while time.time() < deadline:
+            self.stolen.append(self.queue.claim("thief"))
+            time.sleep(0.02)
+        output_path.write_text("slow")
+
+
+def test_long_renders_keep_their_lease(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", lease_seconds=0.1)
+    deck = tmp_path / "a.json"
+    deck.write_text("{}")
+    job = queue.enqueue(deck, tmp_path / "a.pdf", {"format": "pdf"})
+    controller = SlowController(queue, seconds=0.4)
+
+    worker = RenderWorker(queue, lambda params: controller, poll_interval=0.0)
+    assert worker.run(max_jobs=1) == 1
+
+    assert controller.stolen == [None] * len(controller.stolen)
+    assert queue.get(job.id).status == "done"
+    assert (tmp_path / "a.pdf").read_text() == "slow"
+    assert list(tmp_path.glob(".*.tmp*")) == []
+
+
+def test_worker_that_lost_its_lease_leaves_the_output_alone(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", lease_seconds=0.05)
+    deck = tmp_path / "a.json"
+    deck.write_text("{}")
+    job = queue.enqueue(deck, tmp_path / "a.pdf", {"format": "pdf"})
+
+    class StallingController:
+        def render_from_file(self, input_path, fmt, output_path):
+            time.sleep(0.1)  # Lease expires; another worker finishes the job
+            taken = queue.claim("fast")
+            (tmp_path / "a.pdf").write_text("fast")
+            queue.complete(taken.id, "fast")
+            output_path.write_text("stale")
+
+    worker = RenderWorker(
+        queue, lambda params: StallingController(), poll_interval=0.0, heartbeat=60.0
+    )
+    worker.run(max_jobs=1)
+
+    assert queue.get(job.id).status == "done"
+    assert (tmp_path / "a.pdf").read_text() == "fast"
+    assert list(tmp_path.glob(".*.tmp*")) == []
@@ -0,0 +1,44 @@
+from dmforge.application.services.result_cache import (
+    LRUResultCache,
+    corpus_fingerprint,
+    result_key,
+)
+from dmforge.domain.models import DeckOptions
+
+
+def test_result_key_ignores_filter_order_duplicates_and_name():
+    a = DeckOptions(classes=["Wizard", "Cleric"], levels=[3, 1, 1], name="A")
+    b = DeckOptions(classes=["Cleric", "Wizard", "Wizard"], levels=[1, 3], name="B")
+    assert result_key("corpus", a) == result_key("corpus", b)
+
+
+def test_result_key_changes_with_corpus():
+    options = DeckOptions(levels=[1])
+    assert result_key("one", options) != result_key("two", options)
+
+
+def test_corpus_fingerprint_ignores_key_order():
+    assert corpus_fingerprint([{"a": 1, "b": 2}]) == corpus_fingerprint([{"b": 2, "a": 1}])
+    assert corpus_fingerprint([{"a": 1}]) != corpus_fingerprint([{"a": 2}])
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUResultCache(max_entries=2)
+    cache.put("a", [0])
+    cache.put("b", [1])
+    cache.get("a")
+    cache.put("c", [2])
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == [0]
+    assert cache.get("c") == [2]
+
+
+def test_lru_reads_through_and_writes_through_backing():
+    backing = LRUResultCache(max_entries=10)
+    backing.put("warm", [4, 2])
+    cache = LRUResultCache(max_entries=10, backing=backing)
+
+    assert cache.get("warm") == [4, 2]
+    cache.put("new", [1])
+    assert backing.get("new") == [1]
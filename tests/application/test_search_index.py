@@ -0,0 +1,44 @@
+import pytest
+from dmforge.application.services.search_index import SpellSearchIndex, tokenize
+
+SPELLS = [
+    {"name": "Fireball", "desc": "A bright streak of fire blossoms into an explosion of flame."},
+    {"name": "Sacred Flame", "desc": "Flame-like radiance descends on a creature."},
+    {"name": "Guiding Bolt", "desc": "A flash of light deals radiant damage."},
+    {"name": "Fire Bolt", "desc": ["You hurl a mote of fire.", "Fire damage scales."]},
+]
+
+
+def test_tokenize_casefolds_and_splits_words():
+    assert tokenize("Fire-like RADIANT, fire!") == ["fire", "like", "radiant", "fire"]
+
+
+def test_keyword_search_is_ranked_or_query():
+    index = SpellSearchIndex.build(SPELLS, "fp")
+    assert set(index.search("fire radiant")) == {0, 2, 3}
+    assert index.search("fire") == [3, 0]  # "fire" appears three times in Fire Bolt
+
+
+def test_limit_truncates_results():
+    index = SpellSearchIndex.build(SPELLS, "fp")
+    assert len(index.search("fire radiant", limit=1)) == 1
+
+
+def test_substring_and_fuzzy_modes_use_trigrams():
+    index = SpellSearchIndex.build(SPELLS, "fp", trigrams=True)
+    assert set(index.search("radian", mode="substring")) == {1, 2}
+    assert 0 in index.search("firebal", mode="fuzzy")
+    assert index.search("zzz", mode="substring") == []
+
+
+def test_trigram_modes_require_trigram_index():
+    index = SpellSearchIndex.build(SPELLS, "fp")
+    with pytest.raises(ValueError):
+        index.search("fire", mode="substring")
+
+
+def test_round_trips_through_dict():
+    index = SpellSearchIndex.build(SPELLS, "fp", trigrams=True)
+    restored = SpellSearchIndex.from_dict(index.to_dict())
+    assert restored.fingerprint == "fp"
+    assert restored.search("flame", mode="substring") == index.search("flame", mode="substring")
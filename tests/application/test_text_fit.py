@@ -0,0 +1,87 @@
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from dmforge.application.services.text_fit import TIMES_ROMAN, AFMFontMetrics, TextFitter
+
+SHORT = "A bright streak flashes to a point you choose."
+LONG = " ".join(["Each creature in the area must make a Dexterity saving throw."] * 40)
+
+
+def test_short_text_gets_the_maximum_size():
+    fit = TextFitter().fit(SHORT, 2.26, 2.5)
+    assert fit.font_size == 10.0
+    assert not fit.overflow
+
+
+def test_font_size_shrinks_as_the_box_does():
+    fitter = TextFitter()
+    text = " ".join([SHORT] * 6)
+    roomy = fitter.fit(text, 2.26, 2.5)
+    tight = fitter.fit(text, 2.26, 1.0)
+    assert fitter.min_size <= tight.font_size < roomy.font_size
+    assert not tight.overflow
+
+
+def test_overflow_reports_split_on_a_word_boundary():
+    fit = TextFitter().fit(LONG, 2.26, 1.1)
+    assert fit.overflow
+    assert fit.font_size == 6.0
+    assert 0 < fit.split < len(LONG)
+    assert LONG[fit.split - 1] == " "
+
+
+def test_hard_line_breaks_count_as_lines():
+    fitter = TextFitter(min_size=10.0, max_size=10.0)
+    assert fitter.fit("one\ntwo\nthree", 2.26, 2.5).lines == 3
+
+
+def test_fits_are_memoized_per_text_and_box():
+    fitter = TextFitter()
+    first = fitter.fit(SHORT, 2.26, 2.5)
+    assert fitter.fit(SHORT, 2.26, 2.5) is first
+    fitter.fit(SHORT, 2.26, 1.0)
+    assert (fitter.hits, fitter.misses) == (1, 2)
+
+
+def test_wider_metrics_need_a_smaller_size():
+    text = " ".join([SHORT] * 6)
+    wide = AFMFontMetrics("Wide", {}, default=700)
+    assert TIMES_ROMAN.advance("m") == 0.778
+    assert (
+        TextFitter(wide).fit(text, 2.26, 1.0).font_size
+        < TextFitter().fit(text, 2.26, 1.0).font_size
+    )
+
+
+def test_clip_cuts_overflowing_text_at_the_split():
+    fit = TextFitter().fit(LONG, 2.26, 1.1)
+    clipped = fit.clip(LONG)
+    assert clipped == LONG[: fit.split].rstrip() + "…"
+    assert TextFitter().fit(SHORT, 2.26, 2.5).clip(SHORT) == SHORT
+
+
+class YieldingLRU(OrderedDict):
+    """Yields to other threads mid-update, where an unguarded cache would race."""
+
+    def move_to_end(self, key, last=True):
+        time.sleep(0.001)
+        super().move_to_end(key, last)
+
+
+def test_one_fitter_can_be_shared_between_threads():
+    fitter = TextFitter(max_entries=2)
+    fitter._fits = YieldingLRU()
+    texts = [f"{SHORT} {i}" for i in range(4)]
+
+    def fit_all(_):
+        for _ in range(10):
+            for text in texts:
+                fitter.fit(text, 2.26, 2.5)
+                fitter.fit(text, 2.26, 2.5)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(fit_all, range(8)))
+
+    assert len(fitter._fits) == 2
+    assert fitter.hits + fitter.misses == 8 * 10 * 4 * 2
@@ -0,0 +1,37 @@
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _ImagesAPIHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.prompts.append(body["prompt"])
+        image = f"PNG:{body['model']}:{body['size']}:{body['prompt']}".encode("utf-8")
+        payload = json.dumps(
+            {"created": 0, "data": [{"b64_json": base64.b64encode(image).decode("ascii")}]}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def image_api_stub():
+    """Local stand-in for the OpenAI Images API; records every prompt it receives."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ImagesAPIHandler)
+    server.prompts = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield server
+    server.shutdown()
+    server.server_close()
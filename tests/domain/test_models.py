@@ -1,4 +1,8 @@
-from dmforge.domain.models import Deck, DeckOptions, SpellCard
+import pickle
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+from dmforge.domain.models import Deck, DeckOptions, LazyText, SpellCard
 
 
 def test_spell_card_creation():
@@ -32,8 +36,8 @@ def test_deck_serialization():
     assert isinstance(deck_dict["cards"], list)
     assert deck_dict["cards"][0]["name"] == "Magic Missile"
 
-    deck_json = deck.to_json()
-    assert '"name": "Magic Missile"' in deck_json
+    assert '"name":"Magic Missile"' in deck.to_json()
+    assert '\n  "name": "Test Deck"' in deck.to_json(indent=2)
 
 
 def test_deck_options_defaults():
@@ -49,3 +53,110 @@ def test_deck_options_custom_values():
     assert options.classes == ["Wizard", "Cleric"]
     assert options.levels == [1, 2]
     assert options.schools == ["Evocation"]
+
+
+def make_card(name: str, description: str = "Boom.") -> SpellCard:
+    return SpellCard(name, 1, "Evocation", ["Wizard"], description, "Instantaneous")
+
+
+def test_content_hash_is_stable_and_memoized():
+    card = make_card("Shield")
+    assert card.content_hash == make_card("Shield").content_hash
+    assert card.content_hash != make_card("Shield", "Other.").content_hash
+    assert "content_hash" in card.__dict__  # memoized on the instance
+    assert "content_hash" not in card.to_dict()
+
+
+def test_deck_fingerprint_covers_cards_template_and_version():
+    deck = Deck(name="D", cards=[make_card("A"), make_card("B")])
+    same = Deck(name="D", cards=[make_card("A"), make_card("B")])
+
+    assert deck.fingerprint() == same.fingerprint()
+    assert deck.fingerprint("template-v1") != deck.fingerprint("template-v2")
+    assert deck.fingerprint() != Deck(name="D", cards=deck.cards, version="v2").fingerprint()
+    assert deck.fingerprint() != Deck(name="D", cards=deck.cards[::-1]).fingerprint()
+
+
+def test_deck_diff():
+    old = Deck(name="D", cards=[make_card("A"), make_card("B"), make_card("C")])
+    new = Deck(name="D", cards=[make_card("A"), make_card("C", "Changed."), make_card("E")])
+
+    diff = old.diff(new)
+    assert diff.to_dict() == {"added": ["E"], "removed": ["B"], "changed": ["C"]}
+    assert diff.changed[0][0].description == "Boom."
+    assert not old.diff(old)
+
+
+def test_deck_diff_pairs_repeated_names_in_order():
+    old = Deck(name="D", cards=[make_card("A", "1"), make_card("A", "2")])
+    new = Deck(name="D", cards=[make_card("A", "1")])
+    diff = old.diff(new)
+    assert [c.description for c in diff.removed] == ["2"]
+    assert not diff.changed
+
+
+def test_derived_decks_share_card_storage():
+    master = Deck(name="Master", cards=[make_card(n) for n in "ABCDEF"])
+    evens = master.filter(lambda card: card.name in "ACE", name="Evens")
+    tail = master.slice(3)
+
+    assert [c.name for c in evens.cards] == ["A", "C", "E"]
+    assert [c.name for c in tail.cards] == ["D", "E", "F"]
+    assert evens.cards.pool is tail.cards.pool
+    assert evens.cards[0] is master.cards[0]
+    assert evens.name == "Evens" and tail.name == "Master"
+
+
+def test_set_operations_match_by_content():
+    master = Deck(name="M", cards=[make_card(n) for n in "ABCD"])
+    printed = Deck(name="P", cards=[make_card("B"), make_card("D")])
+    extra = Deck(name="X", cards=[make_card("A"), make_card("Z"), make_card("Z")])
+
+    assert [c.name for c in master.difference(printed).cards] == ["A", "C"]
+    assert [c.name for c in master.intersection(printed).cards] == ["B", "D"]
+    union = master.union(extra)
+    assert [c.name for c in union.cards] == ["A", "B", "C", "D", "Z"]
+    assert union.cards[0] is master.cards[0]
+
+
+def test_derived_decks_sort_serialize_and_compare():
+    master = Deck(name="M", cards=[make_card("b"), make_card("C"), make_card("a")])
+    ordered = master.sorted(lambda card: card.name.casefold())
+
+    assert [c["name"] for c in ordered.to_dict()["cards"]] == ["a", "b", "C"]
+    assert ordered.sorted(lambda card: card.name, reverse=True).slice(0, 1).cards == [
+        make_card("b")
+    ]
+    assert ordered == Deck(name="M", cards=[make_card("a"), make_card("b"), make_card("C")])
+    assert ordered.fingerprint() != master.fingerprint()
+
+
+def test_lazy_description_is_read_once():
+    class Source:
+        reads = 0
+
+        def read(self, offset, length):
+            Source.reads += 1
+            return "Shield text"[offset : offset + length]
+
+    card = SpellCard("Shield", 1, "Abjuration", ["Wizard"], LazyText(Source(), 0, 6), "1 round")
+    assert Source.reads == 0
+    assert card.description == "Shield"
+    assert card.to_dict()["description"] == "Shield"
+    assert Source.reads == 1
+
+
+class _Blob:
+    def read(self, offset, length):
+        return "Shield text"[offset : offset + length]
+
+
+def test_lazy_description_survives_replace_and_pickling():
+    card = SpellCard("Shield", 1, "Abjuration", ["Wizard"], LazyText(_Blob(), 0, 6), "1 round")
+
+    assert pickle.loads(pickle.dumps(card)) == replace(card, level=1)
+    assert replace(card, level=2).description == "Shield"
+    with pytest.raises(FrozenInstanceError):
+        card.description = "Other"
+    with pytest.raises(TypeError, match="description"):
+        SpellCard("Shield", 1, "Abjuration", ["Wizard"], duration="1 round")
@@ -0,0 +1,25 @@
+import asyncio
+from pathlib import Path
+
+from dmforge.infrastructure.art.file_image_cache import FileImageCache
+from dmforge.infrastructure.art.openai_image_generator import OpenAIImageGenerator
+
+
+def test_generates_image_bytes_from_stub_server(image_api_stub):
+    generator = OpenAIImageGenerator(api_key="test", base_url=image_api_stub.base_url)
+
+    data = asyncio.run(generator.generate("a red dragon", "dall-e-3", "256x256"))
+
+    assert data == b"PNG:dall-e-3:256x256:a red dragon"
+    assert image_api_stub.prompts == ["a red dragon"]
+
+
+def test_file_image_cache_is_content_addressed(tmp_path: Path):
+    cache = FileImageCache(tmp_path)
+    assert cache.get("abcdef") is None
+
+    path = cache.put("abcdef", b"image")
+
+    assert path == tmp_path / "ab" / "abcdef.png"
+    assert cache.get("abcdef") == path
+    assert path.read_bytes() == b"image"
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from dmforge.domain.models import Deck, SpellCard
+from dmforge.infrastructure.art.print_asset_processor import PrintAssetProcessor
+from PIL import Image
+
+
+def card(name: str, art_path) -> SpellCard:
+    return SpellCard(
+        name=name,
+        level=1,
+        school="Evocation",
+        classes=["Wizard"],
+        description="",
+        duration="Instantaneous",
+        art_path=art_path,
+    )
+
+
+def make_image(path: Path, size=(2000, 3000), color=(200, 40, 40)) -> None:
+    Image.new("RGB", size, color).save(path)
+
+
+def test_downscales_to_print_size_and_dedupes(tmp_path: Path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    make_image(assets / "a.jpg")
+    (assets / "copy.jpg").write_bytes((assets / "a.jpg").read_bytes())
+    make_image(assets / "b.png", color=(0, 0, 255))
+    deck = Deck(
+        name="D",
+        cards=[
+            card("A", "a.jpg"),
+            card("Copy", "copy.jpg"),
+            card("B", "b.png"),
+            card("Missing", "missing.png"),
+            card("None", None),
+        ],
+    )
+    processor = PrintAssetProcessor(tmp_path / "cache", asset_dir=assets, dpi=100)
+
+    result = processor.prepare(deck)
+
+    a, copy, b, missing, none = (c.art_path for c in result.cards)
+    assert a == copy
+    assert a.endswith(".jpg") and b.endswith(".png")
+    assert missing == "missing.png" and none is None
+    with Image.open(a) as image:
+        assert image.size == (233, 350)
+        assert image.format == "JPEG"
+    assert len(list((tmp_path / "cache").rglob("*.*"))) == 2
+
+
+def test_reuses_cached_output(tmp_path: Path, monkeypatch):
+    make_image(tmp_path / "a.jpg")
+    deck = Deck(name="D", cards=[card("A", str(tmp_path / "a.jpg"))])
+    processor = PrintAssetProcessor(tmp_path / "cache", dpi=100)
+    first = processor.prepare(deck)
+
+    from dmforge.infrastructure.art import print_asset_processor
+
+    def fail(*args):
+        raise AssertionError("cached image should not be reprocessed")
+
+    monkeypatch.setattr(print_asset_processor, "_process_image", fail)
+    assert processor.prepare(deck).cards[0].art_path == first.cards[0].art_path
@@ -0,0 +1,125 @@
+import errno
+import importlib.util
+import multiprocessing
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+from dmforge.infrastructure.cache import disk_cache
+from dmforge.infrastructure.cache.disk_cache import DiskCache, content_key
+
+
+def test_round_trip_and_stats(tmp_path: Path):
+    cache = DiskCache(tmp_path)
+    key = content_key("spell", b"data")
+    assert cache.get("corpora", key) is None
+    path = cache.put("corpora", key, b"payload")
+    assert path == tmp_path / "corpora" / key[:2] / key
+    assert cache.read("corpora", key) == b"payload"
+
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["bytes"] == 7
+    corpora = stats["namespaces"]["corpora"]
+    assert (corpora["hits"], corpora["misses"], corpora["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_namespace_suffix(tmp_path: Path):
+    images = DiskCache(tmp_path).namespace("art", ".png")
+    assert images.get("abc") is None
+    assert images.put("abc", b"png").name == "abc.png"
+    assert images.get("abc") == tmp_path / "art" / "ab" / "abc.png"
+
+
+def test_evicts_least_recently_used_across_namespaces(tmp_path: Path):
+    cache = DiskCache(tmp_path, max_bytes=10)
+    cache.put("art", "a", b"1234")
+    cache.put("fragments", "b", b"1234")
+    cache.get("art", "a")
+    cache.put("art", "c", b"1234")
+
+    assert cache.get("fragments", "b") is None
+    assert cache.read("art", "a") == b"1234"
+    assert cache.stats()["namespaces"]["fragments"]["evictions"] == 1
+
+
+def test_prune_to_size_and_by_namespace(tmp_path: Path):
+    cache = DiskCache(tmp_path)
+    cache.put("art", "a", b"12")
+    cache.put("art", "b", b"34")
+    cache.put("corpora", "c", b"56")
+
+    assert cache.prune(max_bytes=0, namespace="art") == {"removed": 2, "freed_bytes": 4}
+    assert cache.stats()["entries"] == 1
+    (tmp_path / "corpora" / "c" / "c").unlink()
+    cache.prune()
+    assert cache.stats()["entries"] == 0
+
+
+def test_rejects_unsafe_names(tmp_path: Path):
+    cache = DiskCache(tmp_path)
+    with pytest.raises(ValueError, match="namespace"):
+        cache.namespace("../etc")
+    with pytest.raises(ValueError, match="key"):
+        cache.put("art", "../x", b"")
+
+
+def _build_once(root: str, log: str) -> str:
+    def create() -> bytes:
+        with open(log, "a") as f:
+            f.write("built\n")
+        time.sleep(0.2)
+        return b"expensive"
+
+    return str(DiskCache(Path(root)).namespace("fragments").get_or_create("page1", create))
+
+
+def test_get_or_create_builds_once_across_processes(tmp_path: Path):
+    log = tmp_path / "builds.log"
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        paths = pool.starmap(_build_once, [(str(tmp_path / "cache"), str(log))] * 4)
+
+    assert log.read_text().count("built") == 1
+    assert len(set(paths)) == 1 and Path(paths[0]).read_bytes() == b"expensive"
+
+
+def _windows_disk_cache(monkeypatch, locking):
+    msvcrt = types.SimpleNamespace(LK_LOCK=1, LK_UNLCK=0, locking=locking)
+    monkeypatch.setitem(sys.modules, "fcntl", None)
+    monkeypatch.setitem(sys.modules, "msvcrt", msvcrt)
+    spec = importlib.util.spec_from_file_location("windows_disk_cache", disk_cache.__file__)
+    windows = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(windows)
+    return windows
+
+
+def test_locks_with_msvcrt_where_fcntl_is_missing(tmp_path: Path, monkeypatch):
+    calls = []
+    busy = [OSError(errno.EDEADLK, "busy")]
+
+    def locking(fd, mode, size):
+        calls.append((mode, size))
+        if mode == 1 and busy:
+            raise busy.pop()
+
+    cache = _windows_disk_cache(monkeypatch, locking).DiskCache(tmp_path)
+    assert cache.get_or_create("fragments", "page1", lambda: b"built").read_bytes() == b"built"
+    assert calls == [(1, 1), (1, 1), (0, 1)]
+
+
+def test_msvcrt_lock_errors_are_not_retried_forever(tmp_path: Path, monkeypatch):
+    def broken(fd, mode, size):
+        raise OSError(errno.EBADF, "bad handle")
+
+    def busy(fd, mode, size):
+        raise OSError(errno.EACCES, "busy")
+
+    windows = _windows_disk_cache(monkeypatch, broken)
+    with pytest.raises(OSError, match="bad handle"):
+        windows.DiskCache(tmp_path).get_or_create("fragments", "page1", lambda: b"")
+
+    windows = _windows_disk_cache(monkeypatch, busy)
+    monkeypatch.setattr(windows, "LOCK_TIMEOUT", 0.0)
+    with pytest.raises(TimeoutError):
+        windows.DiskCache(tmp_path).get_or_create("fragments", "page1", lambda: b"")
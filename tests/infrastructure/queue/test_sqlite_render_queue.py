@@ -0,0 +1,136 @@
+import json
+import time
+
+from dmforge.infrastructure.queue.sqlite_render_queue import SQLiteRenderQueue
+
+PARAMS = {"format": "pdf", "layout": "6up"}
+
+
+def write_deck(path, name="Deck"):
+    path.write_text(json.dumps({"name": name, "version": "v1", "cards": []}))
+    return path
+
+
+def test_identical_renders_are_deduped(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", output_dir=tmp_path / "out")
+    deck = write_deck(tmp_path / "a.json")
+
+    first = queue.enqueue(deck, None, PARAMS)
+    again = queue.enqueue(deck, tmp_path / "elsewhere.pdf", PARAMS)
+    other = queue.enqueue(deck, None, {**PARAMS, "layout": "9up"})
+
+    assert again.id == first.id and again.deduped
+    assert other.id != first.id
+    assert first.output_path.endswith(f"{first.fingerprint[:16]}.pdf")
+
+
+def test_template_changes_change_the_fingerprint(tmp_path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "deck.html.j2").write_text("v1")
+    queue = SQLiteRenderQueue(tmp_path / "q.db")
+    deck = write_deck(tmp_path / "a.json")
+    params = {**PARAMS, "template_dir": str(templates)}
+
+    first = queue.enqueue(deck, None, params)
+    (templates / "deck.html.j2").write_text("v2")
+    assert queue.enqueue(deck, None, params).id != first.id
+
+
+def test_claim_complete_and_retry(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", retry_delay=0.0, max_attempts=2)
+    ok = queue.enqueue(write_deck(tmp_path / "a.json", "A"), tmp_path / "a.pdf", PARAMS)
+    flaky = queue.enqueue(write_deck(tmp_path / "b.json", "B"), tmp_path / "b.pdf", PARAMS)
+
+    assert queue.claim("w1").id == ok.id
+    assert queue.claim("w2").id == flaky.id
+    assert queue.claim("w3") is None
+    queue.complete(ok.id, "w1")
+
+    queue.fail(flaky.id, "w2", "boom")
+    retry = queue.claim("w1")
+    assert (retry.id, retry.attempts, retry.error) == (flaky.id, 2, "boom")
+    queue.fail(flaky.id, "w1", "boom again")
+
+    assert queue.get(flaky.id).status == "failed"
+    assert queue.counts() == {"queued": 0, "running": 0, "done": 1, "failed": 1}
+    assert queue.pending() == 0
+
+
+def test_expired_leases_are_reclaimed_after_a_crash(tmp_path):
+    path = tmp_path / "q.db"
+    queue = SQLiteRenderQueue(path, lease_seconds=0.05)
+    job = queue.enqueue(write_deck(tmp_path / "a.json"), None, PARAMS)
+    assert queue.claim("crashed").id == job.id
+
+    restarted = SQLiteRenderQueue(path, lease_seconds=0.05)
+    assert restarted.claim("w2") is None
+    time.sleep(0.06)
+    assert restarted.claim("w2").attempts == 2
+
+
+def test_job_that_keeps_killing_workers_fails_after_max_attempts(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", lease_seconds=0.05, max_attempts=2)
+    job = queue.enqueue(write_deck(tmp_path / "a.json"), None, PARAMS)
+    assert queue.claim("crashed-1").attempts == 1
+    time.sleep(0.06)
+    assert queue.claim("crashed-2").attempts == 2
+    time.sleep(0.06)
+
+    assert queue.claim("w3") is None
+    failed = queue.get(job.id)
+    assert (failed.status, failed.error) == ("failed", "worker lost")
+    assert queue.pending() == 0
+
+
+def test_worker_whose_lease_expired_cannot_overwrite_the_result(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", lease_seconds=0.05, retry_delay=0.0)
+    job = queue.enqueue(write_deck(tmp_path / "a.json"), None, PARAMS)
+    queue.claim("slow")
+    time.sleep(0.06)
+    assert queue.claim("fast").id == job.id
+    assert queue.complete(job.id, "fast")
+
+    assert not queue.fail(job.id, "slow", "timed out")
+    assert not queue.complete(job.id, "slow")
+    assert queue.get(job.id).status == "done"
+
+
+def test_failed_or_missing_output_jobs_are_requeued(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", max_attempts=1)
+    deck = write_deck(tmp_path / "a.json")
+    job = queue.enqueue(deck, tmp_path / "a.pdf", PARAMS)
+    queue.claim("w")
+    queue.fail(job.id, "w", "boom")
+
+    requeued = queue.enqueue(deck, None, PARAMS)
+    assert (requeued.id, requeued.status, requeued.attempts) == (job.id, "queued", 0)
+
+    queue.claim("w")
+    queue.complete(job.id, "w")
+    assert queue.enqueue(deck, None, PARAMS).status == "queued"  # a.pdf was never written
+
+
+def test_renewed_lease_is_not_reclaimed(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db", lease_seconds=0.1)
+    job = queue.enqueue(write_deck(tmp_path / "a.json"), None, PARAMS)
+    queue.claim("w1")
+    time.sleep(0.06)
+    assert queue.renew(job.id, "w1")
+    time.sleep(0.06)
+
+    assert queue.claim("w2") is None
+    assert not queue.renew(job.id, "w2")
+
+
+def test_complete_moves_the_staged_output_into_place(tmp_path):
+    queue = SQLiteRenderQueue(tmp_path / "q.db")
+    job = queue.enqueue(write_deck(tmp_path / "a.json"), tmp_path / "a.pdf", PARAMS)
+    queue.claim("w1")
+    staged = tmp_path / "staged.pdf"
+    staged.write_text("pdf")
+
+    assert not queue.complete(job.id, "w2", staged)
+    assert staged.exists() and not (tmp_path / "a.pdf").exists()
+    assert queue.complete(job.id, "w1", staged)
+    assert (tmp_path / "a.pdf").read_text() == "pdf"
@@ -0,0 +1,102 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from dmforge.infrastructure.repository import composite_spell_repository
+from dmforge.infrastructure.repository.composite_spell_repository import (
+    CompositeSpellRepository,
+)
+
+
+def write_spells(path: Path, spells: list[dict]) -> None:
+    path.write_text(json.dumps(spells), encoding="utf-8")
+
+
+def test_merges_directory_with_later_sources_overriding(tmp_path: Path):
+    write_spells(
+        tmp_path / "00_srd.json",
+        [{"name": "Fireball", "level": 3}, {"name": "Shield", "level": 1}],
+    )
+    write_spells(
+        tmp_path / "10_homebrew.json", [{"name": "fireball ", "level": 4}, {"name": "Zap"}]
+    )
+
+    spells = CompositeSpellRepository(tmp_path).load_all_spells()
+
+    assert [s["name"] for s in spells] == ["fireball ", "Shield", "Zap"]
+    assert spells[0]["level"] == 4
+
+
+def test_accepts_glob_pattern(tmp_path: Path):
+    write_spells(tmp_path / "a.json", [{"name": "A"}])
+    write_spells(tmp_path / "b.txt.json", [{"name": "B"}])
+    write_spells(tmp_path / "skip.json", [{"name": "C"}])
+
+    spells = CompositeSpellRepository(str(tmp_path / "[ab]*.json")).load_all_spells()
+    assert [s["name"] for s in spells] == ["A", "B"]
+
+
+def test_only_new_or_changed_sources_are_parsed(tmp_path: Path, monkeypatch):
+    write_spells(tmp_path / "a.json", [{"name": "A"}])
+    write_spells(tmp_path / "b.json", [{"name": "B"}])
+    parsed = []
+    original = composite_spell_repository._parse_source
+
+    def tracking_parse(path, *args):
+        parsed.append(path.name)
+        return original(path, *args)
+
+    monkeypatch.setattr(composite_spell_repository, "_parse_source", tracking_parse)
+    repo = CompositeSpellRepository(tmp_path)
+    repo.load_all_spells()
+    first_fingerprint = repo.fingerprint()
+    assert sorted(parsed) == ["a.json", "b.json"]
+
+    parsed.clear()
+    write_spells(tmp_path / "c.json", [{"name": "C"}])
+    spells = repo.load_all_spells()
+
+    assert parsed == ["c.json"]
+    assert [s["name"] for s in spells] == ["A", "B", "C"]
+    assert repo.fingerprint() != first_fingerprint
+
+
+def test_concurrent_loads_see_consistent_listings(tmp_path: Path, monkeypatch):
+    write_spells(tmp_path / "a.json", [{"name": "A"}])
+    write_spells(tmp_path / "b.json", [{"name": "B"}])
+    repo = CompositeSpellRepository(tmp_path)
+    repo.load_all_spells()
+    parsing, resume = threading.Event(), threading.Event()
+    original = composite_spell_repository._parse_source
+
+    def stalling_parse(path, *args):
+        result = original(path, *args)
+        if not parsing.is_set():
+            parsing.set()
+            resume.wait(5)
+        return result
+
+    monkeypatch.setattr(composite_spell_repository, "_parse_source", stalling_parse)
+    write_spells(tmp_path / "c.json", [{"name": "C"}])
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        slow = pool.submit(repo.load_all_spells)  # Lists a, b, c; stalls parsing c
+        parsing.wait(5)
+        (tmp_path / "b.json").unlink()
+        assert [s["name"] for s in repo.load_all_spells()] == ["A", "C"]
+        resume.set()
+        assert [s["name"] for s in slow.result()] == ["A", "B", "C"]
+
+
+def test_no_sources_raises(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        CompositeSpellRepository(tmp_path).load_all_spells()
+
+
+def test_process_pool_loading(tmp_path: Path):
+    write_spells(tmp_path / "a.json", [{"name": "A"}])
+    write_spells(tmp_path / "b.json", [{"name": "B"}])
+
+    repo = CompositeSpellRepository(tmp_path, max_workers=2, use_processes=True)
+    assert [s["name"] for s in repo.load_all_spells()] == ["A", "B"]
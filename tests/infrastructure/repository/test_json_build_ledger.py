@@ -0,0 +1,33 @@
+from dmforge.infrastructure.repository.json_build_ledger import JSONBuildLedger
+
+
+def entry(spells, corpus="c1", source="spells.json"):
+    return {"source": source, "corpus": corpus, "options": {}, "spells": spells}
+
+
+def test_reverse_index_follows_records(tmp_path):
+    ledger = JSONBuildLedger(tmp_path / "ledger.json")
+    ledger.record("a.json", entry(["fireball", "shield"]))
+    ledger.record("b.json", entry(["shield"]))
+    assert ledger.decks_containing("spells.json", ["shield"]) == {"a.json", "b.json"}
+
+    ledger.record("a.json", entry(["wish"]))
+    assert ledger.decks_containing("spells.json", ["fireball", "shield"]) == {"b.json"}
+    assert ledger.decks_containing("other.json", ["shield"]) == set()
+
+    ledger.forget("b.json")
+    assert ledger.decks_containing("spells.json", ["shield"]) == set()
+
+
+def test_save_round_trips_and_prunes_unused_baselines(tmp_path):
+    path = tmp_path / "ledger.json"
+    ledger = JSONBuildLedger(path)
+    ledger.set_baseline("c1", {"shield": "h1"})
+    ledger.set_baseline("c2", {"shield": "h2"})
+    ledger.record("a.json", entry(["shield"], corpus="c2"))
+    ledger.save()
+
+    reloaded = JSONBuildLedger(path)
+    assert reloaded.baseline("c1") is None
+    assert reloaded.baseline("c2") == {"shield": "h2"}
+    assert reloaded.decks_containing("spells.json", ["shield"]) == {"a.json"}
@@ -0,0 +1,60 @@
+import hashlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+from dmforge.infrastructure.repository import json_codec
+from dmforge.infrastructure.repository.json_codec import get_codec
+
+AVAILABLE = [name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)] + ["stdlib"]
+DATA = [{"name": "Fire Bolt", "level": 0, "classes": ["Wizard"], "desc": "Hurl fire. ✨"}]
+
+
+@pytest.mark.parametrize("backend", AVAILABLE)
+def test_round_trip_through_mmap(tmp_path: Path, backend: str):
+    codec = get_codec(backend)
+    path = tmp_path / "spells.json"
+
+    codec.dump_path(DATA, path)
+    digest = hashlib.sha256()
+
+    assert codec.load_path(path, digest=digest) == DATA
+    assert digest.hexdigest() == hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize("backend", AVAILABLE)
+def test_output_is_compact_unless_indented(backend: str):
+    codec = get_codec(backend)
+    assert b"\n" not in codec.dumps(DATA)
+    assert b'\n  {\n    "name"' in codec.dumps(DATA, indent=True)
+
+
+@pytest.mark.parametrize("backend", AVAILABLE)
+def test_invalid_json_raises_value_error(tmp_path: Path, backend: str):
+    path = tmp_path / "bad.json"
+    path.write_text("[1,", encoding="utf-8")
+    with pytest.raises(ValueError):
+        get_codec(backend).load_path(path)
+
+
+def test_empty_file_does_not_mmap(tmp_path: Path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        get_codec().load_path(path)
+
+
+def test_backend_selected_from_environment(monkeypatch):
+    monkeypatch.setattr(json_codec, "_codecs", {})
+    monkeypatch.setenv(json_codec.BACKEND_ENV, "stdlib")
+    assert get_codec().name == "stdlib"
+
+    monkeypatch.setenv(json_codec.BACKEND_ENV, "nope")
+    with pytest.raises(ValueError):
+        get_codec()
+
+
+def test_auto_prefers_installed_fast_backend(monkeypatch):
+    monkeypatch.setattr(json_codec, "_codecs", {})
+    monkeypatch.delenv(json_codec.BACKEND_ENV, raising=False)
+    assert get_codec().name == AVAILABLE[0]
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+import pytest
+from dmforge.domain.models import Deck, SpellCard
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+
+
+def test_save_load_round_trip(tmp_path: Path):
+    card = SpellCard(
+        name="Shield",
+        level=1,
+        school="Abjuration",
+        classes=["Wizard"],
+        description="Adds AC.",
+        duration="1 round",
+    )
+    deck = Deck(name="D", cards=[card])
+    storage = JSONDeckStorage()
+
+    storage.save(deck, tmp_path / "deck.json")
+
+    assert storage.load(tmp_path / "deck.json") == deck
+
+
+def test_load_rejects_wrong_types(tmp_path: Path):
+    path = tmp_path / "deck.json"
+    path.write_text('{"name": "D", "version": "v1", "cards": [{"name": 5}]}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        JSONDeckStorage().load(path)
+
+
+def test_save_is_compact_by_default_and_indented_on_request(tmp_path: Path):
+    deck = Deck(name="D", cards=[])
+
+    JSONDeckStorage().save(deck, tmp_path / "compact.json")
+    JSONDeckStorage(indent=True).save(deck, tmp_path / "pretty.json")
+
+    assert (tmp_path / "compact.json").read_text(encoding="utf-8").count("\n") == 0
+    assert (tmp_path / "pretty.json").read_text(encoding="utf-8").count("\n") > 1
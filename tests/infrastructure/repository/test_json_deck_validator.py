@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+from dmforge.infrastructure.repository.json_deck_storage import JSONDeckStorage
+from dmforge.infrastructure.repository.json_deck_validator import (
+    JSONDeckValidator,
+    find_deck_files,
+    validate_deck_file,
+)
+
+CARD = {
+    "name": "Shield",
+    "level": 1,
+    "school": "Abjuration",
+    "classes": ["Wizard"],
+    "description": "Adds AC.",
+    "duration": "1 round",
+    "art_path": None,
+}
+
+
+def write_deck(path: Path, cards: list, **header) -> Path:
+    deck = {"name": "Deck", "version": "v1", **header, "cards": cards}
+    path.write_text(json.dumps(deck, indent=2), encoding="utf-8")
+    return path
+
+
+def test_valid_deck(tmp_path: Path):
+    result = validate_deck_file(write_deck(tmp_path / "ok.json", [CARD, CARD]))
+    assert result["valid"] is True
+    assert result["cards"] == 2
+    assert result["errors"] == []
+
+
+def test_field_errors_report_card_line(tmp_path: Path):
+    bad = {**CARD, "level": "one", "extra": 1}
+    del bad["duration"]
+    path = write_deck(tmp_path / "bad.json", [CARD, bad])
+
+    result = validate_deck_file(path)
+
+    assert result["valid"] is False
+    fields = {e["field"]: e for e in result["errors"]}
+    assert set(fields) == {"cards[1].level", "cards[1].duration", "cards[1].extra"}
+    assert fields["cards[1].level"]["message"] == "Expected integer, got string"
+    card_lines = [n for n, line in enumerate(path.read_text().splitlines(), 1) if line == "    {"]
+    assert fields["cards[1].level"]["line"] == card_lines[1]
+
+
+def test_nested_and_non_object_card_errors(tmp_path: Path):
+    path = write_deck(tmp_path / "nested.json", [{**CARD, "classes": ["Wizard", 3]}, "Shield"])
+
+    errors = {e["field"]: e["message"] for e in validate_deck_file(path)["errors"]}
+
+    assert errors == {
+        "cards[0].classes[1]": "Expected string, got integer",
+        "cards[1]": "Expected object, got string",
+    }
+
+
+def test_syntax_error_reports_location(tmp_path: Path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"name": "D",\n "version": "v1",\n "cards": [\n  {"name": }\n]}')
+
+    result = validate_deck_file(path)
+
+    assert result["valid"] is False
+    assert result["errors"][0]["line"] == 4
+    assert result["errors"][0]["message"].startswith("Invalid JSON")
+
+
+def test_missing_header_fields(tmp_path: Path):
+    path = tmp_path / "header.json"
+    path.write_text('{"cards": []}')
+    fields = [e["field"] for e in validate_deck_file(path)["errors"]]
+    assert fields == ["name"]
+
+
+def test_accepts_what_deck_storage_loads(tmp_path: Path):
+    path = tmp_path / "unversioned.json"
+    path.write_text(json.dumps({"name": "D", "cards": [CARD]}))
+
+    assert JSONDeckStorage().load(path).version == "v1"
+    assert validate_deck_file(path)["valid"] is True
+
+
+def test_small_chunks_give_the_same_errors(tmp_path: Path):
+    cards = [{**CARD, "level": 10**20 + i} for i in range(30)] + [{**CARD, "level": "x"}]
+    path = write_deck(tmp_path / "long.json", cards)
+    broken = tmp_path / "broken.json"
+    broken.write_text(path.read_text()[:-40])
+
+    for deck in (path, broken):
+        assert validate_deck_file(deck, chunk_size=7) == validate_deck_file(deck)
+    errors = validate_deck_file(path, chunk_size=7)["errors"]
+    assert [e["field"] for e in errors] == ["cards[30].level"]
+    card_lines = [n for n, line in enumerate(path.read_text().splitlines(), 1) if line == "    {"]
+    assert (errors[0]["line"], errors[0]["column"]) == (card_lines[-1], 5)
+
+
+def test_validate_many_across_pool(tmp_path: Path):
+    for i in range(6):
+        write_deck(tmp_path / f"deck_{i}.json", [CARD])
+    (tmp_path / "deck_bad.json").write_text("[]")
+
+    paths = find_deck_files(tmp_path)
+    summary = JSONDeckValidator(max_workers=2, chunksize=2).validate_many(paths)
+
+    assert summary["files"] == 7
+    assert summary["valid"] == 6
+    assert summary["invalid"] == 1
+    assert summary["results"][-1]["path"].endswith("deck_bad.json")
+
+
+def test_find_deck_files_glob(tmp_path: Path):
+    (tmp_path / "nested").mkdir()
+    write_deck(tmp_path / "nested" / "a.json", [])
+    write_deck(tmp_path / "b.json", [])
+    assert [p.name for p in find_deck_files(tmp_path, "**/*.json")] == ["b.json", "a.json"]
+    assert find_deck_files(pattern=str(tmp_path / "*.json")) == [tmp_path / "b.json"]
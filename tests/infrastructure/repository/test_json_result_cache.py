@@ -0,0 +1,24 @@
+import os
+from pathlib import Path
+
+from dmforge.infrastructure.repository.json_result_cache import JSONResultCache
+
+
+def test_round_trip(tmp_path: Path):
+    cache = JSONResultCache(tmp_path / "cache")
+    assert cache.get("missing") is None
+    cache.put("key", [3, 1, 2])
+    assert cache.get("key") == [3, 1, 2]
+
+
+def test_evicts_oldest_entries(tmp_path: Path):
+    cache = JSONResultCache(tmp_path, max_entries=2)
+    cache.put("a", [0])
+    os.utime(tmp_path / "a.json", (1, 1))
+    cache.put("b", [1])
+    os.utime(tmp_path / "b.json", (2, 2))
+    cache.put("c", [2])
+
+    assert cache.get("a") is None
+    assert cache.get("b") == [1]
+    assert cache.get("c") == [2]
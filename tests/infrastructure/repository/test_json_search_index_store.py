@@ -0,0 +1,16 @@
+from pathlib import Path
+
+from dmforge.application.services.search_index import SpellSearchIndex
+from dmforge.infrastructure.repository.json_search_index_store import JSONSearchIndexStore
+
+
+def test_save_and_load_matching_fingerprint(tmp_path: Path):
+    store = JSONSearchIndexStore(tmp_path / "spells.json.search.idx")
+    assert store.load("abc") is None
+
+    store.save(SpellSearchIndex.build([{"name": "Light", "desc": "Glow."}], "abc").to_dict())
+
+    loaded = store.load("abc")
+    assert loaded is not None
+    assert SpellSearchIndex.from_dict(loaded).search("glow") == [0]
+    assert store.load("other") is None
@@ -49,3 +49,24 @@ def test_invalid_data_raises(tmp_path: Path):
     repo = JSONSpellRepository(file_path)
     with pytest.raises(ValueError):
         repo.load_all_spells()
+
+
+def test_fingerprint_tracks_file_content(tmp_path: Path):
+    file_path = tmp_path / "spells.json"
+    file_path.write_text("[]", encoding="utf-8")
+    repo = JSONSpellRepository(file_path)
+    repo.load_all_spells()
+    before = repo.fingerprint()
+
+    file_path.write_text('[{"name": "Light"}]', encoding="utf-8")
+    repo.load_all_spells()
+    assert repo.fingerprint() != before
+
+
+def test_strict_mode_rejects_bad_fields(tmp_path: Path):
+    file_path = tmp_path / "spells.json"
+    file_path.write_text('[{"name": "Light", "level": "zero"}]', encoding="utf-8")
+
+    assert JSONSpellRepository(file_path).load_all_spells()[0]["level"] == "zero"
+    with pytest.raises(ValueError):
+        JSONSpellRepository(file_path, strict=True).load_all_spells()
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from dmforge.domain.models import Deck, SpellCard
+from dmforge.infrastructure.repository.schemas import parse_deck, parse_spells
+
+CARD = {
+    "name": "Shield",
+    "level": 1,
+    "school": "Abjuration",
+    "classes": ["Wizard"],
+    "description": "Adds AC.",
+    "duration": "1 round",
+    "art_path": None,
+}
+
+
+def test_parse_deck_builds_domain_objects():
+    deck = parse_deck(json.dumps({"name": "D", "version": "v2", "cards": [CARD]}))
+    assert deck == Deck(name="D", version="v2", cards=[SpellCard(**CARD)])
+
+
+@pytest.mark.parametrize(
+    "card",
+    [
+        {**CARD, "level": "1"},
+        {**CARD, "classes": "Wizard"},
+        {**CARD, "unexpected": True},
+        {k: v for k, v in CARD.items() if k != "duration"},
+    ],
+)
+def test_parse_deck_rejects_bad_cards(card):
+    with pytest.raises(ValueError):
+        parse_deck(json.dumps({"name": "D", "version": "v1", "cards": [card]}))
+
+
+def test_parse_spells_checks_types_and_keeps_extra_fields():
+    spells = parse_spells(
+        json.dumps([{"name": "Light", "level": 0, "desc": ["a"], "ritual": False}])
+    )
+    assert spells == [{"name": "Light", "level": 0, "desc": ["a"], "ritual": False}]
+
+    with pytest.raises(ValueError, match="level"):
+        parse_spells(json.dumps([{"name": "Light", "level": "0"}]))
+    with pytest.raises(ValueError):
+        parse_spells(json.dumps({"not": "a list"}))
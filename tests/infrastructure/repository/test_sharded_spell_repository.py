@@ -0,0 +1,108 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+from dmforge.domain.models import DeckOptions, LazyText, SpellCard
+from dmforge.infrastructure.repository.sharded_spell_repository import ShardedSpellRepository
+
+SPELLS = [
+    {"name": "Fireball", "level": 3, "school": "Evocation", "classes": ["Wizard", "Sorcerer"]},
+    {"name": "Cure Wounds", "level": 1, "school": "Evocation", "classes": ["Cleric"]},
+    {"name": "Shield", "level": 1, "school": "Abjuration", "classes": ["Wizard"]},
+    {"name": "Mystery", "school": "Divination", "classes": ["Bard"]},
+]
+
+
+def test_compile_writes_shards_and_manifest(tmp_path: Path):
+    repo = ShardedSpellRepository.compile(SPELLS, tmp_path)
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert list(manifest["shards"]) == ["1", "3", "none"]
+    assert manifest["shards"]["1"]["classes"] == ["Cleric", "Wizard"]
+    assert [s["name"] for s in repo.load_all_spells()] == [
+        "Cure Wounds",
+        "Shield",
+        "Fireball",
+        "Mystery",
+    ]
+
+
+def test_only_matching_shards_are_read(tmp_path: Path):
+    ShardedSpellRepository.compile(SPELLS, tmp_path)
+    repo = ShardedSpellRepository(tmp_path)
+
+    assert repo.shards_for(DeckOptions(levels=[1], classes=["Wizard"])) == ["1"]
+    assert repo.shards_for(DeckOptions(classes=["Sorcerer"])) == ["3"]
+    assert repo.shards_for(DeckOptions(schools=["Divination"])) == ["none"]
+    assert repo.shards_for(DeckOptions(levels=[1], search="fire")) == ["1", "3", "none"]
+
+    (tmp_path / "level_3.json").unlink()
+    assert [s["name"] for s in repo.load_spells_for(DeckOptions(levels=[1]))] == [
+        "Cure Wounds",
+        "Shield",
+    ]
+
+
+def test_fingerprint_depends_on_loaded_shards(tmp_path: Path):
+    repo = ShardedSpellRepository.compile(SPELLS, tmp_path)
+    repo.load_spells_for(DeckOptions(levels=[1]))
+    partial = repo.fingerprint()
+    repo.load_all_spells()
+    assert repo.fingerprint() != partial
+
+
+def test_recompile_removes_stale_shards(tmp_path: Path):
+    ShardedSpellRepository.compile(SPELLS, tmp_path)
+    ShardedSpellRepository.compile(SPELLS[:1], tmp_path)
+    assert sorted(p.name for p in tmp_path.glob("level_*.json")) == ["level_3.json"]
+
+
+def test_missing_manifest_raises(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        ShardedSpellRepository(tmp_path).load_all_spells()
+
+
+def test_descriptions_are_stored_in_one_blob(tmp_path: Path):
+    spells = [dict(s, desc=f"{s['name']} – effect.") for s in SPELLS]
+    spells[0]["desc"] = ["Listed", "parts"]
+    ShardedSpellRepository.compile(spells, tmp_path)
+
+    assert "desc" not in json.loads((tmp_path / "level_1.json").read_text())[0]
+    loaded = {s["name"]: s["desc"] for s in ShardedSpellRepository(tmp_path).load_all_spells()}
+    assert loaded == {s["name"]: s["desc"] for s in spells}
+
+
+def test_lazy_descriptions_read_only_what_is_used(tmp_path: Path, monkeypatch):
+    spells = [dict(s, desc=f"{s['name']} – effect.") for s in SPELLS]
+    ShardedSpellRepository.compile(spells, tmp_path)
+    repo = ShardedSpellRepository(tmp_path, lazy_descriptions=True)
+    reads = []
+    loaded = repo.load_spells_for(DeckOptions(levels=[1]))
+    original = repo._descriptions.read
+    monkeypatch.setattr(repo._descriptions, "read", lambda *a: reads.append(a) or original(*a))
+
+    assert isinstance(loaded[1]["desc"], LazyText)
+    card = SpellCard("Shield", 1, "Abjuration", [], loaded[1]["desc"], "1 round")
+    assert reads == []
+    assert card.description == "Shield – effect."
+    assert card.description == "Shield – effect."
+    assert len(reads) == 1
+    assert pickle.loads(pickle.dumps(SpellCard("X", 1, "", [], loaded[0]["desc"], ""))) == (
+        SpellCard("X", 1, "", [], "Cure Wounds – effect.", "")
+    )
+
+
+def test_reads_version_1_corpora_with_inline_descriptions(tmp_path: Path):
+    (tmp_path / "level_1.json").write_text(json.dumps([{"name": "Shield", "desc": "Inline."}]))
+    (tmp_path / "manifest.json").write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "fingerprint": "f",
+                "count": 1,
+                "shards": {"1": {"file": "level_1.json", "classes": [], "schools": []}},
+            }
+        )
+    )
+    assert ShardedSpellRepository(tmp_path).load_all_spells()[0]["desc"] == "Inline."
@@ -0,0 +1,29 @@
+import json
+
+from dmforge.infrastructure.cache.disk_cache import DiskCache
+from dmforge.interface.cli.cache import app
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+def test_stats_and_prune(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.put("art", "a", b"x" * 100)
+    cache.get("art", "a")
+
+    result = runner.invoke(app, ["stats", "--cache-dir", str(tmp_path), "--json"])
+    assert result.exit_code == 0, result.stderr
+    stats = json.loads(result.stdout)
+    assert stats["namespaces"]["art"]["hits"] == 1 and stats["bytes"] == 100
+
+    result = runner.invoke(app, ["prune", "--cache-dir", str(tmp_path), "--max-mb", "0"])
+    assert result.exit_code == 0, result.stderr
+    assert "Removed 1 entries" in result.stdout
+    assert DiskCache(tmp_path).stats()["entries"] == 0
+
+
+def test_prune_rejects_bad_namespace(tmp_path):
+    result = runner.invoke(app, ["prune", "--cache-dir", str(tmp_path), "--namespace", "A/B"])
+    assert result.exit_code == 1
+    assert "Invalid cache namespace" in result.stderr
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from dmforge.interface.cli.deck_art import app
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+def write_deck(path):
+    card = {
+        "name": "Fireball",
+        "level": 3,
+        "school": "Evocation",
+        "classes": ["Wizard"],
+        "description": "A bright streak flashes.",
+        "duration": "Instantaneous",
+        "art_path": None,
+    }
+    path.write_text(json.dumps({"name": "D", "version": "v1", "cards": [card, card]}))
+
+
+def test_art_generates_once_and_reuses_cache(tmp_path, image_api_stub):
+    deck_path = tmp_path / "deck.json"
+    write_deck(deck_path)
+    args = [
+        "--input",
+        str(deck_path),
+        "--output",
+        str(tmp_path / "out.json"),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--base-url",
+        image_api_stub.base_url,
+    ]
+
+    first = runner.invoke(app, args)
+    second = runner.invoke(app, args)
+
+    assert first.exit_code == 0, first.stderr
+    assert second.exit_code == 0
+    assert len(image_api_stub.prompts) == 1
+    cards = json.loads((tmp_path / "out.json").read_text())["cards"]
+    assert cards[0]["art_path"] == cards[1]["art_path"]
+    assert "(0 generated)" in second.stdout
+
+
+def test_art_requires_api_key_for_remote_endpoints(tmp_path, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    deck_path = tmp_path / "deck.json"
+    write_deck(deck_path)
+
+    result = runner.invoke(app, ["--input", str(deck_path)])
+
+    assert result.exit_code == 1
+    assert "OPENAI_API_KEY is not set" in result.stderr
+
+
+def test_art_paths_from_a_relative_cache_dir_are_absolute(tmp_path, monkeypatch, image_api_stub):
+    monkeypatch.chdir(tmp_path)
+    write_deck(tmp_path / "deck.json")
+
+    result = runner.invoke(app, ["--input", "deck.json", "--base-url", image_api_stub.base_url])
+
+    assert result.exit_code == 0, result.stderr
+    monkeypatch.chdir(tmp_path.parent)
+    art_path = Path(json.loads((tmp_path / "deck.json").read_text())["cards"][0]["art_path"])
+    assert art_path.is_absolute() and art_path.is_file()
@@ -64,3 +64,156 @@ def test_build_basic_deck(tmp_path):
     }
 
     assert generated == expected
+
+
+def test_build_with_cache_dir(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps([{"name": "Shield", "level": 1, "school": "Abjuration", "classes": ["Wizard"]}]),
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / "cache"
+
+    for run in range(2):
+        output_path = tmp_path / f"deck_{run}.json"
+        result = runner.invoke(
+            app,
+            [
+                "--spell-data",
+                str(spell_data),
+                "--output",
+                str(output_path),
+                "--cache-dir",
+                str(cache_dir),
+            ],
+        )
+        assert result.exit_code == 0
+        assert json.loads(output_path.read_text(encoding="utf-8"))["cards"][0]["name"] == "Shield"
+
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+def test_build_from_spell_directory(tmp_path):
+    source_dir = tmp_path / "spells"
+    source_dir.mkdir()
+    (source_dir / "srd.json").write_text(
+        json.dumps([{"name": "Shield", "level": 1, "classes": ["Wizard"]}]), encoding="utf-8"
+    )
+    (source_dir / "homebrew.json").write_text(
+        json.dumps([{"name": "Zap", "level": 1, "classes": ["Wizard"]}]), encoding="utf-8"
+    )
+    output_path = tmp_path / "deck.json"
+
+    result = runner.invoke(app, ["--spell-data", str(source_dir), "--output", str(output_path)])
+
+    assert result.exit_code == 0
+    cards = json.loads(output_path.read_text(encoding="utf-8"))["cards"]
+    assert [c["name"] for c in cards] == ["Zap", "Shield"]
+
+
+def test_build_from_empty_glob_reports_missing_data(tmp_path):
+    result = runner.invoke(
+        app, ["--spell-data", str(tmp_path / "*.json"), "--output", str(tmp_path / "d.json")]
+    )
+
+    assert result.exit_code == 1
+    assert "Spell data not found" in result.stderr
+
+
+def test_build_with_search(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps(
+            [
+                {"name": "Shield", "desc": "An invisible barrier."},
+                {"name": "Fire Bolt", "desc": "You hurl a mote of fire."},
+                {"name": "Sacred Flame", "desc": "Radiant flame descends."},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "deck.json"
+
+    result = runner.invoke(
+        app,
+        ["--spell-data", str(spell_data), "--output", str(output_path), "--search", "fire radiant"],
+    )
+
+    assert result.exit_code == 0
+    cards = json.loads(output_path.read_text(encoding="utf-8"))["cards"]
+    assert sorted(c["name"] for c in cards) == ["Fire Bolt", "Sacred Flame"]
+    assert (tmp_path / "spells.json.search.idx").exists()
+
+
+def test_build_with_spell_list(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps([{"name": "Shield"}, {"name": "Fire Bolt"}, {"name": "Light"}]),
+        encoding="utf-8",
+    )
+    spell_list = tmp_path / "picks.txt"
+    spell_list.write_text("# table picks\nLight\n\nfire bolt\n", encoding="utf-8")
+    output_path = tmp_path / "deck.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "--spell-data",
+            str(spell_data),
+            "--output",
+            str(output_path),
+            "--spell-list",
+            str(spell_list),
+            "--spell",
+            "Sheild",
+        ],
+    )
+
+    assert result.exit_code == 0
+    cards = json.loads(output_path.read_text(encoding="utf-8"))["cards"]
+    assert [c["name"] for c in cards] == ["Shield", "Light", "Fire Bolt"]
+
+
+def test_build_with_unknown_spell_fails(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(json.dumps([{"name": "Shield"}]), encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["--spell-data", str(spell_data), "--output", str(tmp_path / "d.json"), "--spell", "Wish"],
+    )
+
+    assert result.exit_code == 1
+    assert "Unknown spell names: Wish" in result.stderr
+
+
+def test_build_with_sort_and_limit(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps([{"name": n, "level": lvl} for n, lvl in [("C", 2), ("A", 3), ("B", 1)]]),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "deck.json"
+
+    result = runner.invoke(
+        app,
+        ["--spell-data", str(spell_data), "--output", str(output_path)]
+        + ["--sort", "-level", "--limit", "2"],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    cards = json.loads(output_path.read_text(encoding="utf-8"))["cards"]
+    assert [c["name"] for c in cards] == ["A", "C"]
+
+
+def test_build_rejects_unknown_sort(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(json.dumps([{"name": "A"}]), encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["--spell-data", str(spell_data), "--output", str(tmp_path / "d.json"), "--sort", "x"],
+    )
+
+    assert result.exit_code == 1
+    assert "Unknown sort key" in result.stderr
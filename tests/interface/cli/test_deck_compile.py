@@ -0,0 +1,57 @@
+import json
+
+from dmforge.interface.cli.deck_build import app as build_app
+from dmforge.interface.cli.deck_compile import app
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+def test_compile_then_build_from_shards(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps(
+            [
+                {"name": "Shield", "level": 1, "classes": ["Wizard"]},
+                {"name": "Fireball", "level": 3, "classes": ["Wizard"]},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    compiled = tmp_path / "compiled"
+
+    result = runner.invoke(app, ["--spell-data", str(spell_data), "--output", str(compiled)])
+    assert result.exit_code == 0
+    assert "Compiled 2 spells into 2 shards" in result.stdout
+
+    output = tmp_path / "deck.json"
+    result = runner.invoke(
+        build_app, ["--spell-data", str(compiled), "--output", str(output), "--level", "3"]
+    )
+    assert result.exit_code == 0
+    assert [c["name"] for c in json.loads(output.read_text())["cards"]] == ["Fireball"]
+
+
+def test_build_with_lazy_descriptions(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps(
+            [
+                {"name": "Shield", "level": 1, "desc": "+5 AC."},
+                {"name": "Fireball", "level": 3, "desc": "A bright streak… then flame."},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    compiled = tmp_path / "compiled"
+    runner.invoke(app, ["--spell-data", str(spell_data), "--output", str(compiled)])
+
+    output = tmp_path / "deck.json"
+    result = runner.invoke(
+        build_app,
+        ["--spell-data", str(compiled), "--output", str(output), "--lazy-descriptions"],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    cards = json.loads(output.read_text(encoding="utf-8"))["cards"]
+    assert [c["description"] for c in cards] == ["+5 AC.", "A bright streak… then flame."]
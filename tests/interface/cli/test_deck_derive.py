@@ -0,0 +1,78 @@
+import json
+
+from dmforge.interface.cli.deck_derive import app
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+def write_deck(path, names):
+    cards = [
+        {
+            "name": name,
+            "level": level,
+            "school": "Evocation",
+            "classes": ["Wizard"],
+            "description": f"{name}.",
+            "duration": "Instantaneous",
+            "art_path": None,
+        }
+        for level, name in enumerate(names)
+    ]
+    path.write_text(json.dumps({"name": path.stem, "version": "v1", "cards": cards}))
+
+
+def names(path):
+    return [c["name"] for c in json.loads(path.read_text())["cards"]]
+
+
+def test_derive_single_deck(tmp_path):
+    master, printed = tmp_path / "master.json", tmp_path / "printed.json"
+    write_deck(master, ["A", "B", "C", "D"])
+    write_deck(printed, ["A", "B"])
+    output = tmp_path / "out.json"
+
+    result = runner.invoke(
+        app,
+        [
+            "--input",
+            str(master),
+            "--minus",
+            str(printed),
+            "--output",
+            str(output),
+            "--sort",
+            "-level",
+        ],
+    )
+    assert result.exit_code == 0, result.stderr
+    assert names(output) == ["D", "C"]
+
+
+def test_derive_batch_from_spec(tmp_path):
+    master = tmp_path / "master.json"
+    write_deck(master, ["A", "B", "C", "D"])
+    spec = tmp_path / "spec.json"
+    spec.write_text(
+        json.dumps(
+            [
+                {"output": str(tmp_path / "first.json"), "limit": 2},
+                {"output": str(tmp_path / "rest.json"), "offset": 2, "name": "Rest"},
+            ]
+        )
+    )
+
+    result = runner.invoke(app, ["--input", str(master), "--spec", str(spec)])
+    assert result.exit_code == 0, result.stderr
+    assert "Derived 2 decks" in result.stdout
+    assert names(tmp_path / "first.json") == ["A", "B"]
+    assert names(tmp_path / "rest.json") == ["C", "D"]
+
+
+def test_derive_rejects_bad_sort(tmp_path):
+    master = tmp_path / "master.json"
+    write_deck(master, ["A"])
+    result = runner.invoke(
+        app, ["--input", str(master), "--sort", "power", "--output", str(tmp_path / "o.json")]
+    )
+    assert result.exit_code == 1
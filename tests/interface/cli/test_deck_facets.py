@@ -0,0 +1,28 @@
+import json
+
+from dmforge.interface.cli.deck_facets import app
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+def test_facets_prints_counts(tmp_path):
+    spell_data = tmp_path / "spells.json"
+    spell_data.write_text(
+        json.dumps(
+            [
+                {"name": "Shield", "level": 1, "school": "Abjuration", "classes": ["Wizard"]},
+                {"name": "Bless", "level": 1, "school": "Enchantment", "classes": ["Cleric"]},
+                {"name": "Fireball", "level": 3, "school": "Evocation", "classes": ["Wizard"]},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["--spell-data", str(spell_data), "--class", "Wizard"])
+
+    assert result.exit_code == 0
+    counts = json.loads(result.stdout)
+    assert counts["total"] == 2
+    assert counts["classes"] == {"Cleric": 1, "Wizard": 2}
+    assert counts["levels"] == {"1": 1, "3": 1}
@@ -0,0 +1,81 @@
+import json
+
+from dmforge.interface.cli.deck_build import app as build_app
+from dmforge.interface.cli.deck_rebuild import app
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+def write_spells(path, shield_desc):
+    spells = [
+        {"name": "Fireball", "level": 3, "classes": ["Wizard"], "desc": "Boom."},
+        {"name": "Shield", "level": 1, "classes": ["Wizard"], "desc": shield_desc},
+        {"name": "Bless", "level": 1, "classes": ["Cleric"], "desc": "Blessed."},
+    ]
+    path.write_text(json.dumps(spells), encoding="utf-8")
+
+
+def test_rebuild_rewrites_affected_decks(tmp_path):
+    spell_data, ledger = tmp_path / "spells.json", tmp_path / "ledger.json"
+    write_spells(spell_data, "+5 AC.")
+    for cls in ("Wizard", "Cleric"):
+        result = runner.invoke(
+            build_app,
+            [
+                "--spell-data",
+                str(spell_data),
+                "--class",
+                cls,
+                "--output",
+                str(tmp_path / f"{cls}.json"),
+                "--ledger",
+                str(ledger),
+            ],
+        )
+        assert result.exit_code == 0, result.stderr
+    cleric_before = (tmp_path / "Cleric.json").stat().st_mtime_ns
+
+    write_spells(spell_data, "Errata: +4 AC.")
+    result = runner.invoke(app, ["--ledger", str(ledger), "--json"])
+
+    assert result.exit_code == 0, result.stderr
+    report = json.loads(result.stdout)
+    assert report["decks"] == 2 and report["patched"] == 1
+    assert report["rewritten"] == [str(tmp_path / "Wizard.json")]
+    cards = json.loads((tmp_path / "Wizard.json").read_text())["cards"]
+    assert cards[1]["description"] == "Errata: +4 AC."
+    assert (tmp_path / "Cleric.json").stat().st_mtime_ns == cleric_before
+
+
+def test_rebuild_missing_ledger(tmp_path):
+    result = runner.invoke(app, ["--ledger", str(tmp_path / "none.json")])
+    assert result.exit_code == 1
+    assert "Build ledger not found" in result.stderr
+
+
+def test_build_with_ledger_loads_the_corpus_once(tmp_path, monkeypatch):
+    from dmforge.infrastructure.repository.json_spell_repository import JSONSpellRepository
+
+    spell_data, ledger = tmp_path / "spells.json", tmp_path / "ledger.json"
+    write_spells(spell_data, "+5 AC.")
+    loads = []
+    load_all_spells = JSONSpellRepository.load_all_spells
+
+    def counting(self):
+        loads.append(self)
+        return load_all_spells(self)
+
+    monkeypatch.setattr(JSONSpellRepository, "load_all_spells", counting)
+    result = runner.invoke(
+        build_app,
+        ["--spell-data", str(spell_data), "--output", str(tmp_path / "d.json")]
+        + ["--class", "Wizard", "--ledger", str(ledger)],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert len(loads) == 1
+    assert [c["name"] for c in json.loads((tmp_path / "d.json").read_text())["cards"]] == [
+        "Fireball",
+        "Shield",
+    ]
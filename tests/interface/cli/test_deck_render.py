@@ -1,8 +1,10 @@
 import json
+import re
 import shutil
 from pathlib import Path
 
 import pytest
+from dmforge.interface.cli.deck_art import app as art_app
 from dmforge.interface.cli.deck_render import app
 from typer.testing import CliRunner
 
@@ -425,6 +427,20 @@ class TestCLI:
         error_text = result.stdout + result.stderr + (result.output or "")
         assert "Validation failed" in error_text or "failed" in error_text.lower()
 
+    def test_validate_directory_outputs_json_summary(self, tmp_path):
+        """Test bulk validation over a directory."""
+        create_test_deck_file(tmp_path / "good.json")
+        (tmp_path / "bad.json").write_text('{"name": "Bad", "cards": [1]}', encoding="utf-8")
+
+        result = runner.invoke(app, ["validate", "--dir", str(tmp_path), "--workers", "1"])
+
+        assert result.exit_code == 1
+        summary = json.loads(result.stdout)
+        assert summary["files"] == 2
+        assert summary["valid"] == 1
+        bad = next(r for r in summary["results"] if r["path"].endswith("bad.json"))
+        assert {e["field"] for e in bad["errors"]} == {"version", "cards[0]"}
+
     def test_pdf_dependency_check(self):
         """Test PDF dependency checking."""
         from dmforge.application.services.weasy_renderer import WeasyRenderer
@@ -438,6 +454,178 @@ class TestCLI:
 
         print("PDF Dependencies:", status)
 
+    def test_render_html_with_a_copied_deck_template_only(self, tmp_path):
+        """A template dir holding only deck.html.j2 falls back to the bundled partials."""
+        input_path = tmp_path / "deck.json"
+        output_path = tmp_path / "output.html"
+        template_dir = tmp_path / "templates"
+        create_test_deck_file(input_path)
+        copy_template_to(template_dir)
+
+        result = runner.invoke(
+            app,
+            [
+                "render",
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--format",
+                "html",
+                "--template-dir",
+                str(template_dir),
+            ],
+        )
+
+        assert result.exit_code == 0, result.stderr
+        assert "Magic Missile" in output_path.read_text(encoding="utf-8")
+
+    def test_render_art_generated_into_a_relative_cache_dir(
+        self, tmp_path, monkeypatch, image_api_stub
+    ):
+        template_dir = Path("src/dmforge/resources/templates").resolve()
+        monkeypatch.chdir(tmp_path)
+        create_test_deck_file(tmp_path / "deck.json")
+        art = runner.invoke(
+            art_app, ["--input", "deck.json", "--base-url", image_api_stub.base_url]
+        )
+        assert art.exit_code == 0, art.stderr
+        monkeypatch.chdir(tmp_path.parent)
+
+        result = runner.invoke(
+            app,
+            [
+                "render",
+                "--input",
+                str(tmp_path / "deck.json"),
+                "--output",
+                str(tmp_path / "output.html"),
+                "--format",
+                "html",
+                "--template-dir",
+                str(template_dir),
+            ],
+        )
+
+        assert result.exit_code == 0, result.stderr
+        sources = re.findall(r'<img src="([^"]+)"', (tmp_path / "output.html").read_text())
+        assert len(sources) == 2
+        assert all(Path(src).is_absolute() and Path(src).is_file() for src in sources)
+
+    def test_render_html_pages_under_a_timeout(self, tmp_path):
+        input_path = tmp_path / "deck.json"
+        output_dir = tmp_path / "site"
+        create_test_deck_file(input_path)
+
+        result = runner.invoke(
+            app,
+            [
+                "render",
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_dir),
+                "--format",
+                "html",
+                "--html-pages",
+                "1",
+                "--timeout",
+                "60",
+            ],
+        )
+
+        assert result.exit_code == 0, result.stderr
+        assert "Rendered 2 HTML pages and index" in result.stdout
+        assert (output_dir / "index.html").is_file()
+
+    def test_render_split_pages_writes_one_pdf_per_group(self, tmp_path):
+        input_path = tmp_path / "deck.json"
+        card = {
+            "name": "Shield",
+            "level": 1,
+            "school": "Abjuration",
+            "classes": ["Wizard"],
+            "description": "An invisible barrier of magical force appears.",
+            "duration": "1 round",
+        }
+        input_path.write_text(json.dumps({"name": "Big", "version": "v1", "cards": [card] * 20}))
+        output_path = tmp_path / "sheets.pdf"
+
+        result = runner.invoke(
+            app,
+            [
+                "render",
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--split-pages",
+                "2",
+            ],
+        )
+
+        assert result.exit_code == 0, result.stderr
+        # 20 cards at 6-up are 4 sheets: two files of two sheets
+        assert sorted(p.name for p in tmp_path.glob("sheets_*.pdf")) == [
+            "sheets_001-002.pdf",
+            "sheets_003-004.pdf",
+        ]
+
+    def test_render_pack_puts_small_decks_on_shared_sheets(self, tmp_path):
+        card = {
+            "name": "Shield",
+            "level": 1,
+            "school": "Abjuration",
+            "classes": ["Wizard"],
+            "description": "An invisible barrier of magical force appears.",
+            "duration": "1 round",
+        }
+        args = []
+        for name, count in (("A", 4), ("B", 2), ("C", 3)):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps({"name": name, "version": "v1", "cards": [card] * count}))
+            args += ["--pack", str(path)]
+        output_path = tmp_path / "packed.html"
+
+        result = runner.invoke(
+            app,
+            ["render", "--format", "html", "--output", str(output_path), "--art-dpi", "0"] + args,
+        )
+
+        assert result.exit_code == 0, result.stderr
+        assert "Packed 3 decks onto 2 sheets" in result.stdout
+        html = output_path.read_text()
+        assert html.count('class="page"') == 2
+        assert html.count('<span class="deck-mark">C</span>') == 3
+
+    def test_render_pack_rejects_a_template_that_ignores_pages(self, tmp_path):
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "deck.html.j2").write_text(
+            "{% for card in deck.cards %}{{ card.name }}{% endfor %}"
+        )
+        deck_path = tmp_path / "A.json"
+        deck_path.write_text(json.dumps({"name": "A", "version": "v1", "cards": []}))
+
+        result = runner.invoke(
+            app,
+            [
+                "render",
+                "--format",
+                "html",
+                "--output",
+                str(tmp_path / "packed.html"),
+                "--template-dir",
+                str(template_dir),
+                "--pack",
+                str(deck_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "does not use `pages`" in result.stderr
+        assert not (tmp_path / "packed.html").exists()
+
 
 if __name__ == "__main__":
     # Allow running individual tests
@@ -0,0 +1,82 @@
+import json
+
+from dmforge.interface.cli import render_queue
+from typer.testing import CliRunner
+
+runner = CliRunner(mix_stderr=False)
+
+
+class FakeController:
+    def render_from_file(self, input_path, fmt, output_path):
+        output_path.write_text(f"{fmt}:{input_path.name}")
+
+
+def test_enqueue_work_and_fetch_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_queue, "make_controller", lambda params, **limits: FakeController())
+    queue = str(tmp_path / "q.db")
+    decks = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps({"name": name, "version": "v1", "cards": []}))
+        decks += ["--input", str(path)]
+    out_dir = tmp_path / "out"
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(render_queue.app, ["enqueue", *decks, "--queue", queue])
+    assert result.exit_code == 0, result.stderr
+    jobs = json.loads(result.stdout)
+    assert [j["status"] for j in jobs] == ["queued", "queued"]
+
+    result = runner.invoke(render_queue.app, ["enqueue", *decks[:2], "--queue", queue])
+    assert json.loads(result.stdout)[0]["deduped"] is True
+
+    result = runner.invoke(
+        render_queue.app, ["result", "--job", str(jobs[0]["id"]), "--queue", queue]
+    )
+    assert result.exit_code == 1
+    assert "is queued" in result.stderr
+
+    result = runner.invoke(
+        render_queue.app, ["worker", "--drain", "--poll-interval", "0", "--queue", queue]
+    )
+    assert result.exit_code == 0, result.stderr
+
+    result = runner.invoke(render_queue.app, ["status", "--queue", queue])
+    assert json.loads(result.stdout)["done"] == 2
+
+    result = runner.invoke(
+        render_queue.app, ["result", "--job", str(jobs[1]["id"]), "--queue", queue]
+    )
+    assert result.exit_code == 0
+    assert (tmp_path / result.stdout.strip()).read_text() == "pdf:b.json"
+    assert not out_dir.exists()
+
+
+def test_enqueue_rejects_output_with_many_inputs(tmp_path):
+    deck = tmp_path / "a.json"
+    deck.write_text("{}")
+    result = runner.invoke(
+        render_queue.app,
+        [
+            "enqueue",
+            "--input",
+            str(deck),
+            "--input",
+            str(deck),
+            "--output",
+            "x.pdf",
+            "--queue",
+            str(tmp_path / "q.db"),
+        ],
+    )
+    assert result.exit_code == 1
+
+
+def test_worker_rejects_a_zero_timeout(tmp_path):
+    result = runner.invoke(
+        render_queue.app, ["worker", "--timeout", "0", "--queue", str(tmp_path / "q.db")]
+    )
+
+    assert result.exit_code == 1
+    assert "timeout must be positive" in result.stderr
+    assert not (tmp_path / "q.db").exists()